@@ -0,0 +1,699 @@
+"""
+K-Means Clustering Engine
+=========================
+
+From-scratch K-Means on NumPy with two interchangeable algorithms:
+
+- 'lloyd': the classic algorithm; every iteration computes the distance from
+  every point to every centroid.
+- 'hamerly': keeps an upper bound on each point's distance to its own
+  centroid and one lower bound, on the distance to the second closest
+  centroid. Points whose upper bound is below it keep their centroid without
+  any distance computation. Needs only O(n_samples) memory.
+
+Both produce the same clustering from the same initial centroids; Hamerly
+just skips most of the distance computations once the centroids start to
+settle, and is the default.
+
+There is no Elkan variant (one lower bound per point and centroid). It
+computes the fewest distances, but checking its n x k bounds takes several
+NumPy passes over an n x k array every iteration, while Lloyd's full
+distance pass is a single matrix product per block. Even when the bounds
+were only read for points that Hamerly's test cannot settle, it ran about
+twice as long as Lloyd on 300,000 x 5 points with k=16.
+
+KMeans mirrors the parts of sklearn.cluster.KMeans used in this folder (fit,
+fit_predict, predict, cluster_centers_, labels_, inertia_, n_iter_), so it
+can stand in for it.
+
+For data larger than memory, MiniBatchKMeans streams a CSV file in batches,
+standardising it with a StreamingScaler fitted batch by batch and updating
+the centroids after every batch.
+
+Usage:
+    from kmeans import KMeans, MiniBatchKMeans
+    
+    model = KMeans(n_clusters=5, algorithm='hamerly', random_state=42)
+    labels = model.fit_predict(X_scaled)
+    model.inertia_, model.n_distances_
+    
+    model = MiniBatchKMeans(n_clusters=5, batch_size=100_000).fit_csv("customers.csv", features)
+    model.scaler_.inverse_transform(model.cluster_centers_)
+
+Author: GitHub Copilot
+Date: July 27, 2025
+"""
+
+import math
+
+import numpy as np
+
+
+ALGORITHMS = ('lloyd', 'hamerly')
+
+# Rows per block when computing full distance matrices, to bound memory
+_CHUNK_ROWS = 1 << 15
+
+
+def _squared_distances(block, centers, center_norms):
+    """
+    Squared Euclidean distances from every row of block to every center.
+    
+    Uses |x|^2 - 2 x.c + |c|^2 so that the bulk of the work is one matrix
+    product; fit() centers the data first to keep the rounding error of the
+    expansion small.
+    """
+    squared = block @ centers.T
+    squared *= -2
+    squared += np.einsum('ij,ij->i', block, block)[:, None]
+    squared += center_norms
+    return np.maximum(squared, 0, out=squared)
+
+
+def _blocks(X, centers):
+    """Yield (start, squared distances) for consecutive blocks of rows of X."""
+    center_norms = np.einsum('ij,ij->i', centers, centers)
+    for start in range(0, len(X), _CHUNK_ROWS):
+        yield start, _squared_distances(X[start:start + _CHUNK_ROWS], centers, center_norms)
+
+
+def _distances(X, centers, squared=False):
+    """Euclidean (or squared Euclidean) distances from every row of X to every center."""
+    distances = np.empty((len(X), len(centers)))
+    for start, block in _blocks(X, centers):
+        distances[start:start + len(block)] = block if squared else np.sqrt(block)
+    return distances
+
+
+def _nearest(X, centers, second=False):
+    """
+    Closest center of every row of X, without storing all the distances.
+    
+    Returns:
+        tuple: labels and the distance to the closest center, plus the
+            distance to the second closest one (inf with a single center) if
+            second is True
+    """
+    labels = np.empty(len(X), dtype=np.intp)
+    nearest = np.empty(len(X))
+    runner_up = np.full(len(X), np.inf) if second else None
+    for start, squared in _blocks(X, centers):
+        rows = slice(start, start + len(squared))
+        labels[rows] = squared.argmin(axis=1)
+        nearest[rows] = squared[np.arange(len(squared)), labels[rows]]
+        if second and len(centers) > 1:
+            runner_up[rows] = np.partition(squared, 1, axis=1)[:, 1]
+    if second:
+        return labels, np.sqrt(nearest), np.sqrt(runner_up)
+    return labels, np.sqrt(nearest)
+
+
+def _paired_distances(X, centers):
+    """Euclidean distance from X[i] to centers[i] for every i."""
+    difference = X - centers
+    return np.sqrt(np.einsum('ij,ij->i', difference, difference))
+
+
+def _cluster_sums(X, labels, n_clusters):
+    """Sum of the points in each cluster, and the number of points."""
+    n_features = X.shape[1]
+    sizes = np.bincount(labels, minlength=n_clusters)
+    
+    # One bincount per block over (cluster, feature) cells, reading X in order
+    sums = np.zeros(n_clusters * n_features)
+    features = np.arange(n_features)
+    for start in range(0, len(X), _CHUNK_ROWS):
+        cells = labels[start:start + _CHUNK_ROWS, None] * n_features + features
+        sums += np.bincount(cells.ravel(), weights=X[start:start + _CHUNK_ROWS].ravel(),
+                            minlength=sums.size)
+    return sums.reshape(n_clusters, n_features), sizes
+
+
+def _update_centers(X, labels, centers):
+    """Mean of each cluster; an empty cluster keeps its previous center."""
+    new_centers, sizes = _cluster_sums(X, labels, len(centers))
+    empty = sizes == 0
+    new_centers[~empty] /= sizes[~empty, None]
+    new_centers[empty] = centers[empty]
+    return new_centers
+
+
+def _half_nearest_center_distances(centers):
+    """Half the distance from every center to the nearest other one."""
+    half = 0.5 * _distances(centers, centers)
+    np.fill_diagonal(half, np.inf)
+    return half.min(axis=1)
+
+
+def _lloyd(X, centers, max_iter, tol):
+    """Lloyd iterations: full assignment step every time."""
+    labels, _ = _nearest(X, centers)
+    n_distances = labels.size * len(centers)
+    
+    for iteration in range(1, max_iter + 1):
+        new_centers = _update_centers(X, labels, centers)
+        shift = ((new_centers - centers) ** 2).sum()
+        centers = new_centers
+        if shift <= tol:
+            return centers, labels, iteration, n_distances, False
+        
+        new_labels, _ = _nearest(X, centers)
+        n_distances += labels.size * len(centers)
+        if np.array_equal(new_labels, labels):
+            return centers, labels, iteration, n_distances, True
+        labels = new_labels
+    return centers, labels, max_iter, n_distances, False
+
+
+def _hamerly(X, centers, max_iter, tol):
+    """Hamerly iterations: one upper and one lower bound per point."""
+    labels, upper, lower = _nearest(X, centers, second=True)
+    n_distances = labels.size * len(centers)
+    
+    for iteration in range(1, max_iter + 1):
+        new_centers = _update_centers(X, labels, centers)
+        movement = np.sqrt(((new_centers - centers) ** 2).sum(axis=1))
+        centers = new_centers
+        if (movement ** 2).sum() <= tol:
+            return centers, labels, iteration, n_distances, False
+        
+        # The second closest center moved at most as far as the furthest
+        # mover other than the point's own center
+        upper += movement[labels]
+        if len(centers) > 1:
+            furthest = movement.argmax()
+            second = np.partition(movement, -2)[-2]
+            lower -= np.where(labels == furthest, second, movement[furthest])
+        
+        nearest = _half_nearest_center_distances(centers)
+        bound = np.maximum(nearest[labels], lower)
+        points = np.flatnonzero(upper > bound)
+        upper[points] = _paired_distances(X[points], centers[labels[points]])
+        n_distances += len(points)
+        points = points[upper[points] > bound[points]]
+        if len(points) == 0:
+            return centers, labels, iteration, n_distances, True
+        
+        new_labels, nearest_distances, second_distances = _nearest(X[points], centers, second=True)
+        n_distances += len(points) * len(centers)
+        if np.array_equal(new_labels, labels[points]):
+            return centers, labels, iteration, n_distances, True
+        labels[points] = new_labels
+        upper[points] = nearest_distances
+        lower[points] = second_distances
+    return centers, labels, max_iter, n_distances, False
+
+
+_RUNNERS = {'lloyd': _lloyd, 'hamerly': _hamerly}
+
+
+def kmeans_plusplus(X, n_clusters, rng):
+    """
+    Choose initial centers with greedy k-means++.
+    
+    Each new center is the best, by resulting inertia, of 2 + log(k)
+    candidates sampled with probability proportional to their squared
+    distance from the centers chosen so far (as in scikit-learn).
+    
+    Args:
+        X (np.ndarray): Data, shape (n_samples, n_features)
+        n_clusters (int): Number of centers
+        rng (np.random.Generator): Random generator
+    
+    Returns:
+        np.ndarray: Initial centers, shape (n_clusters, n_features)
+    """
+    n_samples = len(X)
+    n_trials = 2 + int(math.log(n_clusters))
+    centers = np.empty((n_clusters, X.shape[1]))
+    centers[0] = X[rng.integers(n_samples)]
+    closest = _distances(X, centers[:1], squared=True)[:, 0]
+    
+    for index in range(1, n_clusters):
+        cumulative = np.cumsum(closest)
+        draws = rng.random(n_trials) * cumulative[-1]
+        candidates = np.minimum(np.searchsorted(cumulative, draws), n_samples - 1)
+        trial_closest = np.minimum(closest, _distances(X, X[candidates], squared=True).T)
+        best = trial_closest.sum(axis=1).argmin()
+        centers[index] = X[candidates[best]]
+        closest = trial_closest[best]
+    return centers
+
+
+class KMeans:
+    """
+    K-Means clustering with Lloyd or Hamerly iterations.
+    
+    Args:
+        n_clusters (int): Number of clusters (default: 8)
+        algorithm (str): 'lloyd' or 'hamerly' (default: 'hamerly')
+        init: 'k-means++', 'random' (k distinct points) or an array of
+            initial centers (default: 'k-means++')
+        n_init (int): Runs from different initial centers; the one with the
+            lowest inertia is kept (default: 10, 1 for an explicit init)
+        max_iter (int): Iteration limit per run (default: 300)
+        tol (float): Stop when the squared centroid movement falls below
+            tol times the mean feature variance (default: 1e-4)
+        random_state: Seed or np.random.Generator (default: None)
+    
+    Raises:
+        ValueError: If algorithm is unknown or n_clusters or max_iter is not
+            positive
+    
+    Attributes:
+        cluster_centers_ (np.ndarray): Centers, shape (n_clusters, n_features)
+        labels_ (np.ndarray): Cluster of every training point
+        inertia_ (float): Sum of squared distances to the closest center
+        n_iter_ (int): Iterations of the best run
+        n_distances_ (int): Point-centroid distances computed by the best run
+    
+    Examples:
+        >>> X = np.array([[1.0, 1.0], [1.5, 2.0], [8.0, 8.0], [9.0, 8.5]])
+        >>> model = KMeans(n_clusters=2, random_state=0).fit(X)
+        >>> sorted(np.bincount(model.labels_).tolist()), round(model.inertia_, 6)
+        ([2, 2], 1.25)
+    """
+    
+    def __init__(self, n_clusters=8, algorithm='hamerly', init='k-means++', n_init=None,
+                 max_iter=300, tol=1e-4, random_state=None):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm '{algorithm}'. Choose from {ALGORITHMS}")
+        if n_clusters < 1 or max_iter < 1:
+            raise ValueError("n_clusters and max_iter must be positive")
+        self.n_clusters = n_clusters
+        self.algorithm = algorithm
+        self.init = init
+        self.n_init = n_init
+        self.max_iter = max_iter
+        self.tol = tol
+        self.random_state = random_state
+    
+    def __repr__(self):
+        return f"KMeans(n_clusters={self.n_clusters}, algorithm={self.algorithm!r})"
+    
+    def _initial_centers(self, X, rng, mean):
+        """Initial centers for one run, on the data centered by mean."""
+        if isinstance(self.init, str):
+            if self.init == 'k-means++':
+                return kmeans_plusplus(X, self.n_clusters, rng)
+            if self.init == 'random':
+                return X[rng.choice(len(X), self.n_clusters, replace=False)].copy()
+            raise ValueError(f"Unknown init '{self.init}'")
+        centers = np.array(self.init, dtype=float)
+        if centers.shape != (self.n_clusters, X.shape[1]):
+            raise ValueError(f"init must have shape ({self.n_clusters}, {X.shape[1]})")
+        return centers - mean
+    
+    def fit(self, X):
+        """
+        Cluster the data.
+        
+        Args:
+            X: Array-like or DataFrame of shape (n_samples, n_features)
+        
+        Returns:
+            KMeans: self
+        
+        Raises:
+            ValueError: If there are fewer samples than clusters
+        """
+        X = np.asarray(X, dtype=float)
+        if X.ndim != 2 or len(X) < self.n_clusters:
+            raise ValueError(f"Need a 2-D array with at least {self.n_clusters} samples")
+        
+        # Centering makes the distance expansion in _distances accurate
+        mean = X.mean(axis=0)
+        X = X - mean
+        rng = np.random.default_rng(self.random_state)
+        n_init = self.n_init or (10 if isinstance(self.init, str) else 1)
+        tol = self.tol * X.var(axis=0).mean()
+        runner = _RUNNERS[self.algorithm]
+        
+        best = None
+        for _ in range(n_init):
+            centers, labels, n_iter, n_distances, converged = runner(
+                X, self._initial_centers(X, rng, mean), self.max_iter, tol)
+            if not converged:
+                # Stopped on tol or max_iter: match the labels to the final centers
+                labels, _ = _nearest(X, centers)
+                n_distances += labels.size * self.n_clusters
+            inertia = float((_paired_distances(X, centers[labels]) ** 2).sum())
+            if best is None or inertia < best[0]:
+                best = (inertia, centers, labels, n_iter, n_distances)
+        
+        self.inertia_, centers, self.labels_, self.n_iter_, self.n_distances_ = best
+        self.cluster_centers_ = centers + mean
+        return self
+    
+    def predict(self, X):
+        """
+        Closest cluster for each point.
+        
+        Args:
+            X: Array-like of shape (n_samples, n_features)
+        
+        Returns:
+            np.ndarray: Cluster labels
+        """
+        return _nearest(np.asarray(X, dtype=float), self.cluster_centers_)[0]
+    
+    def fit_predict(self, X):
+        """
+        Cluster the data and return the training labels.
+        
+        Args:
+            X: Array-like of shape (n_samples, n_features)
+        
+        Returns:
+            np.ndarray: Cluster labels
+        """
+        return self.fit(X).labels_
+
+
+class StreamingScaler:
+    """
+    Standardise features with statistics accumulated batch by batch.
+    
+    Like sklearn.preprocessing.StandardScaler.partial_fit: each batch
+    updates the running mean and variance (merged with Chan's parallel
+    formula, which stays accurate over hundreds of millions of rows), so the
+    data never has to be in memory at once.
+    
+    Attributes:
+        mean_ (np.ndarray): Mean of each feature
+        var_ (np.ndarray): Population variance of each feature
+        scale_ (np.ndarray): Standard deviation, 1.0 for constant features
+        n_samples_seen_ (int): Rows seen so far
+    
+    Examples:
+        >>> scaler = StreamingScaler()
+        >>> _ = scaler.partial_fit(np.array([[1.0], [2.0]])).partial_fit(np.array([[3.0], [4.0]]))
+        >>> scaler.mean_.tolist(), scaler.var_.tolist()
+        ([2.5], [1.25])
+    """
+    
+    def __init__(self):
+        self.mean_ = None
+        self.var_ = None
+        self.scale_ = None
+        self.n_samples_seen_ = 0
+        self._squares = None
+    
+    def partial_fit(self, X):
+        """
+        Update the statistics with a batch of rows.
+        
+        Args:
+            X: Array-like of shape (n_samples, n_features)
+        
+        Returns:
+            StreamingScaler: self
+        """
+        X = np.asarray(X, dtype=float)
+        if len(X) == 0:
+            return self
+        batch_mean = X.mean(axis=0)
+        batch_squares = ((X - batch_mean) ** 2).sum(axis=0)
+        
+        if self.n_samples_seen_ == 0:
+            self.mean_, self._squares = batch_mean, batch_squares
+        else:
+            seen, total = self.n_samples_seen_, self.n_samples_seen_ + len(X)
+            delta = batch_mean - self.mean_
+            self.mean_ = self.mean_ + delta * len(X) / total
+            self._squares = self._squares + batch_squares + delta ** 2 * seen * len(X) / total
+        self.n_samples_seen_ += len(X)
+        
+        self.var_ = self._squares / self.n_samples_seen_
+        self.scale_ = np.sqrt(self.var_)
+        self.scale_[self.scale_ == 0] = 1.0
+        return self
+    
+    def fit(self, X):
+        """Compute the statistics of X, forgetting earlier batches."""
+        self.__init__()
+        return self.partial_fit(X)
+    
+    def transform(self, X):
+        """Standardise rows: (X - mean_) / scale_."""
+        return (np.asarray(X, dtype=float) - self.mean_) / self.scale_
+    
+    def inverse_transform(self, X):
+        """Map standardised rows (e.g. cluster centers) back to the original units."""
+        return np.asarray(X, dtype=float) * self.scale_ + self.mean_
+
+
+def iter_csv_batches(path, columns, batch_size, **read_csv_options):
+    """
+    Read selected columns of a CSV file in batches of rows.
+    
+    Args:
+        path (str): CSV file
+        columns (list): Column names to read, in the order of the features
+        batch_size (int): Rows per batch
+        **read_csv_options: Passed to pandas.read_csv, e.g. converters to
+            encode a categorical column
+    
+    Yields:
+        np.ndarray: Batch of shape (at most batch_size, len(columns))
+    """
+    import pandas as pd
+    
+    for chunk in pd.read_csv(path, usecols=columns, chunksize=batch_size, **read_csv_options):
+        yield chunk[columns].to_numpy(dtype=float)
+
+
+class MiniBatchKMeans:
+    """
+    Mini-batch K-Means for data that does not fit in memory.
+    
+    Each batch moves every centroid towards the mean of the batch points
+    assigned to it, with a per-centroid learning rate of 1 / (points seen by
+    that centroid), so a centroid is always the running mean of every point
+    it has been given (Sculley, 2010). Memory use is bounded by the batch
+    size, whatever the size of the dataset.
+    
+    fit_csv() streams a CSV file: a first pass fits a StreamingScaler, then
+    each epoch re-reads the file in batches, standardises them and updates
+    the centroids. The first init_size rows of the first epoch seed the
+    centroids with k-means++.
+    
+    Args:
+        n_clusters (int): Number of clusters (default: 8)
+        batch_size (int): Rows per update (default: 1024)
+        max_epochs (int): Passes over the data (default: 10)
+        tol (float): Stop after an epoch in which the squared centroid
+            movement is below tol times the mean feature variance of the
+            initial sample (default: 1e-4)
+        init_size (int): Rows used to choose the initial centroids
+            (default: 3 * batch_size, at least 3 * n_clusters)
+        n_init (int): k-means++ attempts on the initial sample; the one with
+            the lowest inertia on it is kept (default: 3)
+        random_state: Seed or np.random.Generator (default: None)
+    
+    Attributes:
+        cluster_centers_ (np.ndarray): Centers, in standardised units after
+            fit_csv(scale=True); scaler_.inverse_transform maps them back
+        counts_ (np.ndarray): Points each center has been updated with
+        scaler_ (StreamingScaler): Scaler fitted by fit_csv, or None
+        n_epochs_ (int): Passes made over the data
+        n_steps_ (int): Batches processed
+    
+    Examples:
+        >>> rng = np.random.default_rng(0)
+        >>> X = np.concatenate([rng.normal(0, 1, (500, 2)), rng.normal(10, 1, (500, 2))])
+        >>> model = MiniBatchKMeans(n_clusters=2, batch_size=100, random_state=0).fit(X)
+        >>> sorted(int(round(center)) for center in model.cluster_centers_[:, 0])
+        [0, 10]
+    """
+    
+    def __init__(self, n_clusters=8, batch_size=1024, max_epochs=10, tol=1e-4, init_size=None,
+                 n_init=3, random_state=None):
+        if n_clusters < 1 or batch_size < 1 or max_epochs < 1:
+            raise ValueError("n_clusters, batch_size and max_epochs must be positive")
+        self.n_clusters = n_clusters
+        self.batch_size = batch_size
+        self.max_epochs = max_epochs
+        self.tol = tol
+        self.init_size = init_size
+        self.n_init = n_init
+        self.random_state = random_state
+        self._reset()
+    
+    def __repr__(self):
+        return f"MiniBatchKMeans(n_clusters={self.n_clusters}, batch_size={self.batch_size})"
+    
+    def _reset(self):
+        """Forget the fitted centroids."""
+        self.cluster_centers_ = None
+        self.counts_ = None
+        self.scaler_ = None
+        self.n_epochs_ = 0
+        self.n_steps_ = 0
+        self._tol = None
+        self._rng = np.random.default_rng(self.random_state)
+    
+    def _init_rows(self):
+        """Number of rows to buffer for the initial centroids."""
+        return max(self.init_size or 3 * self.batch_size, 3 * self.n_clusters)
+    
+    def _initialize(self, X):
+        """Choose initial centroids from a sample with k-means++."""
+        if len(X) < self.n_clusters:
+            raise ValueError(f"Need at least {self.n_clusters} rows to initialise the centroids")
+        best = None
+        for _ in range(self.n_init):
+            centers = kmeans_plusplus(X, self.n_clusters, self._rng)
+            _, distances = _nearest(X, centers)
+            inertia = (distances ** 2).sum()
+            if best is None or inertia < best[0]:
+                best = (inertia, centers)
+        self.cluster_centers_ = best[1]
+        self.counts_ = np.zeros(self.n_clusters, dtype=np.int64)
+        self._tol = self.tol * X.var(axis=0).mean()
+    
+    def partial_fit(self, X):
+        """
+        Update the centroids with one batch, initialising them on the first.
+        
+        Args:
+            X: Array-like of shape (n_samples, n_features), already scaled
+        
+        Returns:
+            MiniBatchKMeans: self
+        """
+        X = np.asarray(X, dtype=float)
+        if self.cluster_centers_ is None:
+            self._initialize(X)
+        
+        labels, _ = _nearest(X, self.cluster_centers_)
+        sums, sizes = _cluster_sums(X, labels, self.n_clusters)
+        self.counts_ += sizes
+        updated = sizes > 0
+        # c += (sum - n c) / count moves c to the running mean of its points
+        self.cluster_centers_[updated] += (
+            (sums[updated] - sizes[updated, None] * self.cluster_centers_[updated])
+            / self.counts_[updated, None])
+        self.n_steps_ += 1
+        return self
+    
+    def _fit_batches(self, epochs):
+        """Run epochs; epochs() returns an iterator of batches for one pass."""
+        for _ in range(self.max_epochs):
+            previous = None if self.cluster_centers_ is None else self.cluster_centers_.copy()
+            pending = []
+            for batch in epochs():
+                if self.cluster_centers_ is None:
+                    # Buffer the first rows to choose the initial centroids
+                    pending.append(batch)
+                    if sum(len(rows) for rows in pending) >= self._init_rows():
+                        self.partial_fit(np.concatenate(pending))
+                        pending = []
+                else:
+                    self.partial_fit(batch)
+            if pending:
+                self.partial_fit(np.concatenate(pending))
+            if self.cluster_centers_ is None:
+                raise ValueError("No data to fit")
+            
+            self.n_epochs_ += 1
+            if previous is not None and ((self.cluster_centers_ - previous) ** 2).sum() <= self._tol:
+                break
+        return self
+    
+    def fit(self, X):
+        """
+        Cluster an in-memory array, visiting it in shuffled mini-batches.
+        
+        Args:
+            X: Array-like of shape (n_samples, n_features)
+        
+        Returns:
+            MiniBatchKMeans: self
+        """
+        X = np.asarray(X, dtype=float)
+        self._reset()
+        
+        def epoch():
+            order = self._rng.permutation(len(X))
+            for start in range(0, len(X), self.batch_size):
+                yield X[order[start:start + self.batch_size]]
+        
+        return self._fit_batches(epoch)
+    
+    def fit_csv(self, path, columns, scale=True, **read_csv_options):
+        """
+        Cluster the rows of a CSV file, reading batch_size rows at a time.
+        
+        The file is read once to fit the scaler (if scale is True) and once
+        per epoch. For the best results the rows should be in random order;
+        a file sorted by one of the features gives early batches that all
+        come from one end of the data.
+        
+        Args:
+            path (str): CSV file
+            columns (list): Feature columns, in order
+            scale (bool): Standardise the features with a StreamingScaler
+                (default: True)
+            **read_csv_options: Passed to pandas.read_csv
+        
+        Returns:
+            MiniBatchKMeans: self
+        """
+        self._reset()
+        if scale:
+            self.scaler_ = StreamingScaler()
+            for batch in iter_csv_batches(path, columns, self.batch_size, **read_csv_options):
+                self.scaler_.partial_fit(batch)
+        
+        def epoch():
+            for batch in iter_csv_batches(path, columns, self.batch_size, **read_csv_options):
+                yield batch if self.scaler_ is None else self.scaler_.transform(batch)
+        
+        return self._fit_batches(epoch)
+    
+    def _prepare(self, X):
+        """Rows in the units of the centroids."""
+        return np.asarray(X, dtype=float) if self.scaler_ is None else self.scaler_.transform(X)
+    
+    def predict(self, X):
+        """
+        Closest cluster for each row.
+        
+        Args:
+            X: Array-like of shape (n_samples, n_features), in the original
+                units when fit_csv standardised the data
+        
+        Returns:
+            np.ndarray: Cluster labels
+        """
+        return _nearest(self._prepare(X), self.cluster_centers_)[0]
+    
+    def score(self, X):
+        """
+        Negative inertia of X, as in sklearn (higher is better).
+        
+        Args:
+            X: Array-like of shape (n_samples, n_features), in the same units
+                as for predict
+        
+        Returns:
+            float: Minus the sum of squared distances to the closest centers
+        """
+        _, distances = _nearest(self._prepare(X), self.cluster_centers_)
+        return -float((distances ** 2).sum())
+    
+    def predict_csv(self, path, columns, **read_csv_options):
+        """
+        Label the rows of a CSV file batch by batch.
+        
+        Args:
+            path (str): CSV file
+            columns (list): Feature columns, as given to fit_csv
+            **read_csv_options: Passed to pandas.read_csv
+        
+        Yields:
+            np.ndarray: Labels of each batch of rows, in file order
+        """
+        for batch in iter_csv_batches(path, columns, self.batch_size, **read_csv_options):
+            yield self.predict(batch)
@@ -12,10 +12,59 @@ Where:
 - P(Free) = emails_with_free / total_emails  
 - P(Free | Spam) = spam_and_free / spam_emails
 
+Usage:
+    python spam_calculator.py                      # interactive menu
+    python -m spam_calculator --input scenarios.csv --output results.csv
+
+Batch mode streams (total_emails, emails_with_free, spam_emails,
+spam_and_free) rows from a CSV file, validates and evaluates them a chunk at a
+time with NumPy, and writes all four probabilities for every row.
+
 Author: GitHub Copilot
 Date: July 27, 2025
 """
 
+import argparse
+import re
+import sys
+from itertools import islice
+
+# Output columns of batch mode, in order
+SCENARIO_COLUMNS = ['total_emails', 'emails_with_free', 'spam_emails', 'spam_and_free']
+PROBABILITY_COLUMNS = ['p_spam', 'p_free', 'p_free_given_spam', 'p_spam_given_free']
+
+# Accepted input header names for each scenario column
+_COLUMN_ALIASES = {
+    'total_emails': {'total_emails', 'total'},
+    'emails_with_free': {'emails_with_free', 'emails_with_word', 'with_word', 'with_free'},
+    'spam_emails': {'spam_emails', 'spam'},
+    'spam_and_free': {'spam_and_free', 'spam_and_word', 'both'},
+}
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+# Smallest valid value of each count
+_MINIMUMS = {'total_emails': 1, 'emails_with_free': 0, 'spam_emails': 0, 'spam_and_free': 0}
+
+# Constraints between the counts, in the order they are checked, as
+# (broken, message) pairs; the predicates work on plain integers and on
+# NumPy arrays alike, so the interactive and batch modes share them
+_LOGICAL_RULES = [
+    (lambda total, with_free, spam, both: with_free > total, "emails_with_free cannot exceed total_emails"),
+    (lambda total, with_free, spam, both: spam > total, "spam_emails cannot exceed total_emails"),
+    (lambda total, with_free, spam, both: both > with_free, "spam_and_free cannot exceed emails_with_free"),
+    (lambda total, with_free, spam, both: both > spam, "spam_and_free cannot exceed spam_emails"),
+]
+
+# Position suffix of np.loadtxt errors, e.g. " at row 0, column 2."; the
+# column is the 1-based field in the line
+_LOADTXT_POSITION = re.compile(r" at row \d+(?:, column (\d+))?(.*?)\.?$")
+
+
+def _minimum_message(name, min_value):
+    """Error message for a value below its minimum."""
+    return f"{name} must be at least {min_value}"
+
 
 def validate_input(value, name, min_value=0, max_value=None):
     """
@@ -31,7 +80,7 @@ def validate_input(value, name, min_value=0, max_value=None):
         bool: True if valid, False otherwise
     """
     if value < min_value:
-        print(f"Error: {name} must be at least {min_value}")
+        print(f"Error: {_minimum_message(name, min_value)}")
         return False
     
     if max_value is not None and value > max_value:
@@ -54,23 +103,11 @@ def validate_logical_constraints(total_emails, emails_with_free, spam_emails, sp
     Returns:
         bool: True if all constraints are satisfied, False otherwise
     """
-    # Check if individual counts don't exceed total
-    if emails_with_free > total_emails:
-        print("Error: emails_with_free cannot exceed total_emails")
-        return False
-    
-    if spam_emails > total_emails:
-        print("Error: spam_emails cannot exceed total_emails")
-        return False
-    
-    # Check if intersection doesn't exceed individual sets
-    if spam_and_free > emails_with_free:
-        print("Error: spam_and_free cannot exceed emails_with_free")
-        return False
-    
-    if spam_and_free > spam_emails:
-        print("Error: spam_and_free cannot exceed spam_emails")
-        return False
+    # Individual counts cannot exceed the total, nor the intersection either set
+    for broken, message in _LOGICAL_RULES:
+        if broken(total_emails, emails_with_free, spam_emails, spam_and_free):
+            print(f"Error: {message}")
+            return False
     
     return True
 
@@ -88,7 +125,7 @@ def get_user_input():
             print("-" * 35)
             
             total_emails = int(input("Total emails: "))
-            if not validate_input(total_emails, "total_emails", min_value=1):
+            if not validate_input(total_emails, "total_emails", min_value=_MINIMUMS['total_emails']):
                 continue
             
             emails_with_free = int(input("Emails containing 'free': "))
@@ -142,6 +179,206 @@ def calculate_spam_probability(total_emails, emails_with_free, spam_emails, spam
     }
 
 
+def validate_scenarios(total_emails, emails_with_free, spam_emails, spam_and_free):
+    """
+    Validate many scenarios at once.
+    
+    Applies the same rules as validate_input() and
+    validate_logical_constraints() to whole NumPy arrays, and reports the
+    first rule each scenario breaks.
+    
+    Args:
+        total_emails (np.ndarray): Total number of emails per scenario
+        emails_with_free (np.ndarray): Emails containing "free"
+        spam_emails (np.ndarray): Spam emails
+        spam_and_free (np.ndarray): Emails that are both spam and contain "free"
+    
+    Returns:
+        np.ndarray: Error message per scenario, '' where the scenario is valid
+    
+    Examples:
+        >>> import numpy as np
+        >>> validate_scenarios(np.array([1000, 100]), np.array([300, 50]),
+        ...                    np.array([400, 20]), np.array([120, 30])).tolist()
+        ['', 'spam_and_free cannot exceed spam_emails']
+    """
+    import numpy as np
+    
+    scenario = (total_emails, emails_with_free, spam_emails, spam_and_free)
+    conditions = [values < _MINIMUMS[name] for name, values in zip(SCENARIO_COLUMNS, scenario)]
+    messages = [_minimum_message(name, _MINIMUMS[name]) for name in SCENARIO_COLUMNS]
+    for broken, message in _LOGICAL_RULES:
+        conditions.append(broken(*scenario))
+        messages.append(message)
+    return np.select(conditions, messages, default='')
+
+
+def calculate_spam_probabilities(total_emails, emails_with_free, spam_emails, spam_and_free):
+    """
+    Calculate P(Spam | Free) for many scenarios at once.
+    
+    The array counterpart of calculate_spam_probability(), with the same
+    keys and the same handling of zero denominators.
+    
+    Args:
+        total_emails (np.ndarray): Total number of emails per scenario
+        emails_with_free (np.ndarray): Emails containing "free"
+        spam_emails (np.ndarray): Spam emails
+        spam_and_free (np.ndarray): Emails that are both spam and contain "free"
+    
+    Returns:
+        dict: Arrays p_spam, p_free, p_free_given_spam and p_spam_given_free
+            (0 wherever total_emails is not positive)
+    """
+    import numpy as np
+    
+    def ratio(numerator, denominator):
+        return np.divide(numerator, denominator, out=np.zeros(len(numerator)), where=denominator > 0)
+    
+    p_spam = ratio(spam_emails, total_emails)
+    p_free = ratio(emails_with_free, total_emails)
+    p_free_given_spam = ratio(spam_and_free, spam_emails)
+    
+    # Apply Bayes' Theorem: P(Spam | Free) = P(Free | Spam) × P(Spam) / P(Free)
+    p_spam_given_free = ratio(p_free_given_spam * p_spam, p_free)
+    
+    return {
+        'p_spam': p_spam,
+        'p_free': p_free,
+        'p_free_given_spam': p_free_given_spam,
+        'p_spam_given_free': p_spam_given_free
+    }
+
+
+def _scenario_columns(first_line):
+    """
+    Work out which input columns hold the scenario values.
+    
+    Returns:
+        tuple: (column indices, True if first_line is a header)
+    """
+    cells = [cell.strip().strip('"').lower() for cell in first_line.split(',')]
+    if not any(cell.isalpha() or '_' in cell for cell in cells):
+        if len(cells) != len(SCENARIO_COLUMNS):
+            raise ValueError(f"Expected {len(SCENARIO_COLUMNS)} columns, found {len(cells)}")
+        return list(range(len(SCENARIO_COLUMNS))), False
+    
+    indices = []
+    for column in SCENARIO_COLUMNS:
+        matches = [index for index, cell in enumerate(cells) if cell in _COLUMN_ALIASES[column]]
+        if not matches:
+            raise ValueError(f"Input header has no {column} column")
+        indices.append(matches[0])
+    return indices, True
+
+
+def _parse_chunk(lines, columns, first_line_number):
+    """Parse CSV lines into an (n, 4) integer array, reporting the bad line on failure."""
+    import numpy as np
+    
+    try:
+        return np.loadtxt(lines, delimiter=',', quotechar='"', dtype=np.int64, usecols=columns, ndmin=2)
+    except ValueError:
+        pass
+    
+    for number, line in enumerate(lines, start=first_line_number):
+        try:
+            np.loadtxt([line], delimiter=',', quotechar='"', dtype=np.int64, usecols=columns, ndmin=2)
+        except ValueError as error:
+            # The line was parsed alone, so NumPy's row number means nothing here
+            match = _LOADTXT_POSITION.search(str(error))
+            if match is None:
+                raise ValueError(f"line {number}: {error}") from None
+            column = f", column {match.group(1)}" if match.group(1) else ""
+            message = str(error)[:match.start()] + match.group(2)
+            raise ValueError(f"line {number}{column}: {message}") from None
+    raise ValueError(f"lines {first_line_number}-{first_line_number + len(lines) - 1}: invalid data")
+
+
+def run_batch(input_file, output_file, chunk_size=DEFAULT_CHUNK_SIZE, precision=None):
+    """
+    Evaluate every scenario in a CSV stream.
+    
+    The input holds one scenario per row: total_emails, emails_with_free,
+    spam_emails and spam_and_free, either as the only four columns or named
+    in a header row (short names such as total, with_word, spam and both are
+    accepted). Rows are read chunk_size at a time, so memory use does not
+    depend on the input size.
+    
+    The output repeats the four inputs, followed by p_spam, p_free,
+    p_free_given_spam, p_spam_given_free and an error column. Rows that break
+    a validation rule get empty probabilities and the rule's message.
+    
+    Args:
+        input_file: Readable text file
+        output_file: Writable text file
+        chunk_size (int): Rows evaluated at once (default: 100,000)
+        precision (int): Significant digits written per probability, or None
+            for the shortest exact representation (default: None); fewer
+            digits write noticeably faster
+    
+    Returns:
+        tuple: (scenarios read, scenarios that failed validation)
+    
+    Raises:
+        ValueError: If the input has the wrong columns or a non-integer value
+    """
+    import numpy as np
+    
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    
+    if precision is None:
+        format_probability = repr
+    elif isinstance(precision, int) and precision >= 1:
+        format_probability = f"%.{precision}g".__mod__
+    else:
+        raise ValueError("precision must be a positive integer or None")
+    
+    output_file.write(','.join(SCENARIO_COLUMNS + PROBABILITY_COLUMNS + ['error']) + '\n')
+    
+    first_line = next(input_file, '')
+    if not first_line.strip():
+        return 0, 0
+    columns, has_header = _scenario_columns(first_line)
+    pending = [] if has_header else [first_line]
+    line_number = 2 if has_header else 1
+    
+    rows = invalid = 0
+    while True:
+        lines = pending + list(islice(input_file, chunk_size - len(pending)))
+        pending = []
+        lines = [line for line in lines if line.strip()]
+        if not lines:
+            break
+        
+        values = _parse_chunk(lines, columns, line_number)
+        line_number += len(lines)
+        scenario = [values[:, index] for index in range(len(SCENARIO_COLUMNS))]
+        
+        errors = validate_scenarios(*scenario)
+        failed = errors != ''
+        probabilities = calculate_spam_probabilities(*scenario)
+        
+        # No field can contain a comma or quote, so rows are joined directly;
+        # csv.writer costs several times more per float
+        output = [list(map(str, column.tolist())) for column in scenario]
+        failed_rows = np.flatnonzero(failed).tolist()
+        for name in PROBABILITY_COLUMNS:
+            column = list(map(format_probability, probabilities[name].tolist()))
+            for row in failed_rows:
+                column[row] = ''
+            output.append(column)
+        output.append(errors.tolist())
+        output_file.write('\n'.join(map(','.join, zip(*output))))
+        output_file.write('\n')
+        
+        rows += len(lines)
+        invalid += int(np.count_nonzero(failed))
+    
+    return rows, invalid
+
+
 def print_detailed_results(total_emails, emails_with_free, spam_emails, spam_and_free, probabilities):
     """
     Print detailed calculation results.
@@ -192,10 +429,36 @@ def run_default_example():
     print_detailed_results(1000, 300, 400, 120, probabilities)
 
 
-def main():
+def main(argv=None):
     """
     Main function to run the spam probability calculator.
+    
+    With --input, evaluates a file of scenarios non-interactively (see
+    run_batch); otherwise shows the interactive menu.
     """
+    parser = argparse.ArgumentParser(description="Calculate P(Spam | word) using Bayes' Theorem.")
+    parser.add_argument('--input', metavar='CSV', help="scenarios to evaluate in batch mode ('-' for stdin)")
+    parser.add_argument('--output', metavar='CSV', default='-', help="where to write results (default: stdout)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"rows evaluated at once (default: {DEFAULT_CHUNK_SIZE:,})")
+    parser.add_argument('--precision', type=int,
+                        help="significant digits per probability (default: shortest exact value)")
+    args = parser.parse_args(argv)
+    
+    if args.input is not None:
+        input_file = sys.stdin if args.input == '-' else open(args.input, newline='')
+        output_file = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+        try:
+            rows, invalid = run_batch(input_file, output_file, chunk_size=args.chunk_size,
+                                      precision=args.precision)
+        finally:
+            if input_file is not sys.stdin:
+                input_file.close()
+            if output_file is not sys.stdout:
+                output_file.close()
+        print(f"Evaluated {rows:,} scenarios ({invalid:,} invalid)", file=sys.stderr)
+        return
+    
     print("Email Spam Probability Calculator using Bayes' Theorem")
     print("=" * 55)
     
@@ -0,0 +1,803 @@
+"""
+Streaming Spam Corpus Counter
+=============================
+
+Build the inputs of calculate_spam_probability() for every word in a labelled
+mail corpus instead of typing them in by hand.
+
+Messages are read one at a time from mbox, JSONL or CSV files (optionally
+gzip-compressed), so memory use does not depend on the size of the corpus:
+only the message being parsed and the per-word count table are held at once.
+Each message is tokenized into its set of distinct words, and the table counts
+how many emails, and how many spam emails, contain each word. The table can be
+capped with max_words, in which case the rarest words are discarded when it
+fills up and the largest possible undercount is tracked.
+
+Functions:
+    - tokenize(text): Distinct lowercase words in a message
+    - iter_mbox(path): Yield (is_spam, text) from an mbox file
+    - iter_jsonl(path): Yield (is_spam, text) from a JSON Lines file
+    - iter_csv(path): Yield (is_spam, text) from a CSV file
+    - iter_messages(path, format): Dispatch on the file extension
+    - plan_shards(paths): Split a corpus into byte-range shards
+    - ingest(paths, workers): Count a whole corpus in one pass, optionally
+      across several processes
+
+Usage:
+    python spam_corpus.py corpus.mbox.gz --top 20
+    python spam_corpus.py train.jsonl extra.csv --max-words 1000000
+    python spam_corpus.py big.jsonl --workers 32
+    python spam_corpus.py big.jsonl --sketch-epsilon 1e-5
+    python spam_corpus.py train.jsonl --export spam.table
+
+Author: GitHub Copilot
+Date: July 27, 2025
+"""
+
+import argparse
+import csv
+import email
+import gzip
+import heapq
+import json
+import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import repeat
+from operator import itemgetter
+
+from spam_calculator import calculate_spam_probability
+
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_TAG_PATTERN = re.compile(r"<[^>]*>")
+
+_SPAM_LABELS = {'1', 'spam', 'true', 'yes', 'y'}
+_HAM_LABELS = {'0', 'ham', 'false', 'no', 'n', 'not spam'}
+
+# Default largest CSV field; message bodies easily exceed the csv module's 128 KiB
+CSV_FIELD_SIZE_LIMIT = min(sys.maxsize, 2 ** 31 - 1)
+
+_FORMATS = {
+    '.mbox': 'mbox',
+    '.mbx': 'mbox',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.json': 'jsonl',
+    '.csv': 'csv',
+}
+
+
+def tokenize(text):
+    """
+    Split a message into the set of distinct lowercase words it contains.
+    
+    A word is counted once per message, matching the "emails containing the
+    word" counts that calculate_spam_probability() expects.
+    
+    Args:
+        text (str): Message text
+    
+    Returns:
+        set: Distinct words
+    
+    Examples:
+        >>> sorted(tokenize("FREE money, free offer!"))
+        ['free', 'money', 'offer']
+    """
+    return set(_TOKEN_PATTERN.findall(text.lower()))
+
+
+def parse_label(value):
+    """
+    Interpret a spam/ham label.
+    
+    Args:
+        value: bool, 0/1, or a string such as 'spam', 'ham', 'yes', 'no'
+    
+    Returns:
+        bool: True for spam, False for ham
+    
+    Raises:
+        ValueError: If the label is not recognised
+    
+    Examples:
+        >>> parse_label('Spam'), parse_label(0)
+        (True, False)
+    """
+    if isinstance(value, bool):
+        return value
+    
+    label = str(value).strip().lower()
+    if label in _SPAM_LABELS:
+        return True
+    if label in _HAM_LABELS:
+        return False
+    raise ValueError(f"Unrecognised spam label: {value!r}")
+
+
+def _open_binary(path):
+    """Open a corpus file for reading bytes, decompressing .gz files on the fly."""
+    if str(path).endswith('.gz'):
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def _message_text(message):
+    """Subject plus every text part of an email.message.Message."""
+    pieces = [str(message.get('Subject', ''))]
+    for part in message.walk():
+        if part.get_content_maintype() != 'text':
+            continue
+        payload = part.get_payload(decode=True)
+        if payload is None:
+            continue
+        text = payload.decode(part.get_content_charset() or 'utf-8', errors='replace')
+        if part.get_content_subtype() == 'html':
+            text = _TAG_PATTERN.sub(' ', text)
+        pieces.append(text)
+    return '\n'.join(pieces)
+
+
+def _seek_line(handle, start):
+    """
+    Move to the first line that begins at or after byte offset start.
+    
+    Returns:
+        int: Offset of that line
+    """
+    if start <= 0:
+        return 0
+    # Reading from one byte earlier finishes the line that straddles start,
+    # or consumes just the newline if a line begins exactly at start
+    handle.seek(start - 1)
+    return start - 1 + len(handle.readline())
+
+
+def _lines_in_range(handle, start, end):
+    """Yield the lines of a binary stream that begin in [start, end)."""
+    position = _seek_line(handle, start)
+    for line in handle:
+        if end is not None and position >= end:
+            break
+        yield line
+        position += len(line)
+
+
+def _mbox_messages(handle, start=0, end=None):
+    """
+    Yield the raw bytes of each message in an mbox stream, one at a time.
+    
+    Only messages whose "From " line begins in [start, end) are returned; a
+    message that starts in the range is read to its end even past end.
+    """
+    position = _seek_line(handle, start)
+    lines = None
+    for line in handle:
+        if line.startswith(b'From '):
+            if end is not None and position >= end:
+                break
+            if lines is not None:
+                yield b''.join(lines)
+            lines = []
+        elif lines is None:
+            pass  # Tail of a message that belongs to the previous range
+        elif line.startswith(b'>From '):
+            lines.append(line[1:])
+        else:
+            lines.append(line)
+        position += len(line)
+    if lines is not None:
+        yield b''.join(lines)
+
+
+def iter_mbox(path, label=None, label_header='X-Spam-Flag', start=0, end=None):
+    """
+    Yield (is_spam, text) for each message in an mbox file.
+    
+    The file is scanned line by line for "From " separators, so only one
+    message is held in memory at a time (the standard library mailbox module
+    indexes the whole file first).
+    
+    Args:
+        path (str): Path to an mbox file (.gz files are decompressed)
+        label: Label for every message in the file, e.g. 'spam' for a spam
+            folder; if None, each message's label_header is used instead
+        label_header (str): Header holding the label (default: 'X-Spam-Flag')
+        start (int): Only read messages whose "From " line begins at or after
+            this byte offset (default: 0)
+        end (int): ... and before this byte offset (default: None, end of file)
+    
+    Yields:
+        tuple: (is_spam, text)
+    
+    Raises:
+        ValueError: If a message has no recognisable label
+    """
+    fixed = None if label is None else parse_label(label)
+    
+    with _open_binary(path) as handle:
+        for number, raw in enumerate(_mbox_messages(handle, start, end), start=1):
+            message = email.message_from_bytes(raw)
+            if fixed is None:
+                value = message.get(label_header)
+                if value is None:
+                    raise ValueError(f"{path}: message {number} has no {label_header} header")
+                is_spam = parse_label(value)
+            else:
+                is_spam = fixed
+            yield is_spam, _message_text(message)
+
+
+def iter_jsonl(path, text_field='text', label_field='label', start=0, end=None):
+    """
+    Yield (is_spam, text) for each record in a JSON Lines file.
+    
+    Args:
+        path (str): Path to a JSONL file, one object per line (.gz files are
+            decompressed)
+        text_field (str): Key holding the message text (default: 'text')
+        label_field (str): Key holding the label (default: 'label')
+        start (int): Only read lines that begin at or after this byte offset
+            (default: 0)
+        end (int): ... and before this byte offset (default: None, end of file)
+    
+    Yields:
+        tuple: (is_spam, text)
+    
+    Raises:
+        ValueError: If a line is not valid JSON or lacks either field
+    """
+    with _open_binary(path) as handle:
+        for number, line in enumerate(_lines_in_range(handle, start, end), start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                is_spam = parse_label(record[label_field])
+                text = str(record[text_field])
+            except (KeyError, TypeError, ValueError) as error:
+                where = f"line {number}" if start <= 0 else f"line {number} after byte {start}"
+                raise ValueError(f"{path}: {where}: {error}") from None
+            yield is_spam, text
+
+
+def _with_field_limit(limit, function):
+    """Call function with the csv module's field size limit set to limit, then restore it."""
+    previous = csv.field_size_limit(limit)
+    try:
+        return function()
+    finally:
+        csv.field_size_limit(previous)
+
+
+def iter_csv(path, text_column='text', label_column='label', max_field_size=CSV_FIELD_SIZE_LIMIT):
+    """
+    Yield (is_spam, text) for each row of a CSV file with a header row.
+    
+    The csv module's field size limit is process-wide, so it is raised to
+    max_field_size only while a row is being read and restored before the
+    row is yielded.
+    
+    Args:
+        path (str): Path to a CSV file (.gz files are decompressed)
+        text_column (str): Column holding the message text (default: 'text')
+        label_column (str): Column holding the label (default: 'label')
+        max_field_size (int): Largest field, in characters, that may be read
+            (default: CSV_FIELD_SIZE_LIMIT)
+    
+    Yields:
+        tuple: (is_spam, text)
+    
+    Raises:
+        ValueError: If a column is missing or a label is not recognised
+    """
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8', errors='replace', newline='') as handle:
+        reader = csv.DictReader(handle)
+        fieldnames = _with_field_limit(max_field_size, lambda: reader.fieldnames)
+        missing = {text_column, label_column} - set(fieldnames or ())
+        if missing:
+            raise ValueError(f"{path}: missing column(s) {sorted(missing)}")
+        
+        read_row = partial(next, reader, None)
+        while True:
+            row = _with_field_limit(max_field_size, read_row)
+            if row is None:
+                break
+            try:
+                is_spam = parse_label(row[label_column])
+            except ValueError as error:
+                raise ValueError(f"{path}: line {reader.line_num}: {error}") from None
+            yield is_spam, row[text_column]
+
+
+def detect_format(path):
+    """
+    Guess a corpus format from its file extension, ignoring a trailing .gz.
+    
+    Args:
+        path (str): Corpus file path
+    
+    Returns:
+        str: 'mbox', 'jsonl' or 'csv'
+    
+    Raises:
+        ValueError: If the extension is not recognised
+    
+    Examples:
+        >>> detect_format('mail/2024.jsonl.gz')
+        'jsonl'
+    """
+    name = str(path).lower()
+    if name.endswith('.gz'):
+        name = name[:-3]
+    for extension, corpus_format in _FORMATS.items():
+        if name.endswith(extension):
+            return corpus_format
+    raise ValueError(f"Cannot detect corpus format of {path}; pass format='mbox', 'jsonl' or 'csv'")
+
+
+_READERS = {
+    'mbox': iter_mbox,
+    'jsonl': iter_jsonl,
+    'csv': iter_csv,
+}
+
+
+def iter_messages(path, format=None, **options):
+    """
+    Yield (is_spam, text) for each message in a corpus file.
+    
+    Args:
+        path (str): Corpus file path
+        format (str): 'mbox', 'jsonl' or 'csv'; detected from the extension
+            if None
+        **options: Passed to iter_mbox, iter_jsonl or iter_csv
+    
+    Yields:
+        tuple: (is_spam, text)
+    
+    Raises:
+        ValueError: If the format is unknown
+    """
+    corpus_format = format or detect_format(path)
+    if corpus_format not in _READERS:
+        raise ValueError(f"Unknown corpus format '{corpus_format}'. Choose from {sorted(_READERS)}")
+    return _READERS[corpus_format](path, **options)
+
+
+class WordCountTable:
+    """
+    Message-level methods shared by the per-word count tables.
+    
+    Subclasses count one tokenized message in add(tokens, is_spam) and
+    report a word's calculate_spam_probability() inputs from counts(word);
+    tokenizing, bulk updates and single-word probabilities are built on
+    those two methods here. Subclasses keep total_emails up to date.
+    """
+    
+    def add_message(self, text, is_spam, tokenizer=tokenize):
+        """
+        Tokenize and count one message.
+        
+        Args:
+            text (str): Message text
+            is_spam (bool): Whether the message is spam
+            tokenizer (callable): Function returning the distinct words of a
+                message (default: tokenize)
+        """
+        self.add(tokenizer(text), is_spam)
+    
+    def update(self, messages, tokenizer=tokenize):
+        """
+        Count every (is_spam, text) pair from an iterable, e.g. iter_messages().
+        
+        Args:
+            messages: Iterable of (is_spam, text) pairs
+            tokenizer (callable): Function returning the distinct words of a
+                message (default: tokenize)
+        
+        Returns:
+            self, for chaining
+        """
+        add = self.add
+        for is_spam, text in messages:
+            add(tokenizer(text), is_spam)
+        return self
+    
+    def probability(self, word):
+        """
+        Run calculate_spam_probability() on a word's counts.
+        
+        Args:
+            word (str): Word to look up
+        
+        Returns:
+            dict: p_spam, p_free, p_free_given_spam and p_spam_given_free,
+                where "free" stands for the given word
+        
+        Raises:
+            ValueError: If no messages have been counted yet
+        """
+        if self.total_emails == 0:
+            raise ValueError("No messages have been counted")
+        return calculate_spam_probability(*self.counts(word))
+
+
+class SpamWordCounts(WordCountTable):
+    """
+    Per-word spam/ham counts accumulated one message at a time.
+    
+    For every word the table stores the number of emails containing it and
+    the number of spam emails containing it, which together with the message
+    totals are exactly the four inputs of calculate_spam_probability().
+    
+    If max_words is set, the table never holds more than that many words:
+    when it overflows, only the max_words // 2 most frequent words are kept.
+    A discarded word that reappears starts counting from zero again, so its
+    counts may be too low by at most max_undercount.
+    
+    Attributes:
+        total_emails (int): Messages seen
+        spam_emails (int): Spam messages seen
+        word_counts (Counter): word -> emails containing the word
+        spam_counts (Counter): word -> spam emails containing the word
+        max_undercount (int): Upper bound on how far any word's counts may be
+            too low because of pruning (0 if nothing was ever discarded)
+    
+    Examples:
+        >>> counts = SpamWordCounts()
+        >>> counts.add_message("Free money now", is_spam=True)
+        >>> counts.add_message("Lunch is free today", is_spam=False)
+        >>> counts.counts('free')
+        (2, 2, 1, 1)
+        >>> counts.probability('free')['p_spam_given_free']
+        0.5
+    """
+    
+    def __init__(self, max_words=None):
+        """
+        Create an empty count table.
+        
+        Args:
+            max_words (int): Largest number of distinct words to keep, or None
+                for no limit (default: None)
+        
+        Raises:
+            ValueError: If max_words is not a positive integer
+        """
+        if max_words is not None and (not isinstance(max_words, int) or max_words < 2):
+            raise ValueError("max_words must be an integer of at least 2")
+        
+        self.max_words = max_words
+        self.total_emails = 0
+        self.spam_emails = 0
+        self.word_counts = Counter()
+        self.spam_counts = Counter()
+        self.max_undercount = 0
+    
+    def __len__(self):
+        return len(self.word_counts)
+    
+    def __repr__(self):
+        return (f"SpamWordCounts(total_emails={self.total_emails}, "
+                f"spam_emails={self.spam_emails}, words={len(self)})")
+    
+    def __eq__(self, other):
+        if not isinstance(other, SpamWordCounts):
+            return NotImplemented
+        return (self.total_emails == other.total_emails
+                and self.spam_emails == other.spam_emails
+                and self.word_counts == other.word_counts
+                and self.spam_counts == other.spam_counts)
+    
+    def __add__(self, other):
+        if not isinstance(other, SpamWordCounts):
+            return NotImplemented
+        return self.empty().merge(self).merge(other)
+    
+    def empty(self):
+        """
+        Create an empty table with the same max_words, e.g. for a worker
+        whose counts will be merged back into this one.
+        
+        Returns:
+            SpamWordCounts: New empty table
+        """
+        return SpamWordCounts(max_words=self.max_words)
+    
+    def add(self, tokens, is_spam):
+        """
+        Count one message given its set of distinct words.
+        
+        Args:
+            tokens (set): Distinct words in the message
+            is_spam (bool): Whether the message is spam
+        """
+        self.total_emails += 1
+        self.word_counts.update(tokens)
+        if is_spam:
+            self.spam_emails += 1
+            self.spam_counts.update(tokens)
+        
+        if self.max_words is not None and len(self.word_counts) > self.max_words:
+            self._prune()
+    
+    def merge(self, other):
+        """
+        Add another table's counts to this one.
+        
+        Merging is associative and commutative, so tables counted separately
+        (for example one per file, or one per worker process) combine into
+        exactly the table a single pass over all the messages would give.
+        With max_words set the merged table is pruned again if it overflows,
+        and the undercount bounds of both tables add up.
+        
+        Args:
+            other (SpamWordCounts): Counts to add
+        
+        Returns:
+            SpamWordCounts: self, for chaining
+        
+        Raises:
+            TypeError: If other is not a SpamWordCounts
+        
+        Examples:
+            >>> a, b = SpamWordCounts(), SpamWordCounts()
+            >>> a.add_message("free money", is_spam=True)
+            >>> b.add_message("free lunch", is_spam=False)
+            >>> a.merge(b).counts('free')
+            (2, 2, 1, 1)
+        """
+        if not isinstance(other, SpamWordCounts):
+            raise TypeError("Can only merge another SpamWordCounts")
+        
+        self.total_emails += other.total_emails
+        self.spam_emails += other.spam_emails
+        self.word_counts.update(other.word_counts)
+        self.spam_counts.update(other.spam_counts)
+        self.max_undercount += other.max_undercount
+        
+        if self.max_words is not None and len(self.word_counts) > self.max_words:
+            self._prune()
+        return self
+    
+    def _prune(self):
+        """Keep only the max_words // 2 most frequent words."""
+        keep = dict(heapq.nlargest(self.max_words // 2, self.word_counts.items(), key=itemgetter(1)))
+        
+        # A word can be dropped at most once per prune, losing at most the
+        # largest count discarded this time
+        dropped = max(count for word, count in self.word_counts.items() if word not in keep)
+        self.max_undercount += dropped
+        
+        spam_counts = self.spam_counts
+        self.word_counts = Counter(keep)
+        self.spam_counts = Counter({word: spam_counts[word] for word in keep if word in spam_counts})
+    
+    def counts(self, word):
+        """
+        Get the calculate_spam_probability() inputs for a word.
+        
+        Args:
+            word (str): Word to look up
+        
+        Returns:
+            tuple: (total_emails, emails_with_word, spam_emails, spam_and_word)
+        """
+        return (self.total_emails, self.word_counts.get(word, 0),
+                self.spam_emails, self.spam_counts.get(word, 0))
+    
+    def probabilities(self, min_count=1):
+        """
+        Run calculate_spam_probability() for every word in the table.
+        
+        Args:
+            min_count (int): Skip words found in fewer emails than this
+                (default: 1)
+        
+        Returns:
+            dict: word -> probability dictionary, as returned by
+                calculate_spam_probability()
+        """
+        if self.total_emails == 0:
+            return {}
+        
+        total = self.total_emails
+        spam = self.spam_emails
+        spam_counts = self.spam_counts
+        return {
+            word: calculate_spam_probability(total, count, spam, spam_counts.get(word, 0))
+            for word, count in self.word_counts.items()
+            if count >= min_count
+        }
+
+
+# Formats whose records can be located from an arbitrary byte offset
+_SPLITTABLE = {'mbox', 'jsonl'}
+
+DEFAULT_SHARD_BYTES = 64 * 1024 * 1024
+
+
+def plan_shards(paths, format=None, shard_bytes=DEFAULT_SHARD_BYTES):
+    """
+    Split a corpus into independently countable pieces.
+    
+    Uncompressed mbox and JSONL files are cut into byte ranges of about
+    shard_bytes; each reader skips ahead to the first record boundary in its
+    range, so every message lands in exactly one shard. CSV (whose quoted
+    fields may contain newlines) and gzip files are one shard per file.
+    
+    Args:
+        paths: A corpus file path, or a list of paths
+        format (str): Corpus format for every file; detected per file from the
+            extension if None
+        shard_bytes (int): Target shard size in bytes (default: 64 MiB)
+    
+    Returns:
+        list: (path, format, start, end) tuples, in file order
+    
+    Raises:
+        ValueError: If shard_bytes is not positive or a format is unknown
+    """
+    if not isinstance(shard_bytes, int) or shard_bytes <= 0:
+        raise ValueError("shard_bytes must be a positive integer")
+    
+    if isinstance(paths, str):
+        paths = [paths]
+    
+    shards = []
+    for path in paths:
+        corpus_format = format or detect_format(path)
+        if corpus_format not in _READERS:
+            raise ValueError(f"Unknown corpus format '{corpus_format}'. Choose from {sorted(_READERS)}")
+        
+        if corpus_format in _SPLITTABLE and not str(path).endswith('.gz'):
+            size = os.path.getsize(path)
+            for start in range(0, max(size, 1), shard_bytes):
+                end = start + shard_bytes
+                shards.append((path, corpus_format, start, end if end < size else None))
+        else:
+            shards.append((path, corpus_format, 0, None))
+    return shards
+
+
+def _count_shard(shard, table, tokenizer, options):
+    """Count one shard into an empty table; runs in a worker process."""
+    path, corpus_format, start, end = shard
+    if corpus_format in _SPLITTABLE:
+        options = dict(options, start=start, end=end)
+    messages = iter_messages(path, corpus_format, **options)
+    return table.update(messages, tokenizer=tokenizer)
+
+
+def ingest(paths, format=None, max_words=None, tokenizer=tokenize, workers=1,
+           shard_bytes=DEFAULT_SHARD_BYTES, table=None, **options):
+    """
+    Count one or more corpus files in a single streaming pass.
+    
+    With workers > 1 the corpus is split by plan_shards(), the shards are
+    counted in a ProcessPoolExecutor and the partial tables are merged in
+    shard order. Without max_words the result is identical to workers=1.
+    
+    Args:
+        paths: A corpus file path, or a list of paths
+        format (str): Corpus format for every file; detected per file from the
+            extension if None
+        max_words (int): Cap on the number of distinct words kept, per worker
+            and in the merged table (default: None, no limit)
+        tokenizer (callable): Function returning the distinct words of a
+            message; must be picklable (a module-level function) when
+            workers > 1 (default: tokenize)
+        workers (int): Number of worker processes (default: 1, count in this
+            process)
+        shard_bytes (int): Target shard size for splitting large mbox and
+            JSONL files between workers (default: 64 MiB)
+        table: Table to count into instead of a new SpamWordCounts, e.g. a
+            spam_sketch.SketchSpamCounts for fixed memory; workers start from
+            table.empty() (default: None)
+        **options: Passed to the format reader, e.g. text_column='body'
+    
+    Returns:
+        The table holding counts for the whole corpus (a SpamWordCounts
+        unless table was given)
+    
+    Raises:
+        ValueError: If workers is not a positive integer, or both max_words
+            and table are given
+    """
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError("workers must be a positive integer")
+    
+    if table is not None and max_words is not None:
+        raise ValueError("max_words applies to the default table only; pass one or the other")
+    
+    if isinstance(paths, str):
+        paths = [paths]
+    
+    counts = SpamWordCounts(max_words=max_words) if table is None else table
+    if workers == 1:
+        for path in paths:
+            counts.update(iter_messages(path, format, **options), tokenizer=tokenizer)
+        return counts
+    
+    shards = plan_shards(paths, format, shard_bytes)
+    with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as pool:
+        partials = pool.map(_count_shard, shards, repeat(counts.empty()), repeat(tokenizer), repeat(options))
+        for partial in partials:
+            counts.merge(partial)
+    return counts
+
+
+def print_top_words(counts, top=20, min_count=5):
+    """
+    Print the words most strongly associated with spam.
+    
+    Args:
+        counts: Accumulated SpamWordCounts or SketchSpamCounts
+        top (int): Number of words to print (default: 20)
+        min_count (int): Ignore words found in fewer emails than this
+            (default: 5)
+    """
+    print(f"Messages: {counts.total_emails:,} ({counts.spam_emails:,} spam)")
+    print(f"Words tracked: {len(counts):,}")
+    if getattr(counts, 'max_undercount', 0):
+        print(f"Counts may be low by up to {counts.max_undercount:,} (vocabulary was pruned)")
+    if getattr(counts, 'max_overcount', 0):
+        print(f"Counts may be high by up to {counts.max_overcount:,} (sketch estimates)")
+    
+    probabilities = counts.probabilities(min_count=min_count)
+    ranked = heapq.nlargest(top, probabilities.items(),
+                            key=lambda item: (item[1]['p_spam_given_free'], counts.counts(item[0])[1]))
+    
+    print(f"\n{'word':<20} {'emails':>10} {'spam':>10} {'P(Spam | word)':>15}")
+    print("-" * 58)
+    for word, probability in ranked:
+        _, with_word, _, spam_and_word = counts.counts(word)
+        print(f"{word:<20} {with_word:>10,} {spam_and_word:>10,} {probability['p_spam_given_free']:>15.4f}")
+
+
+def main(argv=None):
+    """
+    Count a corpus from the command line and print the spammiest words.
+    """
+    parser = argparse.ArgumentParser(description="Count per-word spam statistics in a labelled mail corpus.")
+    parser.add_argument('paths', nargs='+', help="mbox, JSONL or CSV files (optionally .gz)")
+    parser.add_argument('--format', choices=sorted(_READERS), help="corpus format (default: from extension)")
+    parser.add_argument('--max-words', type=int, help="cap on distinct words kept in memory")
+    parser.add_argument('--min-count', type=int, default=5, help="ignore rarer words (default: 5)")
+    parser.add_argument('--top', type=int, default=20, help="number of words to show (default: 20)")
+    parser.add_argument('--workers', type=int, default=1, help="worker processes (default: 1)")
+    parser.add_argument('--sketch-epsilon', type=float,
+                        help="count in a fixed-memory Count-Min Sketch with this error bound")
+    parser.add_argument('--sketch-delta', type=float, default=0.01,
+                        help="probability of exceeding the sketch error bound (default: 0.01)")
+    parser.add_argument('--heavy-hitters', type=int, default=1000,
+                        help="frequent words tracked by the sketch (default: 1000)")
+    parser.add_argument('--export', metavar='PATH',
+                        help="write a memory-mapped log-odds table of words with at least --min-count emails")
+    args = parser.parse_args(argv)
+    if args.sketch_epsilon is not None and args.max_words is not None:
+        parser.error("--max-words cannot be combined with --sketch-epsilon (the sketch has fixed memory)")
+    
+    table = None
+    if args.sketch_epsilon is not None:
+        from spam_sketch import SketchSpamCounts
+        table = SketchSpamCounts(args.sketch_epsilon, args.sketch_delta, args.heavy_hitters)
+    
+    counts = ingest(args.paths, format=args.format, max_words=args.max_words, workers=args.workers,
+                    table=table)
+    print_top_words(counts, top=args.top, min_count=args.min_count)
+    
+    if args.export:
+        from spam_table import export_table
+        written = export_table(counts, args.export, min_count=args.min_count)
+        print(f"\nWrote {written:,} words to {args.export}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,441 @@
+"""
+Approximate Spam Word Counts
+============================
+
+A fixed-memory alternative to SpamWordCounts for vocabularies that never stop
+growing (URLs, hashes, typos).
+
+Per-word counts are kept in a Count-Min Sketch: depth rows of width counters,
+each row indexed by its own hash of the word. Adding a word increments one
+counter per row; its estimated count is the smallest of those counters. With
+width = ceil(e / epsilon) and depth = ceil(ln(1 / delta)), an estimate is
+never below the true count and exceeds it by more than epsilon * N (N being
+the total number of counted word occurrences) with probability at most delta.
+Memory depends only on epsilon and delta, not on the corpus.
+
+A sketch cannot list the words it has seen, so the most frequent words are
+tracked separately as heavy hitters; probabilities() covers those words, and
+error_bound() states how far P(Spam | word) can be from the exact value.
+
+Classes:
+    - CountMinSketch: Count-Min Sketch over strings
+    - SketchSpamCounts: Drop-in replacement for SpamWordCounts
+
+Usage:
+    from spam_corpus import ingest
+    from spam_sketch import SketchSpamCounts
+    
+    counts = ingest("corpus.jsonl", table=SketchSpamCounts(epsilon=1e-5))
+
+Author: GitHub Copilot
+Date: July 27, 2025
+"""
+
+import heapq
+import math
+from array import array
+from hashlib import blake2b
+
+from spam_calculator import calculate_spam_probability
+from spam_corpus import WordCountTable
+
+# Hashed words remembered per sketch; frequent words make up most of a message
+_INDEX_CACHE_SIZE = 1 << 16
+
+
+class CountMinSketch:
+    """
+    Count-Min Sketch of string counts.
+    
+    Words are hashed with keyed BLAKE2b rather than hash(), so two sketches
+    built with the same seed agree in every process and can be merged.
+    
+    Attributes:
+        epsilon (float): Relative error bound
+        delta (float): Probability of exceeding the error bound
+        width (int): Counters per row, ceil(e / epsilon)
+        depth (int): Number of rows, ceil(ln(1 / delta))
+        seed (int): Hash seed
+        total (int): Sum of all counts added
+    
+    Examples:
+        >>> sketch = CountMinSketch(epsilon=0.01, delta=0.01)
+        >>> sketch.add('free', 3)
+        >>> sketch.estimate('free')
+        3
+        >>> sketch.width, sketch.depth
+        (272, 5)
+    """
+    
+    def __init__(self, epsilon=0.001, delta=0.01, seed=0):
+        """
+        Create an empty sketch.
+        
+        Args:
+            epsilon (float): Bound on the overestimate, as a fraction of
+                total (default: 0.001)
+            delta (float): Probability that an estimate exceeds the bound
+                (default: 0.01)
+            seed (int): Hash seed; only sketches with equal seeds can be
+                merged (default: 0)
+        
+        Raises:
+            ValueError: If epsilon or delta is not strictly between 0 and 1,
+                or seed is not a non-negative integer
+        """
+        if not 0 < epsilon < 1:
+            raise ValueError("epsilon must be between 0 and 1")
+        if not 0 < delta < 1:
+            raise ValueError("delta must be between 0 and 1")
+        if not isinstance(seed, int) or seed < 0:
+            raise ValueError("seed must be a non-negative integer")
+        
+        self.epsilon = epsilon
+        self.delta = delta
+        self.seed = seed
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.total = 0
+        self.table = array('Q', bytes(8 * self.width * self.depth))
+        self._key = seed.to_bytes(8, 'little')
+        self._offsets = range(0, self.width * self.depth, self.width)
+        self._cache = {}
+    
+    def __repr__(self):
+        return f"CountMinSketch(width={self.width}, depth={self.depth}, total={self.total})"
+    
+    def __getstate__(self):
+        # The index cache is rebuilt on demand; don't ship it between processes
+        return dict(self.__dict__, _cache={})
+    
+    def __eq__(self, other):
+        if not isinstance(other, CountMinSketch):
+            return NotImplemented
+        return self.seed == other.seed and self.total == other.total and self.table == other.table
+    
+    def indices(self, item):
+        """
+        Positions in table of the counters for item, one per row.
+        
+        The depth row hashes are derived from one 64-bit digest by double
+        hashing, h1 + row * h2, using its two 32-bit halves. Recently hashed
+        items are cached.
+        
+        Args:
+            item (str): Item to hash
+        
+        Returns:
+            tuple: depth indices into table
+        """
+        cache = self._cache
+        positions = cache.get(item)
+        if positions is None:
+            if len(cache) >= _INDEX_CACHE_SIZE:
+                cache.clear()
+            digest = int.from_bytes(blake2b(item.encode('utf-8'), digest_size=8, key=self._key).digest(), 'little')
+            h1 = digest & 0xFFFFFFFF
+            h2 = (digest >> 32) | 1
+            width = self.width
+            positions = cache[item] = tuple(offset + (h1 + row * h2) % width
+                                            for row, offset in enumerate(self._offsets))
+        return positions
+    
+    def add(self, item, count=1):
+        """
+        Add count occurrences of item.
+        
+        Args:
+            item (str): Item to count
+            count (int): Occurrences to add (default: 1)
+        """
+        table = self.table
+        for index in self.indices(item):
+            table[index] += count
+        self.total += count
+    
+    def estimate(self, item):
+        """
+        Estimated count of item: never too low, too high by at most
+        epsilon * total with probability 1 - delta.
+        
+        Args:
+            item (str): Item to look up
+        
+        Returns:
+            int: Estimated count
+        """
+        table = self.table
+        return min(table[index] for index in self.indices(item))
+    
+    def merge(self, other):
+        """
+        Add another sketch's counts to this one.
+        
+        Args:
+            other (CountMinSketch): Sketch with the same width, depth and seed
+        
+        Returns:
+            CountMinSketch: self, for chaining
+        
+        Raises:
+            ValueError: If the sketches are not compatible
+        """
+        if (other.width, other.depth, other.seed) != (self.width, self.depth, self.seed):
+            raise ValueError("Can only merge sketches with the same width, depth and seed")
+        
+        self.table = array('Q', map(int.__add__, self.table, other.table))
+        self.total += other.total
+        return self
+
+
+class SketchSpamCounts(WordCountTable):
+    """
+    Approximate per-word spam/ham counts in fixed memory.
+    
+    Has the same interface as SpamWordCounts (add, add_message, update,
+    merge, counts, probability, probabilities), sharing its WordCountTable
+    base, so it can be passed to ingest() as the table. Email and spam-email counts per word live in two
+    Count-Min Sketches that share their hashes, so each word is hashed once
+    per message. The heavy_hitters most frequent words are tracked by name;
+    probabilities() reports those.
+    
+    Estimated counts are never too low and are too high by at most
+    max_overcount, each with probability 1 - delta. error_bound(word) turns
+    that into a bound on P(Spam | word): for a word found in c emails it is
+    about epsilon * N / c, so frequent words are estimated closely.
+    
+    Attributes:
+        total_emails (int): Messages seen (exact)
+        spam_emails (int): Spam messages seen (exact)
+        word_sketch (CountMinSketch): word -> emails containing the word
+        spam_sketch (CountMinSketch): word -> spam emails containing the word
+        heavy_hitters (int): Number of frequent words tracked by name
+    
+    Examples:
+        >>> counts = SketchSpamCounts(epsilon=0.01)
+        >>> counts.add_message("Free money now", is_spam=True)
+        >>> counts.add_message("Lunch is free today", is_spam=False)
+        >>> counts.counts('free')
+        (2, 2, 1, 1)
+    """
+    
+    def __init__(self, epsilon=0.001, delta=0.01, heavy_hitters=1000, seed=0):
+        """
+        Create an empty table.
+        
+        Args:
+            epsilon (float): Count error bound, relative to the total number
+                of word occurrences (default: 0.001)
+            delta (float): Probability of exceeding the bound (default: 0.01)
+            heavy_hitters (int): Number of frequent words to track by name
+                (default: 1000)
+            seed (int): Hash seed; only tables with equal seeds and bounds can
+                be merged (default: 0)
+        
+        Raises:
+            ValueError: If a parameter is out of range
+        """
+        if not isinstance(heavy_hitters, int) or heavy_hitters < 1:
+            raise ValueError("heavy_hitters must be a positive integer")
+        
+        self.total_emails = 0
+        self.spam_emails = 0
+        self.word_sketch = CountMinSketch(epsilon, delta, seed)
+        self.spam_sketch = CountMinSketch(epsilon, delta, seed)
+        self.heavy_hitters = heavy_hitters
+        # word -> estimated email count, plus a min-heap of (count, word)
+        # entries whose counts may lag behind _heavy
+        self._heavy = {}
+        self._heap = []
+    
+    def __len__(self):
+        return len(self._heavy)
+    
+    def __repr__(self):
+        return (f"SketchSpamCounts(total_emails={self.total_emails}, "
+                f"spam_emails={self.spam_emails}, tracked={len(self)})")
+    
+    def __eq__(self, other):
+        if not isinstance(other, SketchSpamCounts):
+            return NotImplemented
+        return (self.total_emails == other.total_emails
+                and self.spam_emails == other.spam_emails
+                and self.word_sketch == other.word_sketch
+                and self.spam_sketch == other.spam_sketch)
+    
+    def __add__(self, other):
+        if not isinstance(other, SketchSpamCounts):
+            return NotImplemented
+        return self.empty().merge(self).merge(other)
+    
+    def empty(self):
+        """
+        Create an empty table with the same bounds and seed, e.g. for a
+        worker whose counts will be merged back into this one.
+        
+        Returns:
+            SketchSpamCounts: New empty table
+        """
+        sketch = self.word_sketch
+        return SketchSpamCounts(sketch.epsilon, sketch.delta, self.heavy_hitters, sketch.seed)
+    
+    @property
+    def max_overcount(self):
+        """Largest amount (with probability 1 - delta) by which a count is too high."""
+        return math.floor(self.word_sketch.epsilon * self.word_sketch.total)
+    
+    def add(self, tokens, is_spam):
+        """
+        Count one message given its set of distinct words.
+        
+        Args:
+            tokens (set): Distinct words in the message
+            is_spam (bool): Whether the message is spam
+        """
+        self.total_emails += 1
+        if is_spam:
+            self.spam_emails += 1
+        
+        indices = self.word_sketch.indices
+        word_table = self.word_sketch.table
+        spam_table = self.spam_sketch.table
+        heavy = self._heavy
+        heap = self._heap
+        capacity = self.heavy_hitters
+        
+        for token in tokens:
+            positions = indices(token)
+            estimate = None
+            for index in positions:
+                count = word_table[index] + 1
+                word_table[index] = count
+                if estimate is None or count < estimate:
+                    estimate = count
+            if is_spam:
+                for index in positions:
+                    spam_table[index] += 1
+            
+            if token in heavy:
+                heavy[token] = estimate
+            elif len(heavy) < capacity:
+                heavy[token] = estimate
+                heapq.heappush(heap, (estimate, token))
+            elif estimate > heap[0][0]:
+                # Heap entries only ever lag behind, so refresh the top until
+                # it is current before deciding whether to evict it
+                while heap[0][0] != heavy[heap[0][1]]:
+                    heapq.heapreplace(heap, (heavy[heap[0][1]], heap[0][1]))
+                if estimate > heap[0][0]:
+                    _, evicted = heapq.heapreplace(heap, (estimate, token))
+                    del heavy[evicted]
+                    heavy[token] = estimate
+        
+        self.word_sketch.total += len(tokens)
+        if is_spam:
+            self.spam_sketch.total += len(tokens)
+    
+    def merge(self, other):
+        """
+        Add another table's counts to this one.
+        
+        The sketches add exactly, so merging is associative; the merged heavy
+        hitters are the most frequent of both tables' tracked words,
+        re-estimated from the merged sketch.
+        
+        Args:
+            other (SketchSpamCounts): Table with the same bounds and seed
+        
+        Returns:
+            SketchSpamCounts: self, for chaining
+        
+        Raises:
+            TypeError: If other is not a SketchSpamCounts
+            ValueError: If the tables' sketches are not compatible
+        """
+        if not isinstance(other, SketchSpamCounts):
+            raise TypeError("Can only merge another SketchSpamCounts")
+        
+        self.word_sketch.merge(other.word_sketch)
+        self.spam_sketch.merge(other.spam_sketch)
+        self.total_emails += other.total_emails
+        self.spam_emails += other.spam_emails
+        
+        estimate = self.word_sketch.estimate
+        candidates = {word: estimate(word) for word in (*self._heavy, *other._heavy)}
+        self._heavy = dict(heapq.nlargest(self.heavy_hitters, candidates.items(), key=lambda item: item[1]))
+        self._heap = [(count, word) for word, count in self._heavy.items()]
+        heapq.heapify(self._heap)
+        return self
+    
+    def counts(self, word):
+        """
+        Get the estimated calculate_spam_probability() inputs for a word.
+        
+        Args:
+            word (str): Word to look up (need not be a heavy hitter)
+        
+        Returns:
+            tuple: (total_emails, emails_with_word, spam_emails, spam_and_word)
+        """
+        with_word = min(self.word_sketch.estimate(word), self.total_emails)
+        spam_and_word = min(self.spam_sketch.estimate(word), with_word, self.spam_emails)
+        return self.total_emails, with_word, self.spam_emails, spam_and_word
+    
+    def error_bound(self, word):
+        """
+        Bound on the error of the estimated P(Spam | word).
+        
+        If the true counts are c emails and s spam emails, and the estimates
+        are too high by a <= max_overcount and b <= max_overcount, then
+        |(s + b) / (c + a) - s / c| <= max_overcount / c. The true c is at
+        least the estimate minus max_overcount. Holds with probability about
+        1 - 2 * delta.
+        
+        Args:
+            word (str): Word to look up
+        
+        Returns:
+            float: Bound on |estimated - exact| P(Spam | word), or inf if the
+                word is too rare for the sketch to bound
+        """
+        overcount = self.max_overcount
+        if overcount == 0:
+            return 0.0
+        
+        floor = self.counts(word)[1] - overcount
+        return min(overcount / floor, 1.0) if floor > 0 else math.inf
+    
+    def probabilities(self, min_count=1):
+        """
+        Run calculate_spam_probability() for every tracked heavy hitter.
+        
+        Args:
+            min_count (int): Skip words estimated to be in fewer emails than
+                this (default: 1)
+        
+        Returns:
+            dict: word -> probability dictionary, as returned by
+                calculate_spam_probability()
+        """
+        if self.total_emails == 0:
+            return {}
+        
+        probabilities = {}
+        for word in self._heavy:
+            counts = self.counts(word)
+            if counts[1] >= min_count:
+                probabilities[word] = calculate_spam_probability(*counts)
+        return probabilities
+    
+    def most_common(self, n=None):
+        """
+        The tracked heavy hitters, most frequent first.
+        
+        Args:
+            n (int): Number of words to return (default: None, all tracked)
+        
+        Returns:
+            list: (word, estimated emails containing the word) pairs
+        """
+        ranked = sorted(self._heavy.items(), key=lambda item: item[1], reverse=True)
+        return ranked if n is None else ranked[:n]
@@ -0,0 +1,277 @@
+"""
+Memory-Mapped Spam Log-Odds Table
+=================================
+
+Score messages with one table lookup per word instead of recomputing
+calculate_spam_probability() from the training counts.
+
+export_table() turns a trained SpamWordCounts or SketchSpamCounts into a
+compact binary file holding, for every word, the log-odds of P(Spam | word).
+LogOddsTable memory-maps that file and binary-searches it, so opening a table
+reads nothing but the header, and every process that opens the same file
+shares one copy of it through the operating system's page cache.
+
+File layout (little-endian):
+    header   32 bytes   magic b'SPAMLO01', word count (uint64),
+                        prior log-odds (float64), 8 reserved bytes
+    hashes   8n bytes   64-bit BLAKE2b hashes of the words, sorted (uint64)
+    values   4n bytes   log-odds of P(Spam | word), in hash order (float32)
+
+Words are stored only as hashes; if two words' hashes collide (for ten
+million words, a few chances in a million) they share the entry of the more
+frequent one.
+
+Usage:
+    from spam_corpus import ingest
+    from spam_table import LogOddsTable, export_table
+    
+    export_table(ingest("train.jsonl"), "spam.table", min_count=5)
+    with LogOddsTable("spam.table") as table:
+        table.probability("Claim your FREE prize now")
+
+Author: GitHub Copilot
+Date: July 27, 2025
+"""
+
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from hashlib import blake2b
+
+from spam_corpus import tokenize
+
+
+MAGIC = b'SPAMLO01'
+_HEADER = struct.Struct('<8sQd8x')
+
+
+def word_hash(word):
+    """
+    64-bit hash of a word as stored in the table.
+    
+    Args:
+        word (str): Word to hash
+    
+    Returns:
+        int: Unsigned 64-bit hash
+    """
+    return int.from_bytes(blake2b(word.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _log_odds(positive, negative, alpha):
+    """Smoothed log(positive / negative)."""
+    return math.log((positive + alpha) / (negative + alpha))
+
+
+def export_table(counts, path, min_count=1, alpha=1.0):
+    """
+    Write the per-word log-odds of P(Spam | word) to a table file.
+    
+    For a word found in n emails, s of them spam, the stored value is
+    log((s + alpha) / (n - s + alpha)): the log-odds of the
+    p_spam_given_free value of calculate_spam_probability(), with alpha added
+    to both counts so that words seen only in spam or only in ham still get
+    finite weights. The file is written to a temporary name and renamed into
+    place, so processes reading the old table are never disturbed.
+    
+    Args:
+        counts: Trained SpamWordCounts or SketchSpamCounts
+        path (str): Output file
+        min_count (int): Leave out words found in fewer emails than this
+            (default: 1)
+        alpha (float): Smoothing added to the spam and ham counts
+            (default: 1.0)
+    
+    Returns:
+        int: Number of words written
+    
+    Raises:
+        ValueError: If alpha is not positive or no messages have been counted
+    """
+    if alpha <= 0:
+        raise ValueError("alpha must be positive")
+    if counts.total_emails == 0:
+        raise ValueError("No messages have been counted")
+    
+    entries = {}
+    for word in counts.probabilities(min_count=min_count):
+        _, with_word, _, spam_and_word = counts.counts(word)
+        key = word_hash(word)
+        # On a hash collision keep the word with the most evidence
+        if key not in entries or with_word > entries[key][0]:
+            entries[key] = (with_word, _log_odds(spam_and_word, with_word - spam_and_word, alpha))
+    
+    keys = sorted(entries)
+    hashes = array('Q', keys)
+    values = array('f', [entries[key][1] for key in keys])
+    if sys.byteorder != 'little':
+        hashes.byteswap()
+        values.byteswap()
+    
+    prior = _log_odds(counts.spam_emails, counts.total_emails - counts.spam_emails, alpha)
+    temporary = f"{path}.tmp{os.getpid()}"
+    with open(temporary, 'wb') as handle:
+        handle.write(_HEADER.pack(MAGIC, len(keys), prior))
+        hashes.tofile(handle)
+        values.tofile(handle)
+    os.replace(temporary, path)
+    return len(keys)
+
+
+class LogOddsTable:
+    """
+    Read-only, memory-mapped view of a table written by export_table().
+    
+    Lookups binary-search the sorted hash column directly in the mapped file,
+    so nothing is deserialised and untouched pages are never read. A table
+    pickles as its path, so it can be handed to worker processes, which
+    reopen (and share) the same mapping.
+    
+    Messages are scored like naive Bayes: the prior log-odds of spam plus,
+    for every distinct known word, how far that word's log-odds move away
+    from the prior. Unknown words contribute nothing.
+    
+    Attributes:
+        path (str): Table file
+        prior_log_odds (float): log-odds of P(Spam) in the training corpus
+    
+    Examples:
+        >>> import os, tempfile
+        >>> from spam_corpus import SpamWordCounts
+        >>> counts = SpamWordCounts()
+        >>> counts.add_message("free money", is_spam=True)
+        >>> counts.add_message("free lunch", is_spam=False)
+        >>> path = os.path.join(tempfile.mkdtemp(), 'spam.table')
+        >>> export_table(counts, path)
+        3
+        >>> with LogOddsTable(path) as table:
+        ...     round(table.log_odds('money'), 4), table.log_odds('free'), table.log_odds('unseen')
+        (0.6931, 0.0, None)
+    """
+    
+    def __init__(self, path):
+        """
+        Map a table file.
+        
+        Args:
+            path (str): File written by export_table()
+        
+        Raises:
+            ValueError: If the file is not a log-odds table
+        """
+        self.path = path
+        with open(path, 'rb') as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"{path} is not a spam log-odds table")
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        magic, length, prior = _HEADER.unpack_from(self._map)
+        if magic != MAGIC or size != _HEADER.size + 12 * length:
+            self._map.close()
+            raise ValueError(f"{path} is not a spam log-odds table")
+        if sys.byteorder != 'little':
+            self._map.close()
+            raise ValueError("Log-odds tables can only be mapped on little-endian machines")
+        
+        self.prior_log_odds = prior
+        view = memoryview(self._map)
+        start = _HEADER.size
+        self._hashes = view[start:start + 8 * length].cast('Q')
+        self._values = view[start + 8 * length:].cast('f')
+    
+    def __reduce__(self):
+        return LogOddsTable, (self.path,)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def __len__(self):
+        return len(self._hashes)
+    
+    def __contains__(self, word):
+        return self._find(word) is not None
+    
+    def __repr__(self):
+        return f"LogOddsTable({self.path!r}, words={len(self)})"
+    
+    def close(self):
+        """Release the memory map."""
+        if self._map is not None:
+            self._hashes.release()
+            self._values.release()
+            self._map.close()
+            self._map = None
+    
+    def _find(self, word):
+        """Position of word in the table, or None."""
+        key = word_hash(word)
+        hashes = self._hashes
+        position = bisect_left(hashes, key)
+        if position < len(hashes) and hashes[position] == key:
+            return position
+        return None
+    
+    def log_odds(self, word):
+        """
+        Stored log-odds of P(Spam | word).
+        
+        Args:
+            word (str): Word to look up
+        
+        Returns:
+            float: log-odds, or None if the word is not in the table
+        """
+        position = self._find(word)
+        return None if position is None else self._values[position]
+    
+    def score(self, message, tokenizer=tokenize):
+        """
+        Log-odds that a message is spam.
+        
+        Args:
+            message: Message text, or an iterable of its distinct words
+            tokenizer (callable): Function returning the distinct words of a
+                message, used when message is a string (default: tokenize)
+        
+        Returns:
+            float: log(P(Spam | message) / P(Ham | message))
+        """
+        words = tokenizer(message) if isinstance(message, str) else message
+        hashes = self._hashes
+        values = self._values
+        length = len(hashes)
+        prior = self.prior_log_odds
+        
+        total = prior
+        for word in words:
+            key = word_hash(word)
+            position = bisect_left(hashes, key)
+            if position < length and hashes[position] == key:
+                total += values[position] - prior
+        return total
+    
+    def probability(self, message, tokenizer=tokenize):
+        """
+        P(Spam | message), the logistic function of score().
+        
+        Args:
+            message: Message text, or an iterable of its distinct words
+            tokenizer (callable): Function returning the distinct words of a
+                message (default: tokenize)
+        
+        Returns:
+            float: Probability between 0 and 1
+        """
+        score = self.score(message, tokenizer)
+        if score >= 0:
+            return 1 / (1 + math.exp(-score))
+        odds = math.exp(score)
+        return odds / (1 + odds)
@@ -3,8 +3,21 @@ Test file for email spam probability calculations.
 Tests the Bayes' Theorem implementation with known examples.
 """
 
-from spam_calculator import calculate_spam_probability
+from spam_calculator import (SCENARIO_COLUMNS, calculate_spam_probability, run_batch, validate_input,
+                             validate_logical_constraints)
+from spam_corpus import SpamWordCounts, WordCountTable, ingest, iter_messages, plan_shards, tokenize
+from spam_corpus import main as corpus_main
+from spam_sketch import CountMinSketch, SketchSpamCounts
+from spam_table import LogOddsTable, export_table
+import contextlib
+import csv
+import io
+import json
 import math
+import os
+import pickle
+import random
+import tempfile
 
 
 def test_default_example():
@@ -133,6 +146,352 @@ def test_manual_calculation():
     print()
 
 
+# Small labelled corpus shared by the streaming tests: (is_spam, text)
+CORPUS = [
+    (True, "FREE money, claim your free prize now"),
+    (True, "Free offer: cheap pills"),
+    (True, "Win money fast"),
+    (False, "Lunch is free today"),
+    (False, "Meeting notes attached"),
+    (False, "Are you free for a call?"),
+    (False, "Quarterly report and meeting agenda"),
+]
+
+
+def write_corpus(directory):
+    """Write CORPUS as mbox, JSONL and CSV files and return their paths."""
+    mbox_path = os.path.join(directory, "corpus.mbox")
+    with open(mbox_path, "w") as handle:
+        for is_spam, text in CORPUS:
+            handle.write("From sender@example.com Mon Jan  1 00:00:00 2024\n")
+            handle.write(f"X-Spam-Flag: {'YES' if is_spam else 'NO'}\n")
+            handle.write("Subject: message\n\n")
+            handle.write(f"{text}\n\n")
+    
+    jsonl_path = os.path.join(directory, "corpus.jsonl")
+    with open(jsonl_path, "w") as handle:
+        for is_spam, text in CORPUS:
+            handle.write(json.dumps({"label": "spam" if is_spam else "ham", "text": text}) + "\n")
+    
+    csv_path = os.path.join(directory, "corpus.csv")
+    with open(csv_path, "w", newline="") as handle:
+        handle.write("label,text\n")
+        for is_spam, text in CORPUS:
+            handle.write(f'{int(is_spam)},"{text}"\n')
+    
+    return mbox_path, jsonl_path, csv_path
+
+
+def test_streaming_corpus():
+    """Test single-pass corpus counting against hand-counted values."""
+    print("Testing Streaming Corpus Counter:")
+    print("-" * 33)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_corpus(directory)
+        
+        # Every format yields the same labelled messages
+        jsonl_messages = list(iter_messages(paths[1]))
+        assert jsonl_messages == CORPUS, "JSONL reader mismatch"
+        assert list(iter_messages(paths[2])) == CORPUS, "CSV reader mismatch"
+        mbox_labels = [is_spam for is_spam, text in iter_messages(paths[0])]
+        assert mbox_labels == [is_spam for is_spam, text in CORPUS], "mbox labels mismatch"
+        
+        for path in paths:
+            counts = ingest(path)
+            # "free" appears in 4 of the 7 emails, 2 of them spam
+            assert counts.counts("free") == (7, 4, 3, 2), f"counts mismatch for {path}"
+            
+            probabilities = counts.probabilities()
+            expected = calculate_spam_probability(7, 4, 3, 2)
+            assert probabilities["free"] == expected, f"probability mismatch for {path}"
+            print(f"{os.path.basename(path)}: P(Spam | free) = {probabilities['free']['p_spam_given_free']:.4f} ✓")
+        
+        # Several files accumulate into one table
+        combined = ingest(list(paths[1:]))
+        assert combined.counts("money") == (14, 4, 6, 4), "multi-file counts mismatch"
+        print("Multiple files combined ✓")
+        
+        # Long bodies are read without changing the process-wide csv limit
+        long_path = os.path.join(directory, "long.csv")
+        with open(long_path, "w", newline="") as handle:
+            handle.write(f'label,text\n1,"{"free " * 100_000}"\n0,lunch\n')
+        limit = csv.field_size_limit()
+        messages = iter_messages(long_path)
+        assert len(next(messages)[1]) == 500_000, "long field truncated"
+        assert csv.field_size_limit() == limit, "csv field size limit changed while reading"
+        assert list(messages) == [(False, "lunch")] and csv.field_size_limit() == limit
+        try:
+            list(iter_messages(long_path, max_field_size=1000))
+            assert False, "field above max_field_size accepted"
+        except csv.Error:
+            pass
+        assert csv.field_size_limit() == limit, "csv field size limit not restored after an error"
+        print("Long CSV fields read, csv field size limit left unchanged ✓")
+    
+    # A word is counted once per message
+    assert tokenize("Free FREE free!") == {"free"}, "tokenize should deduplicate"
+    
+    # A capped table never exceeds max_words and reports how far counts may be off
+    capped = SpamWordCounts(max_words=4)
+    exact = SpamWordCounts()
+    for is_spam, text in CORPUS:
+        capped.add_message(text, is_spam)
+        exact.add_message(text, is_spam)
+        assert len(capped) <= 4, "max_words exceeded"
+    assert capped.max_undercount > 0, "pruning should be reported"
+    for word in capped.word_counts:
+        _, with_word, _, spam_and_word = capped.counts(word)
+        _, exact_with, _, exact_spam = exact.counts(word)
+        assert exact_with - capped.max_undercount <= with_word <= exact_with, "undercount bound violated"
+        assert exact_spam - capped.max_undercount <= spam_and_word <= exact_spam, "undercount bound violated"
+    print(f"Vocabulary capped at 4 words, undercount ≤ {capped.max_undercount} ✓")
+    
+    print("✓ Streaming corpus tests passed!")
+    print()
+
+
+def test_parallel_corpus():
+    """Test that sharded, multi-process counting matches a single pass."""
+    print("Testing Parallel Corpus Counting:")
+    print("-" * 33)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_corpus(directory)
+        
+        # Byte-range shards cover every message exactly once, wherever they are cut
+        for path in paths[:2]:
+            expected = list(iter_messages(path))
+            for shard_bytes in (1, 7, 40, 64, 10 ** 6):
+                messages = []
+                for shard_path, corpus_format, start, end in plan_shards(path, shard_bytes=shard_bytes):
+                    messages.extend(iter_messages(shard_path, corpus_format, start=start, end=end))
+                assert messages == expected, f"shards of {shard_bytes} bytes lost or repeated messages"
+            print(f"{os.path.basename(path)}: byte-range shards ✓")
+        
+        # CSV files are never split
+        assert len(plan_shards(paths[2], shard_bytes=1)) == 1, "CSV should be one shard"
+        
+        single = ingest(list(paths))
+        parallel = ingest(list(paths), workers=2, shard_bytes=64)
+        assert parallel == single, "parallel counts differ from single-process counts"
+        assert parallel.probabilities() == single.probabilities(), "parallel probabilities differ"
+        print(f"2 workers, {len(plan_shards(list(paths), shard_bytes=64))} shards: identical to single pass ✓")
+    
+    # Merging is associative
+    tables = []
+    for is_spam, text in CORPUS:
+        table = SpamWordCounts()
+        table.add_message(text, is_spam)
+        tables.append(table)
+    left = (tables[0] + tables[1]) + tables[2]
+    right = tables[0] + (tables[1] + tables[2])
+    assert left == right, "merge is not associative"
+    print("Merge is associative ✓")
+    
+    print("✓ Parallel corpus tests passed!")
+    print()
+
+
+def zipf_corpus(num_messages, seed=0):
+    """Messages with Zipf-distributed words plus one unique junk token each."""
+    rng = random.Random(seed)
+    vocabulary = [f"word{rank}" for rank in range(2000)]
+    weights = [1 / (rank + 1) for rank in range(2000)]
+    messages = []
+    for number in range(num_messages):
+        is_spam = rng.random() < 0.4
+        # Spam leans towards the odd-ranked words
+        words = rng.choices(vocabulary, weights, k=30)
+        if is_spam:
+            words += rng.choices(vocabulary[1::2], weights[1::2], k=10)
+        messages.append((is_spam, " ".join(words) + f" junk{number:x}"))
+    return messages
+
+
+def test_count_min_sketch():
+    """Test the fixed-memory sketch against exact counts."""
+    print("Testing Count-Min Sketch Counts:")
+    print("-" * 32)
+    
+    sketch = CountMinSketch(epsilon=0.01, delta=0.01)
+    assert (sketch.width, sketch.depth) == (272, 5), "sketch dimensions mismatch"
+    sketch.add("free", 3)
+    assert sketch.estimate("free") == 3, "single item should be exact"
+    
+    messages = zipf_corpus(3000)
+    exact = SpamWordCounts().update(messages)
+    approximate = SketchSpamCounts(epsilon=0.001, delta=0.01, heavy_hitters=100)
+    table_size = len(approximate.word_sketch.table)
+    approximate.update(messages)
+    
+    # Memory is fixed however many distinct words arrive
+    assert len(approximate.word_sketch.table) == table_size, "sketch grew"
+    assert len(approximate) == 100, "heavy hitters not capped"
+    print(f"{len(exact):,} distinct words in {table_size:,} counters per sketch ✓")
+    
+    # Estimates are never low and (with probability 1 - delta) at most max_overcount high
+    overcount = approximate.max_overcount
+    for word, _ in approximate.most_common():
+        _, exact_with, _, exact_spam = exact.counts(word)
+        _, with_word, _, spam_and_word = approximate.counts(word)
+        assert exact_with <= with_word <= exact_with + overcount, f"count bound violated for {word}"
+        assert exact_spam <= spam_and_word <= exact_spam + overcount, f"spam count bound violated for {word}"
+    
+    # The most frequent words are all tracked, with P(Spam | word) within the stated bound
+    top_words = [word for word, _ in exact.word_counts.most_common(20)]
+    probabilities = approximate.probabilities()
+    worst = 0.0
+    for word in top_words:
+        assert word in probabilities, f"heavy hitter {word} not tracked"
+        error = abs(probabilities[word]["p_spam_given_free"] - exact.probability(word)["p_spam_given_free"])
+        bound = approximate.error_bound(word)
+        assert error <= bound, f"P(Spam | {word}) error {error} exceeds bound {bound}"
+        worst = max(worst, error)
+    assert approximate.error_bound(top_words[0]) < 0.05, "bound too loose for the most frequent word"
+    print(f"Top 20 words tracked, largest P(Spam | word) error {worst:.4f} ✓")
+    
+    # Sketches merge exactly, including through parallel ingest()
+    halves = SketchSpamCounts(0.001, 0.01, 100).update(messages[:1500])
+    halves.merge(SketchSpamCounts(0.001, 0.01, 100).update(messages[1500:]))
+    assert halves == approximate, "merged sketch differs from single pass"
+    
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_corpus(directory)
+        single = ingest(list(paths), table=SketchSpamCounts(epsilon=0.01))
+        parallel = ingest(list(paths), workers=2, shard_bytes=64, table=SketchSpamCounts(epsilon=0.01))
+        assert parallel == single, "parallel sketch differs from single pass"
+        assert parallel.counts("free") == (21, 12, 9, 6), "sketch counts on the small corpus"
+    print("Merged and parallel sketches match a single pass ✓")
+    
+    # Both tables share the message-level methods
+    assert isinstance(approximate, WordCountTable) and isinstance(exact, WordCountTable)
+    assert approximate.probability("free") == calculate_spam_probability(*approximate.counts("free"))
+    
+    # The sketch has fixed memory, so a vocabulary cap is a usage error
+    with contextlib.redirect_stderr(io.StringIO()) as stderr:
+        try:
+            corpus_main(["corpus.jsonl", "--sketch-epsilon", "0.001", "--max-words", "1000"])
+            assert False, "--max-words accepted with --sketch-epsilon"
+        except SystemExit as error:
+            assert error.code == 2, "expected a usage error"
+    assert "--max-words" in stderr.getvalue(), "usage error should name the option"
+    print("--max-words with --sketch-epsilon rejected ✓")
+    
+    print("✓ Count-Min Sketch tests passed!")
+    print()
+
+
+def test_log_odds_table():
+    """Test exporting and scoring with the memory-mapped log-odds table."""
+    print("Testing Log-Odds Table:")
+    print("-" * 23)
+    
+    counts = SpamWordCounts().update(CORPUS)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "spam.table")
+        written = export_table(counts, path)
+        assert written == len(counts), "every word should be exported"
+        assert os.path.getsize(path) == 32 + 12 * written, "unexpected file size"
+        
+        with LogOddsTable(path) as table:
+            # "free": 4 emails, 2 spam -> log((2 + 1) / (2 + 1)) = 0
+            assert table.log_odds("free") == 0.0, "log-odds of 'free' mismatch"
+            # "money": 2 emails, both spam -> log(3 / 1)
+            assert abs(table.log_odds("money") - math.log(3)) < 1e-6, "log-odds of 'money' mismatch"
+            assert table.log_odds("unseen") is None and "unseen" not in table, "unknown word found"
+            
+            # A message scores the prior plus each known word's shift from it
+            prior = math.log((3 + 1) / (4 + 1))
+            expected = prior + (math.log(3) - prior) + (table.log_odds("meeting") - prior)
+            assert abs(table.score("money meeting unseen") - expected) < 1e-6, "score mismatch"
+            print(f"P(Spam | 'claim your free prize') = {table.probability('claim your free prize'):.4f}")
+            assert table.probability("claim your free prize") > 0.5, "spam message scored as ham"
+            assert table.probability("meeting agenda") < 0.5, "ham message scored as spam"
+            
+            # Tables pickle as their path and reopen in the receiving process
+            copy = pickle.loads(pickle.dumps(table))
+            assert copy.score("free money") == table.score("free money"), "pickled table differs"
+            copy.close()
+        print(f"{written} words exported and scored ✓")
+        
+        # Other files are rejected rather than misread
+        bogus = os.path.join(directory, "bogus.table")
+        with open(bogus, "wb") as handle:
+            handle.write(b"not a table at all, not even close")
+        try:
+            LogOddsTable(bogus)
+            assert False, "bogus file accepted"
+        except ValueError:
+            print("Invalid file rejected ✓")
+    
+    print("✓ Log-odds table tests passed!")
+    print()
+
+
+def test_batch_scenarios():
+    """Test the vectorised batch mode against the scalar functions."""
+    print("Testing Batch Scenarios:")
+    print("-" * 24)
+    
+    rng = random.Random(1)
+    scenarios = [(1000, 300, 400, 120), (0, 0, 0, 0), (100, 0, 0, 0), (100, 50, 20, 30)]
+    for _ in range(200):
+        total = rng.randint(1, 50)
+        with_word = rng.randint(0, total + 1)
+        spam = rng.randint(0, total + 1)
+        scenarios.append((total, with_word, spam, rng.randint(-1, min(with_word, spam) + 1)))
+    
+    text = "spam,total,both,with_word\n" + "".join(f"{s},{t},{b},{w}\n" for t, w, s, b in scenarios)
+    output = io.StringIO()
+    # A small chunk size exercises the chunk boundaries
+    rows, invalid = run_batch(io.StringIO(text), output, chunk_size=7)
+    
+    lines = output.getvalue().splitlines()
+    assert lines[0].split(",")[4:] == ["p_spam", "p_free", "p_free_given_spam", "p_spam_given_free", "error"], "header mismatch"
+    assert rows == len(scenarios) == len(lines) - 1, "row count mismatch"
+    
+    expected_invalid = 0
+    for scenario, line in zip(scenarios, lines[1:]):
+        fields = line.split(",")
+        assert tuple(map(int, fields[:4])) == scenario, f"inputs not echoed for {scenario}"
+        
+        # Same verdict and message as the interactive validation
+        with contextlib.redirect_stdout(io.StringIO()) as printed:
+            valid = (validate_input(scenario[0], "total_emails", min_value=1)
+                     and all(validate_input(value, name) for value, name in zip(scenario[1:], SCENARIO_COLUMNS[1:]))
+                     and validate_logical_constraints(*scenario))
+        assert valid == (fields[8] == ""), f"validation mismatch for {scenario}: {fields[8]!r}"
+        assert printed.getvalue() == ("" if valid else f"Error: {fields[8]}\n"), \
+            f"message mismatch for {scenario}: {fields[8]!r} vs {printed.getvalue()!r}"
+        
+        if valid:
+            probabilities = calculate_spam_probability(*scenario)
+            assert [float(field) for field in fields[4:8]] == list(probabilities.values()), \
+                f"probabilities mismatch for {scenario}"
+        else:
+            expected_invalid += 1
+            assert fields[4:8] == ["", "", "", ""], "invalid rows should have no probabilities"
+    assert invalid == expected_invalid, "invalid count mismatch"
+    print(f"{rows} scenarios, {invalid} invalid, match the scalar functions ✓")
+    
+    # Headerless input is read positionally, and bad values name their line
+    output = io.StringIO()
+    assert run_batch(io.StringIO("1000,300,400,120\n"), output, precision=4) == (1, 0), "headerless row"
+    assert output.getvalue().splitlines()[1] == "1000,300,400,120,0.4,0.3,0.3,0.4,", "headerless output"
+    try:
+        run_batch(io.StringIO("1000,300,400,120\n10,x,1,1\n"), io.StringIO())
+        assert False, "non-integer value accepted"
+    except ValueError as error:
+        assert str(error) == "line 2, column 2: could not convert string 'x' to int64", \
+            f"error should name the line and column only: {error}"
+    print("Headerless input and error reporting ✓")
+    
+    print("✓ Batch scenario tests passed!")
+    print()
+
+
 def main():
     """Run all tests."""
     print("=" * 50)
@@ -144,6 +503,11 @@ def main():
         test_edge_cases()
         test_mathematical_properties()
         test_manual_calculation()
+        test_batch_scenarios()
+        test_streaming_corpus()
+        test_parallel_corpus()
+        test_count_min_sketch()
+        test_log_odds_table()
         
         print("🎉 ALL TESTS PASSED! 🎉")
         print("\nThe Bayes' Theorem implementation is working correctly!")
@@ -0,0 +1,123 @@
+"""
+MLMath Performance Benchmark
+============================
+
+This script times the pure Python matrix multiplication kernels (naive,
+blocked and Strassen) against each other, and against algorithm='auto' (the
+active backend, e.g. NumPy), over a range of square matrix sizes, and reports
+where the blocked kernel overtakes the naive one and where Strassen overtakes
+the blocked kernel.
+
+Usage:
+    python benchmark_mlmath.py                 # default sizes
+    python benchmark_mlmath.py 16 64 256       # custom sizes
+
+Author: GitHub Copilot
+Date: July 27, 2025
+"""
+
+import random
+import sys
+import os
+import time
+
+# Add the current directory to path to import mlmath
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import mlmath
+
+
+DEFAULT_SIZES = [2, 4, 8, 16, 32, 64, 128, 256]
+
+
+def random_matrix(n, rng):
+    """Create an n×n matrix of random floats."""
+    return [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+
+
+def time_call(func, min_time=0.2):
+    """
+    Time a zero-argument callable, repeating it until min_time has elapsed.
+    
+    Returns:
+        float: Best observed seconds per call
+    """
+    best = float('inf')
+    elapsed = 0.0
+    repeats = 0
+    while elapsed < min_time or repeats < 3:
+        start = time.perf_counter()
+        func()
+        duration = time.perf_counter() - start
+        best = min(best, duration)
+        elapsed += duration
+        repeats += 1
+    return best
+
+
+def benchmark_matrix_multiply(sizes):
+    """Benchmark every matrix multiplication kernel at each size."""
+    print("=" * 70)
+    print("MATRIX MULTIPLICATION BENCHMARK (seconds per multiply)")
+    print("=" * 70)
+    
+    rng = random.Random(42)
+    
+    header = (f"{'n':>5} | {'naive':>10} | {'blocked':>10} | {'speedup':>8} | "
+              f"{'strassen':>10} | {'auto':>10}")
+    print(header)
+    print("-" * len(header))
+    
+    crossover = None
+    strassen_crossover = None
+    
+    # Time the kernels themselves, not the validation pass
+    with mlmath.validation(False):
+        for n in sizes:
+            A = random_matrix(n, rng)
+            B = random_matrix(n, rng)
+            
+            naive = time_call(lambda: mlmath.matrix_multiply(A, B, algorithm='naive'))
+            blocked = time_call(lambda: mlmath.matrix_multiply(A, B, algorithm='blocked'))
+            speedup = naive / blocked
+            
+            if crossover is None and speedup > 1:
+                crossover = n
+            
+            # Use a small leaf so the recursion actually runs at the tested sizes
+            cutoff = max(n // 4, 16)
+            strassen = time_call(lambda: mlmath.matrix_multiply(A, B, algorithm='strassen',
+                                                                strassen_cutoff=cutoff))
+            if strassen_crossover is None and n > cutoff and strassen < blocked:
+                strassen_crossover = n
+            
+            auto = time_call(lambda: mlmath.matrix_multiply(A, B))
+            print(f"{n:>5} | {naive:>10.6f} | {blocked:>10.6f} | {speedup:>7.2f}x | "
+                  f"{strassen:>10.6f} | {auto:>10.6f}")
+    
+    print()
+    if crossover is None:
+        print("Blocked kernel did not overtake the naive kernel at the tested sizes.")
+    else:
+        print(f"Blocked kernel is faster from n = {crossover} upwards.")
+    
+    if strassen_crossover is None:
+        print("Strassen did not overtake the blocked kernel at the tested sizes.")
+    else:
+        print(f"Strassen is faster than the blocked kernel from n = {strassen_crossover}.")
+    print()
+
+
+def main():
+    """Run the benchmarks."""
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    
+    print("MLMath Performance Benchmark")
+    print(f"Active backend: {mlmath.get_backend()}")
+    print()
+    
+    benchmark_matrix_multiply(sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,18 +6,32 @@ A comprehensive library providing essential mathematical functions for machine l
 including vector operations, matrix operations, and probability calculations.
 
 Modules:
-    - vector: Vector operations (dot product, vector addition, etc.)
-    - matrix: Matrix operations (multiplication, transpose, etc.)
+    - vector: Vector type and vector operations (dot product, vector addition, etc.)
+    - matrix: Matrix operations (multiplication, transpose, decompositions, solvers)
     - probability: Probability and statistics functions
+    - sparse: Sparse vector and CSR matrix types for mostly-zero data
+    - naive_bayes: Multinomial and Bernoulli naive Bayes classifiers
+    - config: Library-wide settings such as input validation
+    - backend: Registry of computation backends (pure Python, optional NumPy)
 
 Author: GitHub Copilot
 Version: 1.0.0
 Date: July 27, 2025
 """
 
-from .vector import dot_product, vector_add, vector_subtract, vector_magnitude, vector_normalize
+from .vector import Vector, dot_product, vector_add, vector_subtract, vector_magnitude, vector_normalize
+from .vector import batch_dot, dot_product_many, batch_magnitude, batch_normalize
+from .vector import vector_iadd, vector_isub, axpy
 from .matrix import matrix_multiply, matrix_transpose, matrix_add, matrix_subtract, identity_matrix
+from .matrix import matrix_iadd, matrix_isub, TransposedView
+from .matrix import lu_factor, lu_solve, cholesky, cholesky_solve, qr, solve
 from .probability import conditional_probability, bayes_theorem, joint_probability, marginal_probability
+from .probability import log_bayes, log_joint, logsumexp, log_marginal_probability
+from .probability import LogProbability, LogProbabilities
+from .naive_bayes import MultinomialNB, BernoulliNB
+from .sparse import SparseVector, CSRMatrix
+from .config import set_validation, get_validation, validation
+from .backend import register_backend, set_backend, get_backend, available_backends
 
 # Package metadata
 __version__ = "1.0.0"
@@ -28,11 +42,19 @@ __description__ = "A custom Python library for machine learning mathematics"
 # Define what gets imported when using "from mlmath import *"
 __all__ = [
     # Vector operations
+    'Vector',
     'dot_product',
     'vector_add', 
     'vector_subtract',
     'vector_magnitude',
     'vector_normalize',
+    'batch_dot',
+    'dot_product_many',
+    'batch_magnitude',
+    'batch_normalize',
+    'vector_iadd',
+    'vector_isub',
+    'axpy',
     
     # Matrix operations
     'matrix_multiply',
@@ -40,12 +62,50 @@ __all__ = [
     'matrix_add',
     'matrix_subtract', 
     'identity_matrix',
+    'matrix_iadd',
+    'matrix_isub',
+    'TransposedView',
+    
+    # Linear systems and decompositions
+    'lu_factor',
+    'lu_solve',
+    'cholesky',
+    'cholesky_solve',
+    'qr',
+    'solve',
+    
+    # Sparse types
+    'SparseVector',
+    'CSRMatrix',
     
     # Probability functions
     'conditional_probability',
     'bayes_theorem',
     'joint_probability',
-    'marginal_probability'
+    'marginal_probability',
+    
+    # Log-space probability
+    'log_bayes',
+    'log_joint',
+    'logsumexp',
+    'log_marginal_probability',
+    'LogProbability',
+    'LogProbabilities',
+    
+    # Naive Bayes classifiers
+    'MultinomialNB',
+    'BernoulliNB',
+    
+    # Configuration
+    'set_validation',
+    'get_validation',
+    'validation',
+    
+    # Backends
+    'register_backend',
+    'set_backend',
+    'get_backend',
+    'available_backends'
 ]
 
 def get_version():
@@ -74,11 +134,15 @@ def get_info():
         >>> info = mlmath.get_info()
         >>> print(info['description'])
         A custom Python library for machine learning mathematics
+        >>> info['backend'] in info['available_backends']
+        True
     """
     return {
         'name': 'mlmath',
         'version': __version__,
         'author': __author__,
         'email': __email__,
-        'description': __description__
+        'description': __description__,
+        'backend': get_backend(),
+        'available_backends': available_backends()
     }
@@ -0,0 +1,213 @@
+"""
+NumPy kernels for the mlmath 'numpy' backend.
+
+Importing this module raises ImportError when NumPy is not installed, in which
+case the backend is simply not registered. Kernels receive inputs that the
+public functions have already validated and return results in the same form
+as the pure Python code: Python scalars, lists for list inputs and Vector for
+Vector inputs. Vector storage is shared with NumPy through the buffer
+protocol, so Vector operands are never copied on the way in.
+
+Lists are always converted to float64, like Vector storage: NumPy would
+otherwise store Python ints as int64 and silently wrap around where the pure
+Python code is exact, while float64 stays within rounding of it.
+"""
+
+from array import array
+
+import numpy as np
+
+from . import vector as _vector_module
+
+# Below this many elements (or multiply-adds) list conversion costs more than it saves
+MIN_SIZE = 256
+
+
+def _as_ndarray(a) -> np.ndarray:
+    """View a Vector's storage without copying, or convert a list to float64."""
+    if isinstance(a, _vector_module.Vector):
+        return np.frombuffer(a.data, dtype=np.float64)
+    return np.asarray(a, dtype=np.float64)
+
+
+def _as_vector(result: np.ndarray):
+    """Copy a 1-D NumPy result into a new Vector."""
+    data = array('d')
+    data.frombytes(memoryview(np.ascontiguousarray(result, dtype=np.float64)).cast('B'))
+    return _vector_module.Vector._from_array(data)
+
+
+def _vector_result(result: np.ndarray, *operands):
+    """Return a Vector if any operand was a Vector, otherwise a list."""
+    if any(isinstance(a, _vector_module.Vector) for a in operands):
+        return _as_vector(result)
+    return result.tolist()
+
+
+def _as_matrix(rows) -> np.ndarray:
+    """Convert a list of lists or Vectors to a 2-D float64 array."""
+    if rows and isinstance(rows[0], _vector_module.Vector):
+        return np.stack([_as_ndarray(row) for row in rows])
+    return np.asarray(rows, dtype=np.float64)
+
+
+def dot_product(a, b):
+    return np.dot(_as_ndarray(a), _as_ndarray(b)).item()
+
+
+def vector_add(a, b):
+    return _vector_result(np.add(_as_ndarray(a), _as_ndarray(b)), a, b)
+
+
+def vector_subtract(a, b):
+    return _vector_result(np.subtract(_as_ndarray(a), _as_ndarray(b)), a, b)
+
+
+def _write_list(out: list, result: np.ndarray) -> list:
+    """Replace the contents of a list with a 1-D result (Vectors are written in place instead)."""
+    out[:] = result.tolist()
+    return out
+
+
+def vector_add_out(a, b, out):
+    if isinstance(out, _vector_module.Vector):
+        np.add(_as_ndarray(a), _as_ndarray(b), out=np.frombuffer(out.data, dtype=np.float64))
+        return out
+    return _write_list(out, np.add(_as_ndarray(a), _as_ndarray(b)))
+
+
+def vector_subtract_out(a, b, out):
+    if isinstance(out, _vector_module.Vector):
+        np.subtract(_as_ndarray(a), _as_ndarray(b), out=np.frombuffer(out.data, dtype=np.float64))
+        return out
+    return _write_list(out, np.subtract(_as_ndarray(a), _as_ndarray(b)))
+
+
+def axpy(alpha, x, y):
+    if isinstance(y, _vector_module.Vector):
+        target = np.frombuffer(y.data, dtype=np.float64)
+        target += alpha * _as_ndarray(x)
+        return y
+    return _write_list(y, alpha * _as_ndarray(x) + _as_ndarray(y))
+
+
+def vector_magnitude(a):
+    data = _as_ndarray(a)
+    return float(np.sqrt(np.dot(data, data)))
+
+
+def vector_normalize(a):
+    data = _as_ndarray(a)
+    return _vector_result(data / np.sqrt(np.dot(data, data)), a)
+
+
+def batch_dot(A, B):
+    return _as_vector(np.einsum('ij,ij->i', _as_matrix(A), _as_matrix(B)))
+
+
+def dot_product_many(q, M):
+    return _as_vector(_as_matrix(M) @ _as_ndarray(q))
+
+
+def batch_magnitude(M):
+    data = _as_matrix(M)
+    return _as_vector(np.sqrt(np.einsum('ij,ij->i', data, data)))
+
+
+def matrix_multiply(A, B):
+    return (_as_matrix(A) @ _as_matrix(B)).tolist()
+
+
+def matrix_multiply_transposed(A, B, transpose_A, transpose_B):
+    a = _as_matrix(A)
+    b = _as_matrix(B)
+    return ((a.T if transpose_A else a) @ (b.T if transpose_B else b)).tolist()
+
+
+def matrix_add(A, B):
+    return (_as_matrix(A) + _as_matrix(B)).tolist()
+
+
+def matrix_subtract(A, B):
+    return (_as_matrix(A) - _as_matrix(B)).tolist()
+
+
+def _as_operand(value):
+    """Array argument as an ndarray; scalars are left to broadcast."""
+    if isinstance(value, (list, _vector_module.Vector)):
+        return _as_ndarray(value)
+    return value
+
+
+def bayes_theorem(prior, likelihood, evidence):
+    posterior = np.multiply(_as_operand(likelihood), _as_operand(prior)) / _as_operand(evidence)
+    return _as_vector(posterior)
+
+
+def joint_probability(prob_a, prob_b):
+    return _as_vector(np.multiply(_as_operand(prob_a), _as_operand(prob_b)))
+
+
+def log_bayes(log_prior, log_likelihood, log_evidence):
+    numerator = np.add(_as_operand(log_likelihood), _as_operand(log_prior))
+    return _as_vector(np.subtract(numerator, _as_operand(log_evidence)))
+
+
+def log_joint(log_prob_a, log_prob_b):
+    return _as_vector(np.add(_as_operand(log_prob_a), _as_operand(log_prob_b)))
+
+
+def logsumexp(log_values):
+    data = _as_ndarray(log_values).astype(np.float64, copy=False)
+    top = data.max()
+    if np.isinf(top):
+        return float(top)
+    return float(top + np.log(np.exp(data - top).sum()))
+
+
+def cholesky(A):
+    try:
+        return np.linalg.cholesky(np.asarray(A, dtype=np.float64)).tolist()
+    except np.linalg.LinAlgError:
+        raise ValueError("Matrix is not positive definite") from None
+
+
+def qr(A):
+    Q, R = np.linalg.qr(np.asarray(A, dtype=np.float64))
+    return Q.tolist(), R.tolist()
+
+
+def solve(A, b):
+    rhs = _as_ndarray(b) if isinstance(b, _vector_module.Vector) else np.asarray(b, dtype=np.float64)
+    try:
+        x = np.linalg.solve(np.asarray(A, dtype=np.float64), rhs)
+    except np.linalg.LinAlgError:
+        raise ValueError("Matrix is singular") from None
+    return _vector_result(x, b)
+
+
+KERNELS = {
+    'dot_product': dot_product,
+    'vector_add': vector_add,
+    'vector_subtract': vector_subtract,
+    'vector_add_out': vector_add_out,
+    'vector_subtract_out': vector_subtract_out,
+    'axpy': axpy,
+    'vector_magnitude': vector_magnitude,
+    'vector_normalize': vector_normalize,
+    'batch_dot': batch_dot,
+    'dot_product_many': dot_product_many,
+    'batch_magnitude': batch_magnitude,
+    'matrix_multiply': matrix_multiply,
+    'matrix_multiply_transposed': matrix_multiply_transposed,
+    'matrix_add': matrix_add,
+    'matrix_subtract': matrix_subtract,
+    'bayes_theorem': bayes_theorem,
+    'joint_probability': joint_probability,
+    'log_bayes': log_bayes,
+    'log_joint': log_joint,
+    'logsumexp': logsumexp,
+    'cholesky': cholesky,
+    'qr': qr,
+    'solve': solve,
+}
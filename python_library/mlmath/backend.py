@@ -0,0 +1,164 @@
+"""
+Backend Module
+==============
+
+This module provides a registry of computation backends for mlmath.
+
+A backend is a named set of kernels, one per operation (for example
+'dot_product' or 'matrix_multiply'). Public mlmath functions always validate
+their inputs themselves and then ask the active backend for a kernel; if the
+backend does not provide one, or the input is too small to be worth handing
+off, the built-in pure Python implementation is used instead.
+
+Two backends are registered automatically:
+    - 'python': Pure Python implementation (always available, no kernels)
+    - 'numpy': Vectorised NumPy kernels (only registered if NumPy is importable)
+
+NumPy is selected by default when it is available. Set the MLMATH_BACKEND
+environment variable, or call set_backend(), to choose a backend explicitly.
+
+Functions:
+    - register_backend(name, kernels, min_size): Add or replace a backend
+    - set_backend(name): Select the active backend
+    - get_backend(): Get the name of the active backend
+    - available_backends(): List registered backend names
+
+Author: GitHub Copilot
+Date: July 27, 2025
+"""
+
+import os
+from typing import Callable, Dict, List, Optional
+
+# name -> (kernels, min_size)
+_registry: Dict[str, tuple] = {}
+_active_kernels: Dict[str, Callable] = {}
+_active_min_size = 0
+_active_name = 'python'
+
+
+def register_backend(name: str, kernels: Dict[str, Callable], min_size: int = 0) -> None:
+    """
+    Register a computation backend.
+    
+    Each kernel receives the same, already validated, arguments as the public
+    function it replaces and must return a result of the same shape and type
+    (lists for list inputs, Vector for Vector inputs).
+    
+    Args:
+        name (str): Backend name
+        kernels (Dict[str, Callable]): Mapping of operation name to kernel
+        min_size (int): Smallest problem size (element count or multiply-add
+            count) the kernels are used for; smaller inputs stay on the pure
+            Python path where call overhead dominates (default: 0)
+    
+    Raises:
+        TypeError: If name is not a string or kernels is not a dictionary
+        ValueError: If min_size is negative
+    
+    Examples:
+        >>> import mlmath
+        >>> mlmath.register_backend('traced', {'dot_product': lambda a, b: 0})
+        >>> 'traced' in mlmath.available_backends()
+        True
+    """
+    if not isinstance(name, str):
+        raise TypeError("Backend name must be a string")
+    
+    if not isinstance(kernels, dict):
+        raise TypeError("Kernels must be a dictionary")
+    
+    if not isinstance(min_size, int) or min_size < 0:
+        raise ValueError("min_size must be a non-negative integer")
+    
+    _registry[name] = (dict(kernels), min_size)
+    
+    # Re-registering the active backend takes effect immediately
+    if name == _active_name:
+        set_backend(name)
+
+
+def set_backend(name: str) -> None:
+    """
+    Select the backend used by all mlmath operations.
+    
+    Args:
+        name (str): Name of a registered backend
+    
+    Raises:
+        ValueError: If no backend with that name is registered
+    
+    Examples:
+        >>> import mlmath
+        >>> mlmath.set_backend('python')
+        >>> mlmath.get_backend()
+        'python'
+    """
+    global _active_kernels, _active_min_size, _active_name
+    
+    if name not in _registry:
+        raise ValueError(f"Unknown backend '{name}'. Available backends: {available_backends()}")
+    
+    _active_kernels, _active_min_size = _registry[name]
+    _active_name = name
+
+
+def get_backend() -> str:
+    """
+    Get the name of the active backend.
+    
+    Returns:
+        str: Active backend name
+    
+    Example:
+        >>> import mlmath
+        >>> mlmath.get_backend() in mlmath.available_backends()
+        True
+    """
+    return _active_name
+
+
+def available_backends() -> List[str]:
+    """
+    List the names of all registered backends.
+    
+    Returns:
+        List[str]: Registered backend names
+    
+    Example:
+        >>> import mlmath
+        >>> 'python' in mlmath.available_backends()
+        True
+    """
+    return list(_registry)
+
+
+def get_kernel(operation: str, size: int) -> Optional[Callable]:
+    """
+    Look up the active backend's kernel for an operation.
+    
+    Args:
+        operation (str): Operation name, e.g. 'matrix_multiply'
+        size (int): Problem size used to compare against the backend's min_size
+    
+    Returns:
+        Optional[Callable]: The kernel, or None to use the pure Python code
+    """
+    if size < _active_min_size:
+        return None
+    return _active_kernels.get(operation)
+
+
+# Built-in backends
+register_backend('python', {})
+
+try:
+    from ._numpy_backend import KERNELS as _NUMPY_KERNELS, MIN_SIZE as _NUMPY_MIN_SIZE
+except ImportError:
+    pass
+else:
+    register_backend('numpy', _NUMPY_KERNELS, min_size=_NUMPY_MIN_SIZE)
+    set_backend('numpy')
+
+if os.environ.get('MLMATH_BACKEND'):
+    set_backend(os.environ['MLMATH_BACKEND'])
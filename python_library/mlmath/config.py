@@ -0,0 +1,92 @@
+"""
+Configuration Module
+====================
+
+This module holds library-wide settings that control how mlmath functions behave.
+
+Functions:
+    - set_validation(enabled): Turn per-element input validation on or off
+    - get_validation(): Check whether per-element input validation is enabled
+    - validation(enabled): Context manager that temporarily changes validation
+
+Validation is enabled by default. With validation disabled, functions still
+check cheap O(1) properties (argument types, vector lengths, matrix dimension
+compatibility) but skip the O(n) scans that verify every element is numeric
+and every matrix row is a list of the right length. Disable it only for data
+that has already been checked once, for example inside a hot loop over
+inputs that were produced by mlmath itself.
+
+Author: GitHub Copilot
+Date: July 27, 2025
+"""
+
+from contextlib import contextmanager
+
+_validation_enabled = True
+
+
+def set_validation(enabled: bool) -> None:
+    """
+    Enable or disable per-element input validation globally.
+    
+    Args:
+        enabled (bool): True to validate every element (default behaviour),
+            False to trust inputs and skip the element scans
+    
+    Raises:
+        TypeError: If enabled is not a boolean
+    
+    Examples:
+        >>> import mlmath
+        >>> mlmath.set_validation(False)
+        >>> mlmath.get_validation()
+        False
+        >>> mlmath.set_validation(True)
+    """
+    global _validation_enabled
+    
+    if not isinstance(enabled, bool):
+        raise TypeError("Validation flag must be boolean")
+    
+    _validation_enabled = enabled
+
+
+def get_validation() -> bool:
+    """
+    Check whether per-element input validation is enabled.
+    
+    Returns:
+        bool: True if inputs are validated element by element
+    
+    Example:
+        >>> import mlmath
+        >>> mlmath.get_validation()
+        True
+    """
+    return _validation_enabled
+
+
+@contextmanager
+def validation(enabled: bool):
+    """
+    Temporarily enable or disable validation inside a ``with`` block.
+    
+    The previous setting is restored when the block exits, even on error.
+    
+    Args:
+        enabled (bool): Validation setting to use inside the block
+    
+    Examples:
+        >>> import mlmath
+        >>> with mlmath.validation(False):
+        ...     mlmath.dot_product([1, 2], [3, 4])
+        11
+        >>> mlmath.get_validation()
+        True
+    """
+    previous = _validation_enabled
+    set_validation(enabled)
+    try:
+        yield
+    finally:
+        set_validation(previous)
@@ -4,24 +4,135 @@ Matrix Operations Module
 
 This module provides essential matrix operations for machine learning and linear algebra.
 
+Classes:
+    - TransposedView: Zero-copy transpose of a list-of-lists matrix
+
 Functions:
-    - matrix_multiply(A, B): Multiply two matrices
-    - matrix_transpose(A): Transpose a matrix
+    - matrix_multiply(A, B, algorithm, ...): Multiply two matrices
+    - matrix_transpose(A, lazy): Transpose a matrix (optionally as a view)
     - matrix_add(A, B): Add two matrices element-wise
     - matrix_subtract(A, B): Subtract two matrices element-wise
+    - matrix_iadd(A, B), matrix_isub(A, B): In-place A += B, A -= B
     - identity_matrix(n): Create an n×n identity matrix
+    - lu_factor(A), lu_solve(lu_and_piv, b): LU decomposition and solve
+    - cholesky(A), cholesky_solve(L, b): Cholesky decomposition and solve
+    - qr(A): Householder QR decomposition
+    - solve(A, b, method): Solve A·x = b (LU, Cholesky or least-squares QR)
+
+Every function except identity_matrix also accepts CSRMatrix operands (see
+mlmath.sparse); sparse-sparse operations return a CSRMatrix and mixed
+sparse-dense operations return a dense list of lists.
+
+matrix_transpose(A, lazy=True) returns a TransposedView instead of copying A.
+matrix_multiply recognises views and multiplies A^T·B and A·B^T with fused
+kernels that read the underlying matrix row by row, so expressions such as
+X^T·X (normal equations, covariance) never hold a transposed copy of X.
+
+matrix_add and matrix_subtract take an optional ``out`` list of lists whose
+existing rows are overwritten with the result; the in-place variants write
+into A. Iterative algorithms can reuse one buffer instead of allocating a
+new matrix every step.
+
+The solvers factorise A once (O(n³)) and then solve each right-hand side in
+O(n²); pass a matrix b to solve many systems with one factorisation, or keep
+the result of lu_factor/cholesky to reuse it across calls.
+
+After validation, multiply/add/subtract, cholesky, qr and solve hand off to
+the active backend's kernel when one is available (see mlmath.set_backend).
+
+Row-structure and element checks are O(rows × cols) and are skipped while
+validation is disabled (see mlmath.set_validation).
 
 Author: GitHub Copilot
 Date: July 27, 2025
 """
 
-from typing import List, Union
+import math
+import operator
+import sys
+from itertools import repeat
+from typing import Iterator, List, Tuple, Union
+
+from .backend import get_kernel
+from .config import get_validation
+from .sparse import CSRMatrix, sparse_matrix_add, sparse_matrix_multiply, sparse_matrix_subtract
+from .vector import Vector
 
 # Type alias for matrix
 Matrix = List[List[Union[int, float]]]
 
 
-def matrix_multiply(A: Matrix, B: Matrix) -> Matrix:
+class TransposedView:
+    """
+    Read-only transpose of a list-of-lists matrix that shares its storage.
+    
+    Indexing is swapped instead of copied: view[j][i] is base[i][j]. Row j
+    of the view (column j of the base) is built on access, so a view costs
+    O(1) memory. Changes to the base matrix are visible through the view.
+    
+    matrix_multiply reads views through fused kernels that never build the
+    transpose; other mlmath functions materialise them with tolist().
+    
+    Attributes:
+        base (Matrix): The matrix being viewed
+    
+    Examples:
+        >>> from mlmath import matrix_transpose
+        >>> At = matrix_transpose([[1, 2, 3], [4, 5, 6]], lazy=True)
+        >>> At.shape
+        (3, 2)
+        >>> At[2]
+        [3, 6]
+        >>> At.tolist()
+        [[1, 4], [2, 5], [3, 6]]
+    """
+    
+    __slots__ = ('base',)
+    
+    def __init__(self, base: Matrix):
+        self.base = base
+    
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(rows, cols) of the transposed matrix."""
+        return len(self.base[0]), len(self.base)
+    
+    @property
+    def T(self) -> Matrix:
+        """The underlying matrix (the transpose of the view)."""
+        return self.base
+    
+    def tolist(self) -> Matrix:
+        """Materialise the transpose as a new list of lists."""
+        return [list(column) for column in zip(*self.base)]
+    
+    def __len__(self) -> int:
+        return len(self.base[0])
+    
+    def __getitem__(self, j: int) -> List[Union[int, float]]:
+        if not -len(self) <= j < len(self):
+            raise IndexError("TransposedView index out of range")
+        return [row[j] for row in self.base]
+    
+    def __iter__(self) -> Iterator[List[Union[int, float]]]:
+        return (list(column) for column in zip(*self.base))
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TransposedView):
+            return self.base == other.base
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        rows, cols = self.shape
+        return f"TransposedView(shape=({rows}, {cols}))"
+
+
+def matrix_multiply(A: Matrix, B: Matrix, algorithm: str = 'auto', block_size: int = 32,
+                    strassen_cutoff: int = 128) -> Matrix:
     """
     Multiply two matrices using the standard matrix multiplication algorithm.
     
@@ -29,15 +140,33 @@ def matrix_multiply(A: Matrix, B: Matrix) -> Matrix:
     C[i][j] = sum(A[i][k] * B[k][j] for k in range(n))
     
     Args:
-        A (Matrix): First matrix (m × n)
-        B (Matrix): Second matrix (n × p)
+        A (Union[Matrix, TransposedView, CSRMatrix]): First matrix (m × n)
+        B (Union[Matrix, TransposedView, CSRMatrix]): Second matrix (n × p)
+        algorithm (str): Multiplication kernel (default: 'auto')
+            - 'auto': Use the active backend's kernel if it has one, otherwise
+              the pure Python kernel that is fastest for the input size
+            - 'naive': Pure Python i-j-k triple loop
+            - 'blocked': Pure Python kernel that reads B through a one-off
+              transpose (row-wise), block_size columns at a time, with the
+              inner sum running in C
+            - 'strassen': Pure Python Strassen recursion (7 half-size products
+              instead of 8), falling back to 'blocked' below strassen_cutoff
+        block_size (int): Columns of B per panel for the 'blocked' algorithm (default: 32)
+        strassen_cutoff (int): Leaf size for the 'strassen' algorithm; once any
+            dimension is at or below it the blocked kernel is used (default: 128)
+    
+    TransposedView operands are never copied under 'auto' or 'blocked': A^T·B
+    is accumulated over panels of rows of A and B, and A·B^T takes dot
+    products of their rows. 'naive' and 'strassen' materialise views first.
     
     Returns:
-        Matrix: Product matrix (m × p)
+        Union[Matrix, CSRMatrix]: Product matrix (m × p); a CSRMatrix only
+            when both operands are CSRMatrix
     
     Raises:
         TypeError: If inputs are not lists of lists or contain non-numeric values
-        ValueError: If matrices have incompatible dimensions or are empty
+        ValueError: If matrices have incompatible dimensions or are empty,
+            or if algorithm/block_size/strassen_cutoff is invalid
     
     Examples:
         >>> from mlmath import matrix_multiply
@@ -55,7 +184,36 @@ def matrix_multiply(A: Matrix, B: Matrix) -> Matrix:
         >>> B = [[1, 4], [2, 5]]
         >>> matrix_multiply(A, B)
         [[2, 8], [6, 15]]
+        
+        >>> matrix_multiply(A, B, algorithm='blocked', block_size=1)
+        [[2, 8], [6, 15]]
+        
+        >>> X = [[1, 2], [3, 4], [5, 6]]
+        >>> matrix_multiply(matrix_transpose(X, lazy=True), X)
+        [[35, 44], [44, 56]]
     """
+    # Sparse operands use the sparse kernels (algorithm options do not apply)
+    if isinstance(A, CSRMatrix) or isinstance(B, CSRMatrix):
+        return sparse_matrix_multiply(A, B)
+    
+    # Option validation
+    if algorithm not in _MULTIPLY_ALGORITHMS:
+        raise ValueError(f"Unknown algorithm '{algorithm}'. Choose from {list(_MULTIPLY_ALGORITHMS)}")
+    
+    if not isinstance(block_size, int) or block_size <= 0:
+        raise ValueError("block_size must be a positive integer")
+    
+    if not isinstance(strassen_cutoff, int) or strassen_cutoff <= 0:
+        raise ValueError("strassen_cutoff must be a positive integer")
+    
+    # Views are validated and multiplied through the matrices they wrap
+    transpose_A = isinstance(A, TransposedView)
+    transpose_B = isinstance(B, TransposedView)
+    if transpose_A:
+        A = A.base
+    if transpose_B:
+        B = B.base
+    
     # Type and structure validation
     if not isinstance(A, list) or not isinstance(B, list):
         raise TypeError("Both inputs must be lists")
@@ -63,29 +221,19 @@ def matrix_multiply(A: Matrix, B: Matrix) -> Matrix:
     if not A or not B:
         raise ValueError("Matrices cannot be empty")
     
-    if not all(isinstance(row, list) for row in A):
-        raise TypeError("First matrix must be a list of lists")
-    
-    if not all(isinstance(row, list) for row in B):
-        raise TypeError("Second matrix must be a list of lists")
-    
-    # Check for empty rows
-    if any(len(row) == 0 for row in A) or any(len(row) == 0 for row in B):
-        raise ValueError("Matrix rows cannot be empty")
-    
-    # Check matrix dimensions consistency
-    rows_A = len(A)
-    cols_A = len(A[0])
-    rows_B = len(B)
-    cols_B = len(B[0])
+    validate = get_validation()
     
-    # All rows in A must have same length
-    if not all(len(row) == cols_A for row in A):
-        raise ValueError("All rows in first matrix must have the same length")
+    # Check row structure (skipped when validation is disabled)
+    if validate:
+        _check_pair_structure(A, B)
     
-    # All rows in B must have same length
-    if not all(len(row) == cols_B for row in B):
-        raise ValueError("All rows in second matrix must have the same length")
+    # Check matrix dimensions (of the operands as multiplied)
+    rows_A, cols_A = len(A), len(A[0])
+    rows_B, cols_B = len(B), len(B[0])
+    if transpose_A:
+        rows_A, cols_A = cols_A, rows_A
+    if transpose_B:
+        rows_B, cols_B = cols_B, rows_B
     
     # Check compatibility for multiplication
     if cols_A != rows_B:
@@ -94,15 +242,54 @@ def matrix_multiply(A: Matrix, B: Matrix) -> Matrix:
                         f"number of rows in second matrix ({rows_B})")
     
     # Check that all elements are numeric
-    for i, row in enumerate(A):
-        for j, val in enumerate(row):
-            if not isinstance(val, (int, float)):
-                raise TypeError(f"All elements must be numeric. Found non-numeric value in A at [{i}][{j}]")
+    if validate:
+        _check_numeric(A, "in A ")
+        _check_numeric(B, "in B ")
     
-    for i, row in enumerate(B):
-        for j, val in enumerate(row):
-            if not isinstance(val, (int, float)):
-                raise TypeError(f"All elements must be numeric. Found non-numeric value in B at [{i}][{j}]")
+    if transpose_A or transpose_B:
+        return _multiply_views(A, B, transpose_A, transpose_B, algorithm, block_size,
+                               strassen_cutoff)
+    
+    if algorithm == 'auto':
+        # Use the active backend's kernel if it has one
+        kernel = get_kernel('matrix_multiply', rows_A * cols_A * cols_B)
+        if kernel is not None:
+            return kernel(A, B)
+        
+        # Otherwise pick the faster pure Python kernel for this size
+        algorithm = 'blocked' if rows_A * cols_A * cols_B >= _BLOCKED_MIN_WORK else 'naive'
+    
+    if algorithm == 'strassen':
+        return _multiply_strassen(A, B, strassen_cutoff, block_size)
+    if algorithm == 'blocked':
+        return _multiply_blocked(A, B, block_size)
+    return _multiply_naive(A, B)
+
+
+# Pure Python multiplication kernels selectable through matrix_multiply(algorithm=...)
+_MULTIPLY_ALGORITHMS = ('auto', 'naive', 'blocked', 'strassen')
+
+# Multiply-add count from which 'auto' prefers the blocked kernel on the pure
+# Python path (crossover measured with benchmark_mlmath.py, around 6×6×6)
+_BLOCKED_MIN_WORK = 216
+
+# Rows of A and B transposed at a time by the fused A^T·B kernel; large enough
+# that the inner sums run long in C, small enough to bound scratch memory
+_TRANSPOSE_PANEL_ROWS = 256
+
+
+def _multiply_naive(A: Matrix, B: Matrix) -> Matrix:
+    """
+    Textbook i-j-k matrix multiplication on validated inputs.
+    
+    Args:
+        A (Matrix): First matrix (m × n)
+        B (Matrix): Second matrix (n × p)
+    
+    Returns:
+        Matrix: Product matrix (m × p)
+    """
+    rows_A, cols_A, cols_B = len(A), len(A[0]), len(B[0])
     
     # Initialize result matrix with zeros
     result = [[0 for _ in range(cols_B)] for _ in range(rows_A)]
@@ -116,17 +303,237 @@ def matrix_multiply(A: Matrix, B: Matrix) -> Matrix:
     return result
 
 
-def matrix_transpose(A: Matrix) -> Matrix:
+def _multiply_blocked(A: Matrix, B: Matrix, block_size: int) -> Matrix:
+    """
+    Panelled matrix multiplication on validated inputs.
+    
+    The naive kernel reads B[k][j] down a column in its innermost loop, which
+    touches a different row list on every step. Here B is transposed once so
+    each of its columns becomes a contiguous row; the output is then computed
+    one panel of block_size columns at a time, with every row of A run
+    against the whole panel and each entry reduced as
+    sum(map(mul, row, column)) so the k loop runs in C. Products are summed in
+    the same k order as the naive kernel, so results are identical.
+    
+    Args:
+        A (Matrix): First matrix (m × n)
+        B (Matrix): Second matrix (n × p)
+        block_size (int): Columns of B per panel
+    
+    Returns:
+        Matrix: Product matrix (m × p)
+    """
+    return _multiply_rows(A, [list(column) for column in zip(*B)], block_size)
+
+
+def _multiply_rows(A: Matrix, columns_B: Matrix, block_size: int) -> Matrix:
+    """
+    Panelled A·B on validated inputs, given B as a list of its columns.
+    
+    This is the body of the blocked kernel; A·B^T calls it directly with the
+    rows of B, so no transpose is ever built. Each panel of block_size
+    columns is reused by every row of A before the next one is read.
+    
+    Args:
+        A (Matrix): First matrix (m × n)
+        columns_B (Matrix): Columns of the second matrix (p lists of length n)
+        block_size (int): Columns per panel
+    
+    Returns:
+        Matrix: Product matrix (m × p)
+    """
+    rows_A, cols_B = len(A), len(columns_B)
+    result = [[0] * cols_B for _ in range(rows_A)]
+    mul = operator.mul
+    
+    for j_start in range(0, cols_B, block_size):
+        j_end = min(j_start + block_size, cols_B)
+        panel = columns_B[j_start:j_end]
+        
+        for row_A, row_result in zip(A, result):
+            row_result[j_start:j_end] = [sum(map(mul, row_A, column)) for column in panel]
+    
+    return result
+
+
+def _multiply_transposed_a(A: Matrix, B: Matrix) -> Matrix:
+    """
+    Fused A^T·B on validated inputs, reading A and B in row panels.
+    
+    A^T·B is the sum over row panels of A_panel^T·B_panel, so only one panel
+    of _TRANSPOSE_PANEL_ROWS rows of each operand is ever transposed (as
+    tuples of short columns); A^T itself is never built. Tall matrices such
+    as a design matrix X in X^T·X therefore need O(panel × cols) scratch
+    space instead of a full copy. Results match the other kernels exactly
+    when A has at most one panel of rows and to floating-point tolerance
+    otherwise.
+    
+    Args:
+        A (Matrix): Matrix whose transpose is the first operand (n × m)
+        B (Matrix): Second matrix (n × p)
+    
+    Returns:
+        Matrix: Product matrix (m × p)
+    """
+    result = [[0] * len(B[0]) for _ in range(len(A[0]))]
+    add, mul = operator.add, operator.mul
+    
+    for start in range(0, len(A), _TRANSPOSE_PANEL_ROWS):
+        end = start + _TRANSPOSE_PANEL_ROWS
+        columns_B = list(zip(*B[start:end]))
+        for i, column_A in enumerate(zip(*A[start:end])):
+            partial = [sum(map(mul, column_A, column_B)) for column_B in columns_B]
+            result[i] = list(map(add, result[i], partial))
+    
+    return result
+
+
+def _multiply_views(A: Matrix, B: Matrix, transpose_A: bool, transpose_B: bool,
+                    algorithm: str, block_size: int, strassen_cutoff: int) -> Matrix:
+    """
+    Multiply validated matrices where one or both operands are transposed.
+    
+    Args:
+        A (Matrix): First matrix, or the matrix whose transpose is the operand
+        B (Matrix): Second matrix, or the matrix whose transpose is the operand
+        transpose_A (bool): Whether the first operand is A^T
+        transpose_B (bool): Whether the second operand is B^T
+        algorithm (str): Algorithm requested from matrix_multiply
+        block_size (int): Panel width for the blocked kernels
+        strassen_cutoff (int): Leaf size for the Strassen kernel
+    
+    Returns:
+        Matrix: Product matrix
+    """
+    if algorithm in ('naive', 'strassen'):
+        A = [list(column) for column in zip(*A)] if transpose_A else A
+        B = [list(column) for column in zip(*B)] if transpose_B else B
+        if algorithm == 'strassen':
+            return _multiply_strassen(A, B, strassen_cutoff, block_size)
+        return _multiply_naive(A, B)
+    
+    if algorithm == 'auto':
+        rows, inner = (len(A[0]), len(A)) if transpose_A else (len(A), len(A[0]))
+        cols = len(B) if transpose_B else len(B[0])
+        kernel = get_kernel('matrix_multiply_transposed', rows * inner * cols)
+        if kernel is not None:
+            return kernel(A, B, transpose_A, transpose_B)
+    
+    if transpose_A and transpose_B:
+        # A^T·B^T = (B·A)^T
+        return [list(column) for column in zip(*_multiply_blocked(B, A, block_size))]
+    if transpose_B:
+        # The rows of B are the columns of B^T
+        return _multiply_rows(A, B, block_size)
+    return _multiply_transposed_a(A, B)
+
+
+def _multiply_strassen(A: Matrix, B: Matrix, cutoff: int, block_size: int) -> Matrix:
+    """
+    Strassen matrix multiplication on validated inputs.
+    
+    Each level splits A (m×n) and B (n×p) into 2×2 grids of blocks and forms
+    the product from 7 block multiplications instead of 8, giving
+    O(n^2.81) work instead of O(n^3). Odd dimensions are padded with a zero
+    row or column at each level and the padding is cropped from the result,
+    so any shape is supported. Recursion stops once the smallest dimension is
+    at or below cutoff, where the blocked kernel is faster.
+    
+    Strassen uses extra additions and subtractions, so floating-point results
+    can differ from the naive kernel by a few units in the last place.
+    
+    Args:
+        A (Matrix): First matrix (m × n)
+        B (Matrix): Second matrix (n × p)
+        cutoff (int): Leaf size below which the blocked kernel is used
+        block_size (int): Panel width passed to the blocked kernel
+    
+    Returns:
+        Matrix: Product matrix (m × p)
+    """
+    rows_A, cols_A, cols_B = len(A), len(A[0]), len(B[0])
+    if min(rows_A, cols_A, cols_B) <= cutoff:
+        return _multiply_blocked(A, B, block_size)
+    
+    # Pad odd dimensions with zeros so every dimension splits in half
+    rows_half = (rows_A + 1) // 2
+    inner_half = (cols_A + 1) // 2
+    cols_half = (cols_B + 1) // 2
+    A = _pad(A, 2 * rows_half, 2 * inner_half)
+    B = _pad(B, 2 * inner_half, 2 * cols_half)
+    
+    # Split into quadrants
+    A11, A12, A21, A22 = _split(A, rows_half, inner_half)
+    B11, B12, B21, B22 = _split(B, inner_half, cols_half)
+    
+    # The seven Strassen products
+    def recurse(X, Y):
+        return _multiply_strassen(X, Y, cutoff, block_size)
+    
+    M1 = recurse(_add(A11, A22), _add(B11, B22))
+    M2 = recurse(_add(A21, A22), B11)
+    M3 = recurse(A11, _sub(B12, B22))
+    M4 = recurse(A22, _sub(B21, B11))
+    M5 = recurse(_add(A11, A12), B22)
+    M6 = recurse(_sub(A21, A11), _add(B11, B12))
+    M7 = recurse(_sub(A12, A22), _add(B21, B22))
+    
+    # Combine into the result quadrants
+    C11 = _add(_sub(_add(M1, M4), M5), M7)
+    C12 = _add(M3, M5)
+    C21 = _add(M2, M4)
+    C22 = _add(_add(_sub(M1, M2), M3), M6)
+    
+    # Stitch quadrants together and crop any padding
+    top = [left + right for left, right in zip(C11, C12)]
+    bottom = [left + right for left, right in zip(C21, C22)]
+    return [row[:cols_B] for row in (top + bottom)[:rows_A]]
+
+
+def _pad(A: Matrix, rows: int, cols: int) -> Matrix:
+    """Return A zero-padded to rows × cols (A itself if no padding is needed)."""
+    if len(A) == rows and len(A[0]) == cols:
+        return A
+    extra = cols - len(A[0])
+    padded = [row + [0] * extra for row in A] if extra else list(A)
+    padded.extend([0] * cols for _ in range(rows - len(A)))
+    return padded
+
+
+def _split(A: Matrix, row_half: int, col_half: int):
+    """Split a matrix into its four quadrants (top-left, top-right, bottom-left, bottom-right)."""
+    top, bottom = A[:row_half], A[row_half:]
+    return ([row[:col_half] for row in top], [row[col_half:] for row in top],
+            [row[:col_half] for row in bottom], [row[col_half:] for row in bottom])
+
+
+def _add(A: Matrix, B: Matrix) -> Matrix:
+    """Element-wise sum of two equally sized, validated matrices."""
+    add = operator.add
+    return [list(map(add, row_A, row_B)) for row_A, row_B in zip(A, B)]
+
+
+def _sub(A: Matrix, B: Matrix) -> Matrix:
+    """Element-wise difference of two equally sized, validated matrices."""
+    sub = operator.sub
+    return [list(map(sub, row_A, row_B)) for row_A, row_B in zip(A, B)]
+
+
+def matrix_transpose(A: Matrix, lazy: bool = False) -> Matrix:
     """
     Transpose a matrix (swap rows and columns).
     
     For matrix A (m×n), the transpose A^T is (n×m) where A^T[j][i] = A[i][j]
     
     Args:
-        A (Matrix): Input matrix (m × n)
+        A (Union[Matrix, TransposedView, CSRMatrix]): Input matrix (m × n)
+        lazy (bool): Return a TransposedView that shares A's storage instead
+            of a copy (default: False). Transposing a view returns the matrix
+            it wraps (a copy of it unless lazy is True).
     
     Returns:
-        Matrix: Transposed matrix (n × m)
+        Union[Matrix, TransposedView, CSRMatrix]: Transposed matrix (n × m);
+            a CSRMatrix for CSRMatrix input
     
     Raises:
         TypeError: If input is not a list of lists or contains non-numeric values
@@ -141,7 +548,18 @@ def matrix_transpose(A: Matrix) -> Matrix:
         >>> A = [[1, 2], [3, 4], [5, 6]]
         >>> matrix_transpose(A)
         [[1, 3, 5], [2, 4, 6]]
+        
+        >>> matrix_transpose(A, lazy=True)
+        TransposedView(shape=(2, 3))
     """
+    # Sparse matrices transpose in O(nnz)
+    if isinstance(A, CSRMatrix):
+        return A.transpose()
+    
+    # The transpose of a view is the matrix it wraps
+    if isinstance(A, TransposedView):
+        return A.base if lazy else [list(row) for row in A.base]
+    
     # Type and structure validation
     if not isinstance(A, list):
         raise TypeError("Input must be a list")
@@ -149,39 +567,43 @@ def matrix_transpose(A: Matrix) -> Matrix:
     if not A:
         raise ValueError("Matrix cannot be empty")
     
-    if not all(isinstance(row, list) for row in A):
-        raise TypeError("Matrix must be a list of lists")
-    
-    # Check for empty rows
-    if any(len(row) == 0 for row in A):
-        raise ValueError("Matrix rows cannot be empty")
+    if get_validation():
+        if not all(isinstance(row, list) for row in A):
+            raise TypeError("Matrix must be a list of lists")
+        
+        # Check for empty rows
+        if any(len(row) == 0 for row in A):
+            raise ValueError("Matrix rows cannot be empty")
+        
+        # Check dimensions consistency
+        cols = len(A[0])
+        if not all(len(row) == cols for row in A):
+            raise ValueError("All rows must have the same length")
+        
+        # Check that all elements are numeric
+        _check_numeric(A, "")
     
-    # Check dimensions consistency
-    cols = len(A[0])
-    if not all(len(row) == cols for row in A):
-        raise ValueError("All rows must have the same length")
-    
-    # Check that all elements are numeric
-    for i, row in enumerate(A):
-        for j, val in enumerate(row):
-            if not isinstance(val, (int, float)):
-                raise TypeError(f"All elements must be numeric. Found non-numeric value at [{i}][{j}]")
+    if lazy:
+        return TransposedView(A)
     
     # Create transposed matrix
-    rows = len(A)
-    return [[A[i][j] for i in range(rows)] for j in range(cols)]
+    return [list(column) for column in zip(*A)]
 
 
-def matrix_add(A: Matrix, B: Matrix) -> Matrix:
+def matrix_add(A: Matrix, B: Matrix, out: Matrix = None) -> Matrix:
     """
     Add two matrices element-wise.
     
     Args:
-        A (Matrix): First matrix
-        B (Matrix): Second matrix
+        A (Union[Matrix, CSRMatrix]): First matrix
+        B (Union[Matrix, CSRMatrix]): Second matrix
+        out (Matrix): Optional list of lists of the same shape whose rows are
+            overwritten with the result; it may be A or B itself. Not
+            supported for CSRMatrix operands (default: None)
     
     Returns:
-        Matrix: Sum of the two matrices
+        Union[Matrix, CSRMatrix]: Sum of the two matrices (out if given); a CSRMatrix only
+            when both operands are CSRMatrix
     
     Raises:
         TypeError: If inputs are not lists of lists or contain non-numeric values
@@ -194,25 +616,48 @@ def matrix_add(A: Matrix, B: Matrix) -> Matrix:
         >>> matrix_add(A, B)
         [[6, 8], [10, 12]]
     """
+    # Sparse operands only touch their non-zero entries
+    if isinstance(A, CSRMatrix) or isinstance(B, CSRMatrix):
+        if out is not None:
+            raise TypeError("out is not supported for CSRMatrix operands")
+        return sparse_matrix_add(A, B)
+    
+    # Element-wise operations need the materialised transpose
+    A, B = _materialise(A), _materialise(B)
+    
     # Validate inputs
     _validate_same_dimensions(A, B, "addition")
     
+    # Write into the caller's rows (row-wise map already runs in C)
+    if out is not None:
+        _check_out(out, len(A), len(A[0]))
+        return _write_rows(out, A, B, operator.add)
+    
+    # Use the active backend's kernel if it has one
+    kernel = get_kernel('matrix_add', len(A) * len(A[0]))
+    if kernel is not None:
+        return kernel(A, B)
+    
     # Add matrices element-wise
     rows = len(A)
     cols = len(A[0])
     return [[A[i][j] + B[i][j] for j in range(cols)] for i in range(rows)]
 
 
-def matrix_subtract(A: Matrix, B: Matrix) -> Matrix:
+def matrix_subtract(A: Matrix, B: Matrix, out: Matrix = None) -> Matrix:
     """
     Subtract two matrices element-wise (A - B).
     
     Args:
-        A (Matrix): First matrix (minuend)
-        B (Matrix): Second matrix (subtrahend)
+        A (Union[Matrix, CSRMatrix]): First matrix (minuend)
+        B (Union[Matrix, CSRMatrix]): Second matrix (subtrahend)
+        out (Matrix): Optional list of lists of the same shape whose rows are
+            overwritten with the result; it may be A or B itself. Not
+            supported for CSRMatrix operands (default: None)
     
     Returns:
-        Matrix: Difference of the two matrices
+        Union[Matrix, CSRMatrix]: Difference of the two matrices (out if given); a CSRMatrix
+            only when both operands are CSRMatrix
     
     Raises:
         TypeError: If inputs are not lists of lists or contain non-numeric values
@@ -225,15 +670,119 @@ def matrix_subtract(A: Matrix, B: Matrix) -> Matrix:
         >>> matrix_subtract(A, B)
         [[4, 4], [4, 4]]
     """
+    # Sparse operands only touch their non-zero entries
+    if isinstance(A, CSRMatrix) or isinstance(B, CSRMatrix):
+        if out is not None:
+            raise TypeError("out is not supported for CSRMatrix operands")
+        return sparse_matrix_subtract(A, B)
+    
+    # Element-wise operations need the materialised transpose
+    A, B = _materialise(A), _materialise(B)
+    
     # Validate inputs
     _validate_same_dimensions(A, B, "subtraction")
     
+    # Write into the caller's rows (row-wise map already runs in C)
+    if out is not None:
+        _check_out(out, len(A), len(A[0]))
+        return _write_rows(out, A, B, operator.sub)
+    
+    # Use the active backend's kernel if it has one
+    kernel = get_kernel('matrix_subtract', len(A) * len(A[0]))
+    if kernel is not None:
+        return kernel(A, B)
+    
     # Subtract matrices element-wise
     rows = len(A)
     cols = len(A[0])
     return [[A[i][j] - B[i][j] for j in range(cols)] for i in range(rows)]
 
 
+def matrix_iadd(A: Matrix, B: Matrix) -> Matrix:
+    """
+    Add B to A in place (A += B), overwriting the rows of A.
+    
+    Equivalent to matrix_add(A, B, out=A).
+    
+    Args:
+        A (Matrix): Matrix to update
+        B (Union[Matrix, TransposedView]): Matrix to add
+    
+    Returns:
+        Matrix: A, after the update
+    
+    Raises:
+        TypeError: If inputs are not lists of lists or contain non-numeric values
+        ValueError: If matrices have different dimensions
+    
+    Examples:
+        >>> from mlmath import matrix_iadd
+        >>> totals = [[1, 2], [3, 4]]
+        >>> matrix_iadd(totals, [[1, 1], [1, 1]])
+        [[2, 3], [4, 5]]
+        >>> totals
+        [[2, 3], [4, 5]]
+    """
+    return matrix_add(A, B, out=A)
+
+
+def matrix_isub(A: Matrix, B: Matrix) -> Matrix:
+    """
+    Subtract B from A in place (A -= B), overwriting the rows of A.
+    
+    Equivalent to matrix_subtract(A, B, out=A).
+    
+    Args:
+        A (Matrix): Matrix to update
+        B (Union[Matrix, TransposedView]): Matrix to subtract
+    
+    Returns:
+        Matrix: A, after the update
+    
+    Raises:
+        TypeError: If inputs are not lists of lists or contain non-numeric values
+        ValueError: If matrices have different dimensions
+    
+    Examples:
+        >>> from mlmath import matrix_isub
+        >>> weights = [[1.0, 1.0], [1.0, 1.0]]
+        >>> matrix_isub(weights, [[0.5, 0.25], [0.0, 1.0]])
+        [[0.5, 0.75], [1.0, 0.0]]
+    """
+    return matrix_subtract(A, B, out=A)
+
+
+def _check_out(out: Matrix, rows: int, cols: int) -> None:
+    """
+    Helper function to check that ``out`` can receive a rows × cols result.
+    
+    Row checks are skipped while validation is disabled.
+    
+    Raises:
+        TypeError: If out is not a list of lists
+        ValueError: If out has the wrong shape
+    """
+    if not isinstance(out, list):
+        raise TypeError("out must be a list of lists")
+    
+    if len(out) != rows:
+        raise ValueError(f"out must have {rows} rows. Got {len(out)}")
+    
+    if get_validation():
+        if not all(isinstance(row, list) for row in out):
+            raise TypeError("out must be a list of lists")
+        
+        if not all(len(row) == cols for row in out):
+            raise ValueError(f"All rows of out must have length {cols}")
+
+
+def _write_rows(out: Matrix, A: Matrix, B: Matrix, op) -> Matrix:
+    """Overwrite each row of ``out`` with op applied to the matching rows of A and B."""
+    for row_out, row_A, row_B in zip(out, A, B):
+        row_out[:] = map(op, row_A, row_B)
+    return out
+
+
 def identity_matrix(n: int) -> Matrix:
     """
     Create an n×n identity matrix.
@@ -270,6 +819,455 @@ def identity_matrix(n: int) -> Matrix:
     return [[1 if i == j else 0 for j in range(n)] for i in range(n)]
 
 
+def lu_factor(A: Matrix) -> Tuple[Matrix, List[int]]:
+    """
+    LU decomposition with partial pivoting: P·A = L·U.
+    
+    Factorising costs O(n³) once; lu_solve then solves A·x = b for any
+    number of right-hand sides in O(n²) each, instead of re-inverting A.
+    
+    Args:
+        A (Matrix): Square matrix (n × n)
+    
+    Returns:
+        Tuple[Matrix, List[int]]: (lu, piv) where lu holds U on and above the
+            diagonal and the multipliers of the unit lower-triangular L below
+            it, and piv[k] is the row swapped with row k at step k
+    
+    Raises:
+        TypeError: If A is not a list of lists or contains non-numeric values
+        ValueError: If A is empty, not square, or singular
+    
+    Examples:
+        >>> from mlmath import lu_factor
+        >>> lu, piv = lu_factor([[1, 2], [3, 4]])
+        >>> lu
+        [[3.0, 4.0], [0.3333333333333333, 0.6666666666666667]]
+        >>> piv
+        [1, 1]
+    """
+    n = _check_square(A)
+    lu = [list(map(float, row)) for row in A]
+    piv = list(range(n))
+    sub, mul = operator.sub, operator.mul
+    
+    for k in range(n):
+        # Partial pivoting: bring the largest remaining entry of column k up
+        p = max(range(k, n), key=lambda i: abs(lu[i][k]))
+        if lu[p][k] == 0:
+            raise ValueError("Matrix is singular")
+        piv[k] = p
+        if p != k:
+            lu[k], lu[p] = lu[p], lu[k]
+        
+        pivot_row = lu[k]
+        pivot = pivot_row[k]
+        tail = pivot_row[k + 1:]
+        
+        # Eliminate below the pivot, storing each multiplier in place
+        for row in lu[k + 1:]:
+            factor = row[k] / pivot
+            row[k] = factor
+            if factor:
+                row[k + 1:] = map(sub, row[k + 1:], map(mul, repeat(factor), tail))
+    
+    return lu, piv
+
+
+def lu_solve(lu_and_piv: Tuple[Matrix, List[int]], b):
+    """
+    Solve A·x = b using a factorisation from lu_factor, in O(n²) per right-hand side.
+    
+    Args:
+        lu_and_piv (Tuple[Matrix, List[int]]): Result of lu_factor(A)
+        b (Union[List[Union[int, float]], Vector, Matrix]): Right-hand side of
+            length n, or an n × k matrix whose k columns are solved together
+    
+    Returns:
+        Union[List[float], Vector, Matrix]: Solution x with the same form as b
+    
+    Raises:
+        TypeError: If b is not a list/Vector or contains non-numeric values
+        ValueError: If b does not have n rows
+    
+    Examples:
+        >>> from mlmath import lu_factor, lu_solve
+        >>> factors = lu_factor([[2, 1], [1, 3]])
+        >>> lu_solve(factors, [3, 5])
+        [0.8, 1.4]
+        >>> lu_solve(factors, [[3, 1], [5, 0]])
+        [[0.8, 0.6], [1.4, -0.2]]
+    """
+    lu, piv = lu_and_piv
+    n = len(lu)
+    mul = operator.mul
+    
+    def solve_column(column):
+        x = list(map(float, column))
+        
+        # Apply the row swaps
+        for k, p in enumerate(piv):
+            if p != k:
+                x[k], x[p] = x[p], x[k]
+        
+        # Forward substitution with the unit lower-triangular L
+        for i in range(1, n):
+            x[i] -= sum(map(mul, lu[i][:i], x[:i]))
+        
+        # Back substitution with U
+        for i in range(n - 1, -1, -1):
+            row = lu[i]
+            x[i] = (x[i] - sum(map(mul, row[i + 1:], x[i + 1:]))) / row[i]
+        
+        return x
+    
+    return _solve_columns(b, n, solve_column)
+
+
+def cholesky(A: Matrix) -> Matrix:
+    """
+    Cholesky decomposition of a symmetric positive definite matrix: A = L·Lᵀ.
+    
+    About half the work of lu_factor and numerically stable without pivoting,
+    which makes it the natural choice for normal equations (Xᵀ·X) and
+    covariance matrices. Only the lower triangle of A is read.
+    
+    Args:
+        A (Matrix): Symmetric positive definite matrix (n × n)
+    
+    Returns:
+        Matrix: Lower-triangular factor L (n × n)
+    
+    Raises:
+        TypeError: If A is not a list of lists or contains non-numeric values
+        ValueError: If A is empty, not square, or not positive definite
+    
+    Examples:
+        >>> from mlmath import cholesky
+        >>> cholesky([[4, 2], [2, 5]])
+        [[2.0, 0.0], [1.0, 2.0]]
+    """
+    n = _check_square(A)
+    
+    # Use the active backend's kernel if it has one
+    kernel = get_kernel('cholesky', n * n * n)
+    if kernel is not None:
+        return kernel(A)
+    
+    L = [[0.0] * n for _ in range(n)]
+    mul = operator.mul
+    
+    for j in range(n):
+        row_j = L[j]
+        head_j = row_j[:j]
+        diagonal = A[j][j] - sum(map(mul, head_j, head_j))
+        if diagonal <= 0:
+            raise ValueError("Matrix is not positive definite")
+        root = math.sqrt(diagonal)
+        row_j[j] = root
+        
+        for i in range(j + 1, n):
+            row_i = L[i]
+            row_i[j] = (A[i][j] - sum(map(mul, row_i[:j], head_j))) / root
+    
+    return L
+
+
+def cholesky_solve(L: Matrix, b):
+    """
+    Solve A·x = b given the Cholesky factor L of A, in O(n²) per right-hand side.
+    
+    Args:
+        L (Matrix): Lower-triangular factor from cholesky(A)
+        b (Union[List[Union[int, float]], Vector, Matrix]): Right-hand side of
+            length n, or an n × k matrix whose k columns are solved together
+    
+    Returns:
+        Union[List[float], Vector, Matrix]: Solution x with the same form as b
+    
+    Raises:
+        TypeError: If b is not a list/Vector or contains non-numeric values
+        ValueError: If b does not have n rows
+    
+    Examples:
+        >>> from mlmath import cholesky, cholesky_solve
+        >>> cholesky_solve(cholesky([[4, 2], [2, 5]]), [6, 7])
+        [1.0, 1.0]
+    """
+    n = len(L)
+    sub, mul = operator.sub, operator.mul
+    
+    def solve_column(column):
+        x = list(map(float, column))
+        
+        # Forward substitution with L
+        for i in range(n):
+            row = L[i]
+            x[i] = (x[i] - sum(map(mul, row[:i], x[:i]))) / row[i]
+        
+        # Back substitution with Lᵀ, reading L row by row: once x[i] is
+        # known, remove its contribution from the equations above it
+        for i in range(n - 1, -1, -1):
+            row = L[i]
+            x[i] /= row[i]
+            if x[i]:
+                x[:i] = map(sub, x[:i], map(mul, repeat(x[i]), row[:i]))
+        
+        return x
+    
+    return _solve_columns(b, n, solve_column)
+
+
+def qr(A: Matrix) -> Tuple[Matrix, Matrix]:
+    """
+    Reduced QR decomposition by Householder reflections: A = Q·R.
+    
+    For A (m×n) with m ≥ n, Q (m×n) has orthonormal columns and R (n×n) is
+    upper triangular. solve(A, b, method='qr') uses it for least-squares
+    fits, which avoids squaring the condition number as the normal
+    equations do.
+    
+    Args:
+        A (Matrix): Matrix with at least as many rows as columns (m × n)
+    
+    Returns:
+        Tuple[Matrix, Matrix]: (Q, R)
+    
+    Raises:
+        TypeError: If A is not a list of lists or contains non-numeric values
+        ValueError: If A is empty, has inconsistent rows, or has fewer rows
+            than columns
+    
+    Examples:
+        >>> from mlmath import qr
+        >>> Q, R = qr([[3, 0], [4, 5]])
+        >>> R
+        [[-5.0, -4.0], [0.0, -3.0]]
+    """
+    m, n = _check_matrix(A)
+    if m < n:
+        raise ValueError(f"QR decomposition needs at least as many rows as columns. Got {m}×{n}")
+    
+    # Use the active backend's kernel if it has one
+    kernel = get_kernel('qr', m * n * n)
+    if kernel is not None:
+        return kernel(A)
+    
+    R = [list(map(float, row)) for row in A]
+    reflectors = []
+    
+    for k in range(n):
+        x = [row[k] for row in R[k:]]
+        norm = math.sqrt(sum(map(operator.mul, x, x)))
+        if norm == 0:
+            reflectors.append(None)
+            continue
+        
+        # Reflect x onto -sign(x[0])·|x|·e1, avoiding cancellation in v[0]
+        alpha = -norm if x[0] >= 0 else norm
+        v = x
+        v[0] -= alpha
+        _reflect(R[k:], v, k)
+        reflectors.append(v)
+    
+    # Accumulate Q = H_0·H_1·…·H_{n-1} applied to the first n columns of I
+    Q = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(m)]
+    for k in range(n - 1, -1, -1):
+        if reflectors[k] is not None:
+            _reflect(Q[k:], reflectors[k], k)
+    
+    R = [[0.0] * i + row[i:n] for i, row in enumerate(R[:n])]
+    return Q, R
+
+
+def _reflect(rows: Matrix, v: List[float], start: int) -> None:
+    """
+    Apply the Householder reflection I - 2·v·vᵀ/(vᵀ·v) to rows, from column start on.
+    
+    Works row-wise: w = vᵀ·rows is accumulated one row at a time, then each
+    row is updated with its multiple of w, so every inner loop runs in C.
+    """
+    add, sub, mul = operator.add, operator.sub, operator.mul
+    scale = 2.0 / sum(map(mul, v, v))
+    
+    w = [0.0] * (len(rows[0]) - start)
+    for v_i, row in zip(v, rows):
+        if v_i:
+            w = list(map(add, w, map(mul, repeat(v_i), row[start:])))
+    
+    for v_i, row in zip(v, rows):
+        if v_i:
+            row[start:] = map(sub, row[start:], map(mul, repeat(scale * v_i), w))
+
+
+def solve(A: Matrix, b, method: str = 'lu'):
+    """
+    Solve the linear system A·x = b.
+    
+    All columns of a matrix b share one factorisation of A. To reuse a
+    factorisation across separate calls, use lu_factor/lu_solve or
+    cholesky/cholesky_solve directly.
+    
+    Args:
+        A (Matrix): Coefficient matrix (n × n; m × n with m ≥ n for 'qr')
+        b (Union[List[Union[int, float]], Vector, Matrix]): Right-hand side
+            with one entry (or row) per row of A
+        method (str): Factorisation to use (default: 'lu')
+            - 'lu': LU with partial pivoting, for any non-singular A
+            - 'cholesky': For symmetric positive definite A, about twice as fast
+            - 'qr': Householder QR; for tall A returns the least-squares solution
+    
+    Returns:
+        Union[List[float], Vector, Matrix]: Solution x with the same form as b
+    
+    Raises:
+        TypeError: If inputs are not lists or contain non-numeric values
+        ValueError: If shapes do not match, method is unknown, or A is
+            singular (rank deficient for 'qr', not positive definite for
+            'cholesky')
+    
+    Examples:
+        >>> from mlmath import solve
+        >>> solve([[2, 1], [1, 3]], [3, 5])
+        [0.8, 1.4]
+        
+        >>> solve([[4, 2], [2, 5]], [6, 7], method='cholesky')
+        [1.0, 1.0]
+        
+        >>> solve([[2, 0], [0, 2], [0, 0]], [2, 4, 1], method='qr')
+        [1.0, 2.0]
+    """
+    if method not in _SOLVE_METHODS:
+        raise ValueError(f"Unknown method '{method}'. Choose from {list(_SOLVE_METHODS)}")
+    
+    if method == 'cholesky':
+        return cholesky_solve(cholesky(A), b)
+    
+    if method == 'qr':
+        Q, R = qr(A)
+        n = len(R)
+        
+        # Diagonal entries lost in rounding noise mean dependent columns
+        diagonal = [abs(R[i][i]) for i in range(n)]
+        if min(diagonal) <= max(diagonal) * len(Q) * sys.float_info.epsilon:
+            raise ValueError("Matrix is rank deficient")
+        mul = operator.mul
+        
+        def solve_column(column):
+            # x = R⁻¹·Qᵀ·b, with Qᵀ·b accumulated row by row
+            y = [0.0] * n
+            for q_row, b_i in zip(Q, column):
+                if b_i:
+                    y = list(map(operator.add, y, map(mul, repeat(b_i), q_row)))
+            for i in range(n - 1, -1, -1):
+                row = R[i]
+                y[i] = (y[i] - sum(map(mul, row[i + 1:], y[i + 1:]))) / row[i]
+            return y
+        
+        return _solve_columns(b, len(Q), solve_column)
+    
+    n = _check_square(A)
+    
+    # Use the active backend's kernel if it has one
+    kernel = get_kernel('solve', n * n * n)
+    if kernel is not None:
+        _check_rhs(b, n)
+        return kernel(A, b)
+    
+    return lu_solve(lu_factor(A), b)
+
+
+# Factorisations selectable through solve(method=...)
+_SOLVE_METHODS = ('lu', 'cholesky', 'qr')
+
+
+def _solve_columns(b, n: int, solve_column):
+    """
+    Apply a single-column solver to every right-hand side in b.
+    
+    Args:
+        b: Right-hand side vector (list or Vector) or n × k matrix
+        n (int): Number of rows expected in b
+        solve_column (Callable): Solves for one column, returning a list
+    
+    Returns:
+        Solution with the same form as b
+    """
+    is_matrix = _check_rhs(b, n)
+    
+    if is_matrix:
+        columns = [solve_column(column) for column in zip(*b)]
+        return [list(row) for row in zip(*columns)]
+    
+    x = solve_column(b)
+    if isinstance(b, Vector):
+        return Vector(x)
+    return x
+
+
+def _check_rhs(b, n: int) -> bool:
+    """
+    Helper function to check a right-hand side and report whether it is a matrix.
+    
+    Raises:
+        TypeError: If b is not a list/Vector or contains non-numeric values
+        ValueError: If b does not have n rows, or its rows differ in length
+    """
+    if not isinstance(b, (list, Vector)):
+        raise TypeError("Right-hand side must be a list or Vector")
+    
+    if len(b) != n:
+        raise ValueError(f"Right-hand side must have {n} rows. Got {len(b)}")
+    
+    is_matrix = isinstance(b, list) and isinstance(b[0], list)
+    
+    if get_validation():
+        if is_matrix:
+            _check_pair_structure(b, b)
+            _check_numeric(b, "in b ")
+        elif isinstance(b, list):
+            _check_numeric([b], "in b ")
+    
+    return is_matrix
+
+
+def _check_matrix(A: Matrix) -> Tuple[int, int]:
+    """
+    Helper function to validate a single matrix operand.
+    
+    Returns:
+        Tuple[int, int]: (rows, cols)
+    
+    Raises:
+        TypeError: If A is not a list of lists or contains non-numeric values
+        ValueError: If A is empty or its rows are empty or differ in length
+    """
+    if not isinstance(A, list):
+        raise TypeError("Input must be a list")
+    
+    if not A:
+        raise ValueError("Matrix cannot be empty")
+    
+    if get_validation():
+        _check_pair_structure(A, A)
+        _check_numeric(A, "")
+    
+    return len(A), len(A[0])
+
+
+def _check_square(A: Matrix) -> int:
+    """Helper function to validate a square matrix operand and return its size."""
+    rows, cols = _check_matrix(A)
+    if rows != cols:
+        raise ValueError(f"Matrix must be square. Got {rows}×{cols}")
+    return rows
+
+
+def _materialise(A):
+    """Return a TransposedView as a list of lists; anything else unchanged."""
+    return A.tolist() if isinstance(A, TransposedView) else A
+
+
 def _validate_same_dimensions(A: Matrix, B: Matrix, operation: str) -> None:
     """
     Helper function to validate that two matrices have the same dimensions.
@@ -290,6 +1288,39 @@ def _validate_same_dimensions(A: Matrix, B: Matrix, operation: str) -> None:
     if not A or not B:
         raise ValueError("Matrices cannot be empty")
     
+    validate = get_validation()
+    
+    # Check row structure (skipped when validation is disabled)
+    if validate:
+        _check_pair_structure(A, B)
+    
+    # Check dimensions
+    rows_A, cols_A = len(A), len(A[0])
+    rows_B, cols_B = len(B), len(B[0])
+    
+    # Check that matrices have same dimensions
+    if rows_A != rows_B or cols_A != cols_B:
+        raise ValueError(f"Cannot perform {operation} on matrices with different dimensions: "
+                        f"{rows_A}×{cols_A} and {rows_B}×{cols_B}")
+    
+    # Check that all elements are numeric
+    if validate:
+        _check_numeric(A, "in A ")
+        _check_numeric(B, "in B ")
+
+
+def _check_pair_structure(A: Matrix, B: Matrix) -> None:
+    """
+    Helper function to check that two operands are well-formed lists of lists.
+    
+    Args:
+        A (Matrix): First matrix
+        B (Matrix): Second matrix
+    
+    Raises:
+        TypeError: If either operand is not a list of lists
+        ValueError: If any row is empty or rows within a matrix differ in length
+    """
     if not all(isinstance(row, list) for row in A):
         raise TypeError("First matrix must be a list of lists")
     
@@ -300,29 +1331,28 @@ def _validate_same_dimensions(A: Matrix, B: Matrix, operation: str) -> None:
     if any(len(row) == 0 for row in A) or any(len(row) == 0 for row in B):
         raise ValueError("Matrix rows cannot be empty")
     
-    # Check dimensions
-    rows_A, cols_A = len(A), len(A[0])
-    rows_B, cols_B = len(B), len(B[0])
-    
     # Check consistency within matrices
+    cols_A = len(A[0])
     if not all(len(row) == cols_A for row in A):
         raise ValueError("All rows in first matrix must have the same length")
     
+    cols_B = len(B[0])
     if not all(len(row) == cols_B for row in B):
         raise ValueError("All rows in second matrix must have the same length")
+
+
+def _check_numeric(A: Matrix, location: str) -> None:
+    """
+    Helper function to check that every element of a matrix is numeric.
     
-    # Check that matrices have same dimensions
-    if rows_A != rows_B or cols_A != cols_B:
-        raise ValueError(f"Cannot perform {operation} on matrices with different dimensions: "
-                        f"{rows_A}×{cols_A} and {rows_B}×{cols_B}")
+    Args:
+        A (Matrix): Matrix to scan
+        location (str): Operand label for error messages, e.g. "in A "
     
-    # Check that all elements are numeric
+    Raises:
+        TypeError: If a non-numeric element is found
+    """
     for i, row in enumerate(A):
         for j, val in enumerate(row):
             if not isinstance(val, (int, float)):
-                raise TypeError(f"All elements must be numeric. Found non-numeric value in A at [{i}][{j}]")
-    
-    for i, row in enumerate(B):
-        for j, val in enumerate(row):
-            if not isinstance(val, (int, float)):
-                raise TypeError(f"All elements must be numeric. Found non-numeric value in B at [{i}][{j}]")
+                raise TypeError(f"All elements must be numeric. Found non-numeric value {location}at [{i}][{j}]")
@@ -0,0 +1,418 @@
+"""
+Naive Bayes Module
+==================
+
+This module provides multinomial and Bernoulli naive Bayes classifiers over an
+arbitrary, growing vocabulary.
+
+Classes:
+    - MultinomialNB: Naive Bayes over word counts
+    - BernoulliNB: Naive Bayes over word presence/absence
+
+A sample (one message) can be given as:
+    - a list of tokens, e.g. ['win', 'free', 'money', 'free']
+    - a dict mapping token -> count, e.g. {'free': 2, 'win': 1}
+    - a SparseVector of counts, whose indices act as the tokens
+and a whole dataset as a list of samples or a CSRMatrix (one row per sample).
+
+Counts are kept in sparse per-class tables (only words actually seen in a
+class are stored) and updated incrementally by partial_fit. Scoring happens
+entirely in log space with Laplace/Lidstone smoothing: every class's smoothed
+log-probabilities are cached after training, so classifying a message is a
+dictionary lookup per distinct token and one C-level sum per class, with no
+per-word Bayes calls and no underflow however long the message is.
+
+Author: GitHub Copilot
+Date: July 27, 2025
+"""
+
+import math
+import operator
+from array import array
+from collections import Counter
+from itertools import repeat
+from typing import Dict, Hashable, Iterable, List, Tuple, Union
+
+from .config import get_validation
+from .probability import LogProbabilities, logsumexp
+from .sparse import CSRMatrix, SparseVector
+from .vector import Vector
+
+# Type aliases for samples and datasets
+Sample = Union[List[Hashable], Dict[Hashable, Union[int, float]], SparseVector]
+Dataset = Union[List[Sample], CSRMatrix]
+
+
+class _BaseNB:
+    """
+    Shared bookkeeping for the naive Bayes classifiers.
+    
+    Subclasses provide _update (how a sample adds to the count tables),
+    _build_tables (the cached log-probability tables) and _score (the joint
+    log-likelihood of one sample for every class).
+    """
+    
+    def __init__(self, alpha: float = 1.0, fit_prior: bool = True):
+        if not isinstance(alpha, (int, float)) or isinstance(alpha, bool):
+            raise TypeError("alpha must be numeric")
+        
+        if not alpha > 0:
+            raise ValueError("alpha must be positive")
+        
+        if not isinstance(fit_prior, bool):
+            raise TypeError("fit_prior must be boolean")
+        
+        self.alpha = float(alpha)
+        self.fit_prior = fit_prior
+        self._reset()
+    
+    def _reset(self) -> None:
+        """Forget everything learned so far."""
+        self.classes_: List[Hashable] = []
+        self.class_count_: List[int] = []
+        self.feature_count_: List[Dict[Hashable, float]] = []
+        self.vocabulary_: set = set()
+        self._class_index: Dict[Hashable, int] = {}
+        self._tables = None
+    
+    def fit(self, X: Dataset, y: List[Hashable]) -> '_BaseNB':
+        """
+        Train from scratch on samples X with labels y.
+        
+        Args:
+            X (Dataset): List of samples, or a CSRMatrix of counts
+            y (List[Hashable]): One class label per sample
+        
+        Returns:
+            The classifier itself
+        
+        Raises:
+            TypeError: If a sample has an unsupported type or non-numeric counts
+            ValueError: If X and y differ in length or counts are negative
+        """
+        self._reset()
+        return self.partial_fit(X, y)
+    
+    def partial_fit(self, X: Dataset, y: List[Hashable]) -> '_BaseNB':
+        """
+        Update the count tables with more samples, keeping everything learned so far.
+        
+        New classes and new words are added as they appear. Cached scoring
+        tables are rebuilt on the next prediction.
+        
+        Args:
+            X (Dataset): List of samples, or a CSRMatrix of counts
+            y (List[Hashable]): One class label per sample
+        
+        Returns:
+            The classifier itself
+        
+        Raises:
+            TypeError: If a sample has an unsupported type or non-numeric counts
+            ValueError: If X and y differ in length or counts are negative
+        """
+        samples = _samples(X)
+        if not isinstance(y, (list, tuple)):
+            raise TypeError("Labels must be a list")
+        
+        if len(samples) != len(y):
+            raise ValueError(f"X and y must have the same length. Got {len(samples)} and {len(y)}")
+        
+        for sample, label in zip(samples, y):
+            tokens, counts = _as_counts(sample)
+            
+            index = self._class_index.get(label)
+            if index is None:
+                index = len(self.classes_)
+                self._class_index[label] = index
+                self.classes_.append(label)
+                self.class_count_.append(0)
+                self.feature_count_.append({})
+            
+            self.class_count_[index] += 1
+            self.vocabulary_.update(tokens)
+            self._update(self.feature_count_[index], tokens, counts)
+        
+        self._tables = None
+        return self
+    
+    def joint_log_likelihood(self, sample: Sample) -> Vector:
+        """
+        Unnormalised log P(class) + log P(sample | class) for every class.
+        
+        Args:
+            sample (Sample): One message
+        
+        Returns:
+            Vector: One score per class, in the order of classes_
+        """
+        self._check_fitted()
+        tokens, counts = _as_counts(sample)
+        return Vector(self._score(tokens, counts))
+    
+    def predict_one(self, sample: Sample) -> Hashable:
+        """
+        Most probable class for a single message (the fast path for online scoring).
+        
+        Args:
+            sample (Sample): One message
+        
+        Returns:
+            Hashable: The predicted class label
+        
+        Raises:
+            ValueError: If the classifier has not been trained
+        """
+        self._check_fitted()
+        scores = self._score(*_as_counts(sample))
+        return self.classes_[max(range(len(scores)), key=scores.__getitem__)]
+    
+    def predict(self, X: Dataset) -> List[Hashable]:
+        """
+        Most probable class for every sample.
+        
+        Args:
+            X (Dataset): List of samples, or a CSRMatrix of counts
+        
+        Returns:
+            List[Hashable]: One predicted label per sample
+        """
+        return [self.predict_one(sample) for sample in _samples(X)]
+    
+    def predict_log_proba(self, X: Dataset) -> List[LogProbabilities]:
+        """
+        Posterior log-probabilities log P(class | sample) for every sample.
+        
+        Args:
+            X (Dataset): List of samples, or a CSRMatrix of counts
+        
+        Returns:
+            List[LogProbabilities]: One row per sample, one entry per class
+        """
+        self._check_fitted()
+        result = []
+        for sample in _samples(X):
+            scores = self._score(*_as_counts(sample))
+            shift = logsumexp(scores)
+            result.append(LogProbabilities._from_array(array('d', map(operator.sub, scores, repeat(shift)))))
+        return result
+    
+    def predict_proba(self, X: Dataset) -> List[Vector]:
+        """
+        Posterior probabilities P(class | sample) for every sample.
+        
+        Args:
+            X (Dataset): List of samples, or a CSRMatrix of counts
+        
+        Returns:
+            List[Vector]: One row per sample, one entry per class
+        """
+        return [row.to_probabilities() for row in self.predict_log_proba(X)]
+    
+    def score(self, X: Dataset, y: List[Hashable]) -> float:
+        """
+        Fraction of samples whose predicted class matches the label.
+        
+        Args:
+            X (Dataset): List of samples, or a CSRMatrix of counts
+            y (List[Hashable]): True labels
+        
+        Returns:
+            float: Accuracy in [0, 1]
+        """
+        predictions = self.predict(X)
+        if len(predictions) != len(y):
+            raise ValueError(f"X and y must have the same length. Got {len(predictions)} and {len(y)}")
+        if not predictions:
+            raise ValueError("Cannot score an empty dataset")
+        return sum(map(operator.eq, predictions, y)) / len(predictions)
+    
+    def _class_log_priors(self) -> List[float]:
+        """log P(class) from class frequencies, or uniform when fit_prior is False."""
+        if not self.fit_prior:
+            return [-math.log(len(self.classes_))] * len(self.classes_)
+        total = sum(self.class_count_)
+        return [math.log(count / total) for count in self.class_count_]
+    
+    def _check_fitted(self) -> None:
+        """Raise unless at least one sample has been seen, and build tables if stale."""
+        if not self.classes_:
+            raise ValueError("Classifier has not been trained; call fit or partial_fit first")
+        if self._tables is None:
+            self._tables = self._build_tables()
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(alpha={self.alpha}, fit_prior={self.fit_prior})"
+
+
+class MultinomialNB(_BaseNB):
+    """
+    Multinomial naive Bayes over token counts.
+    
+    P(word | class) = (count of word in class + alpha) /
+                      (total words in class + alpha × vocabulary size)
+    
+    Words never seen in training are ignored when scoring.
+    
+    Args:
+        alpha (float): Additive (Laplace/Lidstone) smoothing; 1.0 is Laplace (default: 1.0)
+        fit_prior (bool): Learn class priors from the data rather than use a
+            uniform prior (default: True)
+    
+    Attributes:
+        classes_ (List[Hashable]): Class labels in the order they were first seen
+        class_count_ (List[int]): Number of training samples per class
+        feature_count_ (List[Dict[Hashable, float]]): Sparse token counts per class
+        vocabulary_ (set): Every token seen in training
+    
+    Examples:
+        >>> from mlmath import MultinomialNB
+        >>> model = MultinomialNB().fit(
+        ...     [['free', 'money', 'free'], ['meeting', 'tomorrow'], ['free', 'offer'], ['project', 'meeting']],
+        ...     ['spam', 'ham', 'spam', 'ham'])
+        >>> model.predict_one(['free', 'free', 'meeting'])
+        'spam'
+        >>> model.predict([{'meeting': 1}, {'money': 3}])
+        ['ham', 'spam']
+    """
+    
+    def _update(self, table: Dict[Hashable, float], tokens: List[Hashable], counts: List[float]) -> None:
+        for token, count in zip(tokens, counts):
+            table[token] = table.get(token, 0) + count
+    
+    def _build_tables(self) -> List[Tuple[float, Dict[Hashable, float], float]]:
+        """Per class: (log prior, log P(word | class) for words seen in the class, value for other words)."""
+        alpha = self.alpha
+        vocabulary_size = len(self.vocabulary_)
+        tables = []
+        for log_prior, table in zip(self._class_log_priors(), self.feature_count_):
+            log_denominator = math.log(sum(table.values()) + alpha * vocabulary_size)
+            log_probs = {token: math.log(count + alpha) - log_denominator for token, count in table.items()}
+            tables.append((log_prior, log_probs, math.log(alpha) - log_denominator))
+        return tables
+    
+    def _score(self, tokens: List[Hashable], counts: List[float]) -> List[float]:
+        vocabulary = self.vocabulary_
+        if not vocabulary.issuperset(tokens):
+            known = [(token, count) for token, count in zip(tokens, counts) if token in vocabulary]
+            tokens = [token for token, _ in known]
+            counts = [count for _, count in known]
+        
+        mul = operator.mul
+        return [log_prior + sum(map(mul, counts, map(log_probs.get, tokens, repeat(unseen))))
+                for log_prior, log_probs, unseen in self._tables]
+
+
+class BernoulliNB(_BaseNB):
+    """
+    Bernoulli naive Bayes over token presence.
+    
+    Each vocabulary word is a yes/no feature: a sample either contains it
+    (any positive count) or not, and absent words count as evidence too.
+    
+    P(word present | class) = (samples of class containing word + alpha) /
+                              (samples of class + 2 × alpha)
+    
+    The absent-word terms are summed once per class when the tables are
+    built, so scoring still only touches the words a sample contains.
+    
+    Args:
+        alpha (float): Additive (Laplace/Lidstone) smoothing; 1.0 is Laplace (default: 1.0)
+        fit_prior (bool): Learn class priors from the data rather than use a
+            uniform prior (default: True)
+    
+    Attributes:
+        classes_ (List[Hashable]): Class labels in the order they were first seen
+        class_count_ (List[int]): Number of training samples per class
+        feature_count_ (List[Dict[Hashable, float]]): Sparse per-class counts of
+            samples containing each token
+        vocabulary_ (set): Every token seen in training
+    
+    Examples:
+        >>> from mlmath import BernoulliNB
+        >>> model = BernoulliNB().fit(
+        ...     [['free', 'money'], ['meeting', 'tomorrow'], ['free', 'offer'], ['project', 'meeting']],
+        ...     ['spam', 'ham', 'spam', 'ham'])
+        >>> model.predict_one(['free'])
+        'spam'
+    """
+    
+    def _update(self, table: Dict[Hashable, float], tokens: List[Hashable], counts: List[float]) -> None:
+        for token, count in zip(tokens, counts):
+            if count > 0:
+                table[token] = table.get(token, 0) + 1
+    
+    def _build_tables(self) -> List[Tuple[float, Dict[Hashable, float], float]]:
+        """
+        Per class: (log prior + Σ log P(absent) over the vocabulary,
+        log-odds of presence for words seen in the class, log-odds for other words).
+        """
+        alpha = self.alpha
+        vocabulary_size = len(self.vocabulary_)
+        tables = []
+        for log_prior, table, n_samples in zip(self._class_log_priors(), self.feature_count_, self.class_count_):
+            denominator = n_samples + 2 * alpha
+            
+            # Words never seen in this class share one smoothed probability
+            unseen_present = math.log(alpha / denominator)
+            unseen_absent = math.log1p(-alpha / denominator)
+            
+            base = log_prior + (vocabulary_size - len(table)) * unseen_absent
+            log_odds = {}
+            for token, count in table.items():
+                log_present = math.log((count + alpha) / denominator)
+                log_absent = math.log1p(-(count + alpha) / denominator)
+                base += log_absent
+                log_odds[token] = log_present - log_absent
+            
+            tables.append((base, log_odds, unseen_present - unseen_absent))
+        return tables
+    
+    def _score(self, tokens: List[Hashable], counts: List[float]) -> List[float]:
+        vocabulary = self.vocabulary_
+        present = [token for token, count in zip(tokens, counts) if count > 0 and token in vocabulary]
+        return [base + sum(map(log_odds.get, present, repeat(unseen)))
+                for base, log_odds, unseen in self._tables]
+
+
+def _samples(X: Dataset) -> list:
+    """Return the samples of a dataset as a list (CSRMatrix rows become SparseVectors)."""
+    if isinstance(X, CSRMatrix):
+        return [X.getrow(i) for i in range(X.shape[0])]
+    if not isinstance(X, (list, tuple)):
+        raise TypeError("X must be a list of samples or a CSRMatrix")
+    return X
+
+
+def _as_counts(sample: Sample) -> Tuple[list, list]:
+    """
+    Split one sample into parallel lists of distinct tokens and their counts.
+    
+    Raises:
+        TypeError: If the sample is a string, an unsupported type, or has
+            non-numeric counts
+        ValueError: If a count is negative
+    """
+    if isinstance(sample, dict):
+        tokens, counts = list(sample), list(sample.values())
+        if get_validation():
+            if not all(isinstance(count, (int, float)) for count in counts):
+                raise TypeError("Token counts must be numeric")
+            if counts and min(counts) < 0:
+                raise ValueError("Token counts cannot be negative")
+        return tokens, counts
+    
+    if isinstance(sample, SparseVector):
+        counts = sample.values.tolist()
+        if counts and min(counts) < 0:
+            raise ValueError("Token counts cannot be negative")
+        return sample.indices.tolist(), counts
+    
+    if isinstance(sample, (str, bytes)):
+        raise TypeError("Samples must be tokenized: pass a list of tokens, not a string")
+    
+    if not isinstance(sample, Iterable):
+        raise TypeError("Each sample must be a list of tokens, a dict of token counts or a SparseVector")
+    
+    counter = Counter(sample)
+    return list(counter), list(counter.values())
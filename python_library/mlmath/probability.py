@@ -9,12 +9,43 @@ Functions:
     - bayes_theorem(prior, likelihood, evidence): Apply Bayes' theorem
     - joint_probability(prob_a, prob_b, independent): Calculate joint probability
     - marginal_probability(joint_probs): Calculate marginal probability
+    - log_bayes, log_joint, log_marginal_probability: The same in log space
+    - logsumexp(log_values): Stable log of a sum of exponentials
+
+Classes:
+    - LogProbability: A single probability stored as its logarithm
+    - LogProbabilities: An array (Vector) of log-probabilities
+
+bayes_theorem and joint_probability also accept lists or Vectors of
+probabilities (scalars are broadcast against them) and return a Vector with
+one result per element; marginal_probability accepts a batch of rows and
+returns a Vector of marginals. Each array is validated in one C-speed pass
+and the arithmetic runs through map(), so thousands of posteriors cost one
+call instead of thousands. The per-element type scan of list inputs is
+skipped while validation is disabled (see mlmath.set_validation).
+
+Products of many probabilities underflow to 0.0 long before they stop
+mattering (200 factors of 0.01 is 1e-400). The log-space API works with
+natural logs throughout: products become sums, Bayes' rule becomes
+additions and a subtraction, and marginals use logsumexp, so results stay
+finite and accurate at any scale.
 
 Author: GitHub Copilot
 Date: July 27, 2025
 """
 
-from typing import Dict, Union, List
+import math
+import operator
+from array import array
+from itertools import repeat
+from typing import Dict, Iterable, Union, List
+
+from .backend import get_kernel
+from .config import get_validation
+from .vector import Vector
+
+# Type alias for an array of probabilities
+ProbabilityArray = Union[List[Union[int, float]], Vector]
 
 
 def conditional_probability(events: Dict[str, Union[int, float]]) -> Dict[str, float]:
@@ -166,23 +197,30 @@ def _calculate_general_probabilities(events: Dict[str, Union[int, float]]) -> Di
     return result
 
 
-def bayes_theorem(prior: float, likelihood: float, evidence: float) -> float:
+def bayes_theorem(prior: Union[float, ProbabilityArray], likelihood: Union[float, ProbabilityArray],
+                  evidence: Union[float, ProbabilityArray]) -> Union[float, Vector]:
     """
     Apply Bayes' theorem to calculate posterior probability.
     
     Formula: P(A|B) = P(B|A) × P(A) / P(B)
     
+    Any argument may be a list or Vector to compute many posteriors in one
+    call (for example one per word of a vocabulary); scalar arguments are
+    shared by every element.
+    
     Args:
-        prior (float): P(A) - Prior probability
-        likelihood (float): P(B|A) - Likelihood
-        evidence (float): P(B) - Evidence
+        prior (Union[float, ProbabilityArray]): P(A) - Prior probability
+        likelihood (Union[float, ProbabilityArray]): P(B|A) - Likelihood
+        evidence (Union[float, ProbabilityArray]): P(B) - Evidence
     
     Returns:
-        float: P(A|B) - Posterior probability
+        Union[float, Vector]: P(A|B) - Posterior probability, or a Vector of
+            posteriors if any argument is an array
     
     Raises:
         TypeError: If inputs are not numeric
-        ValueError: If probabilities are not in [0,1] or evidence is zero
+        ValueError: If probabilities are not in [0,1], evidence is zero, or
+            array arguments differ in length
     
     Examples:
         >>> from mlmath import bayes_theorem
@@ -191,7 +229,30 @@ def bayes_theorem(prior: float, likelihood: float, evidence: float) -> float:
         
         >>> bayes_theorem(0.01, 0.9, 0.05)
         0.18
+        
+        >>> bayes_theorem(0.4, [0.3, 0.5], [0.3, 0.5])
+        Vector([0.4, 0.4])
     """
+    if _is_array(prior) or _is_array(likelihood) or _is_array(evidence):
+        size = _broadcast_length(prior, likelihood, evidence)
+        _check_probability_array(prior, "Prior probability")
+        _check_probability_array(likelihood, "Likelihood")
+        _check_probability_array(evidence, "Evidence probability")
+        
+        if not all(_storage(evidence, size)):
+            if not _is_array(evidence):
+                raise ValueError("Evidence probability cannot be zero")
+            index = next(i for i, p in enumerate(_storage(evidence, size)) if not p)
+            raise ValueError(f"Evidence probability cannot be zero (at index {index})")
+        
+        # Use the active backend's kernel if it has one
+        kernel = get_kernel('bayes_theorem', size)
+        if kernel is not None:
+            return kernel(prior, likelihood, evidence)
+        
+        numerators = map(operator.mul, _storage(likelihood, size), _storage(prior, size))
+        return Vector(map(operator.truediv, numerators, _storage(evidence, size)))
+    
     # Type checking
     if not all(isinstance(p, (int, float)) for p in [prior, likelihood, evidence]):
         raise TypeError("All inputs must be numeric")
@@ -213,21 +274,27 @@ def bayes_theorem(prior: float, likelihood: float, evidence: float) -> float:
     return (likelihood * prior) / evidence
 
 
-def joint_probability(prob_a: float, prob_b: float, independent: bool = True) -> float:
+def joint_probability(prob_a: Union[float, ProbabilityArray], prob_b: Union[float, ProbabilityArray],
+                      independent: bool = True) -> Union[float, Vector]:
     """
     Calculate joint probability P(A and B).
     
+    Either probability may be a list or Vector to compute many joint
+    probabilities in one call; a scalar is shared by every element.
+    
     Args:
-        prob_a (float): P(A) - Probability of event A
-        prob_b (float): P(B) - Probability of event B
+        prob_a (Union[float, ProbabilityArray]): P(A) - Probability of event A
+        prob_b (Union[float, ProbabilityArray]): P(B) - Probability of event B
         independent (bool): Whether events are independent (default: True)
     
     Returns:
-        float: P(A and B) - Joint probability
+        Union[float, Vector]: P(A and B) - Joint probability, or a Vector of
+            joint probabilities if either argument is an array
     
     Raises:
         TypeError: If probabilities are not numeric
-        ValueError: If probabilities are not in [0,1]
+        ValueError: If probabilities are not in [0,1] or array arguments
+            differ in length
     
     Examples:
         >>> from mlmath import joint_probability
@@ -236,18 +303,34 @@ def joint_probability(prob_a: float, prob_b: float, independent: bool = True) ->
         
         >>> joint_probability(0.5, 0.6, independent=True)
         0.3
+        
+        >>> joint_probability([0.5, 0.25], 0.5)
+        Vector([0.25, 0.125])
     
     Note:
         For independent events: P(A and B) = P(A) × P(B)
         For dependent events, you need to provide P(B|A) as prob_b
     """
+    if not isinstance(independent, bool):
+        raise TypeError("Independent flag must be boolean")
+    
+    if _is_array(prob_a) or _is_array(prob_b):
+        size = _broadcast_length(prob_a, prob_b)
+        _check_probability_array(prob_a, "Probability of A")
+        _check_probability_array(prob_b, "Probability of B")
+        
+        # Use the active backend's kernel if it has one
+        kernel = get_kernel('joint_probability', size)
+        if kernel is not None:
+            return kernel(prob_a, prob_b)
+        
+        # P(B|A) for dependent events enters the product the same way
+        return Vector(map(operator.mul, _storage(prob_a, size), _storage(prob_b, size)))
+    
     # Type checking
     if not isinstance(prob_a, (int, float)) or not isinstance(prob_b, (int, float)):
         raise TypeError("Probabilities must be numeric")
     
-    if not isinstance(independent, bool):
-        raise TypeError("Independent flag must be boolean")
-    
     # Value checking
     if not (0 <= prob_a <= 1):
         raise ValueError("Probability of A must be between 0 and 1")
@@ -263,20 +346,23 @@ def joint_probability(prob_a: float, prob_b: float, independent: bool = True) ->
         return prob_a * prob_b
 
 
-def marginal_probability(joint_probs: List[float]) -> float:
+def marginal_probability(joint_probs: Union[ProbabilityArray, List[ProbabilityArray]]) -> Union[float, Vector]:
     """
     Calculate marginal probability by summing joint probabilities.
     
     P(A) = Σ P(A and Bi) for all i
     
     Args:
-        joint_probs (List[float]): List of joint probabilities
+        joint_probs (Union[ProbabilityArray, List[ProbabilityArray]]): List or
+            Vector of joint probabilities, or a batch of such rows to compute
+            one marginal per row
     
     Returns:
-        float: Marginal probability
+        Union[float, Vector]: Marginal probability, or a Vector of marginals
+            for a batch
     
     Raises:
-        TypeError: If input is not a list or contains non-numeric values
+        TypeError: If input is not a list/Vector or contains non-numeric values
         ValueError: If probabilities are not in [0,1] or sum exceeds 1
     
     Examples:
@@ -286,24 +372,489 @@ def marginal_probability(joint_probs: List[float]) -> float:
         
         >>> marginal_probability([0.15, 0.25, 0.35])
         0.75
+        
+        >>> marginal_probability([[0.5, 0.25], [0.125, 0.125]])
+        Vector([0.75, 0.25])
     """
     # Type checking
-    if not isinstance(joint_probs, list):
+    if not isinstance(joint_probs, (list, Vector)):
         raise TypeError("Joint probabilities must be a list")
     
     if not joint_probs:
         raise ValueError("List cannot be empty")
     
-    if not all(isinstance(p, (int, float)) for p in joint_probs):
-        raise TypeError("All probabilities must be numeric")
+    # A batch of rows gives one marginal per row
+    if isinstance(joint_probs, list) and _is_array(joint_probs[0]):
+        return Vector(map(_marginal, joint_probs))
     
-    # Value checking
-    if not all(0 <= p <= 1 for p in joint_probs):
-        raise ValueError("All probabilities must be between 0 and 1")
+    return _marginal(joint_probs)
+
+
+def _marginal(joint_probs: ProbabilityArray) -> float:
+    """Validate one array of joint probabilities and return its sum."""
+    if not _is_array(joint_probs):
+        raise TypeError("Joint probabilities must be a list")
+    
+    if not joint_probs:
+        raise ValueError("List cannot be empty")
     
-    result = sum(joint_probs)
+    _check_probability_array(joint_probs, "All probabilities")
+    
+    result = sum(_storage(joint_probs, len(joint_probs)))
     
     if result > 1:
         raise ValueError("Sum of probabilities cannot exceed 1")
     
     return result
+
+
+class LogProbability:
+    """
+    A single probability stored as its natural logarithm.
+    
+    Multiplying probabilities adds their logs, so long chains of products
+    (the likelihood of a document under naive Bayes, a sequence of
+    independent events) never underflow to 0.0. Arithmetic follows the
+    probabilities the objects stand for:
+    
+        a * b   P(A)·P(B)      log a + log b
+        a / b   P(A)/P(B)      log a - log b
+        a + b   P(A) + P(B)    log(exp(log a) + exp(log b)), computed stably
+    
+    Attributes:
+        log (float): Natural logarithm of the probability (-inf for 0)
+    
+    Examples:
+        >>> from mlmath import LogProbability
+        >>> p = LogProbability.from_probability(0.5)
+        >>> (p * p).probability
+        0.25
+        >>> tiny = LogProbability.from_probability(1e-200)
+        >>> (tiny * tiny).log
+        -921.0340371976183
+    """
+    
+    __slots__ = ('log',)
+    
+    def __init__(self, log: float):
+        if not isinstance(log, (int, float)):
+            raise TypeError("Log-probability must be numeric")
+        if not log <= 0:
+            raise ValueError("Log-probability must be at most 0")
+        self.log = float(log)
+    
+    @classmethod
+    def from_probability(cls, probability: float) -> 'LogProbability':
+        """Create from a probability in [0, 1]; 0 becomes a log of -inf."""
+        _check_probability_array(probability, "Probability")
+        return cls._from_log(math.log(probability) if probability > 0 else -math.inf)
+    
+    @classmethod
+    def _from_log(cls, log: float) -> 'LogProbability':
+        """Wrap an already validated log without checking it."""
+        value = cls.__new__(cls)
+        value.log = log
+        return value
+    
+    @property
+    def probability(self) -> float:
+        """The probability itself (may underflow to 0.0 for very small values)."""
+        return math.exp(self.log)
+    
+    def __float__(self) -> float:
+        return self.probability
+    
+    def __mul__(self, other: 'LogProbability') -> 'LogProbability':
+        if not isinstance(other, LogProbability):
+            return NotImplemented
+        return LogProbability._from_log(self.log + other.log)
+    
+    def __truediv__(self, other: 'LogProbability') -> 'LogProbability':
+        if not isinstance(other, LogProbability):
+            return NotImplemented
+        if other.log == -math.inf:
+            raise ZeroDivisionError("Division by a zero probability")
+        return LogProbability(self.log - other.log)
+    
+    def __add__(self, other: 'LogProbability') -> 'LogProbability':
+        if not isinstance(other, LogProbability):
+            return NotImplemented
+        return LogProbability(_logaddexp(self.log, other.log))
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LogProbability):
+            return self.log == other.log
+        return NotImplemented
+    
+    def __lt__(self, other: 'LogProbability') -> bool:
+        if isinstance(other, LogProbability):
+            return self.log < other.log
+        return NotImplemented
+    
+    def __le__(self, other: 'LogProbability') -> bool:
+        if isinstance(other, LogProbability):
+            return self.log <= other.log
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(self.log)
+    
+    def __repr__(self) -> str:
+        return f"LogProbability(log={self.log!r})"
+
+
+class LogProbabilities(Vector):
+    """
+    An array of probabilities stored as natural logarithms.
+    
+    A Vector subclass, so it can be passed straight to log_bayes, log_joint,
+    logsumexp and every other mlmath function that accepts a Vector.
+    
+    Examples:
+        >>> from mlmath import LogProbabilities
+        >>> logs = LogProbabilities.from_probabilities([0.5, 0.25, 0.0])
+        >>> logs.total().log
+        -inf
+        >>> LogProbabilities.from_probabilities([0.25, 0.25]).normalize().to_probabilities()
+        Vector([0.5, 0.5])
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self, logs: Iterable[Union[int, float]] = ()):
+        super().__init__(logs)
+        _check_probability_array(self, "Log-probabilities", log=True)
+    
+    @classmethod
+    def from_probabilities(cls, probabilities: ProbabilityArray) -> 'LogProbabilities':
+        """Convert probabilities in [0, 1] to logs; zeros become -inf."""
+        if not _is_array(probabilities):
+            raise TypeError("Probabilities must be a list or Vector")
+        _check_probability_array(probabilities, "All probabilities")
+        data = _storage(probabilities, len(probabilities))
+        return cls._from_array(array('d', map(_safe_log, data)))
+    
+    def to_probabilities(self) -> Vector:
+        """The probabilities themselves (small values may underflow to 0.0)."""
+        return Vector(map(math.exp, self.data))
+    
+    def total(self) -> LogProbability:
+        """Log of the product of all probabilities: their joint probability if independent."""
+        return LogProbability._from_log(math.fsum(self.data) if self else 0.0)
+    
+    def logsumexp(self) -> LogProbability:
+        """
+        Log of the sum of all probabilities: a marginal over the entries.
+        
+        Raises:
+            ValueError: If the probabilities sum to more than 1
+        """
+        return LogProbability._from_log(_log_total(logsumexp(self)))
+    
+    def normalize(self) -> 'LogProbabilities':
+        """Rescale so the probabilities sum to 1 (e.g. turn joint scores into posteriors)."""
+        shift = logsumexp(self)
+        if shift == -math.inf:
+            raise ValueError("Cannot normalize all-zero probabilities")
+        return LogProbabilities._from_array(array('d', map(operator.sub, self.data, repeat(shift))))
+    
+    def __repr__(self) -> str:
+        return f"LogProbabilities({self.data.tolist()})"
+
+
+def log_bayes(log_prior: Union[float, ProbabilityArray], log_likelihood: Union[float, ProbabilityArray],
+              log_evidence: Union[float, ProbabilityArray]) -> Union[float, Vector]:
+    """
+    Apply Bayes' theorem in log space.
+    
+    Formula: log P(A|B) = log P(B|A) + log P(A) - log P(B)
+    
+    Like bayes_theorem, any argument may be a list or Vector (including
+    LogProbabilities) and scalars are broadcast.
+    
+    Args:
+        log_prior (Union[float, ProbabilityArray]): log P(A)
+        log_likelihood (Union[float, ProbabilityArray]): log P(B|A)
+        log_evidence (Union[float, ProbabilityArray]): log P(B)
+    
+    Returns:
+        Union[float, Vector]: log P(A|B), or a Vector of log-posteriors if any
+            argument is an array
+    
+    Raises:
+        TypeError: If inputs are not numeric
+        ValueError: If a log-probability is positive or NaN, the evidence is
+            -inf (probability zero), or array arguments differ in length
+    
+    Examples:
+        >>> import math
+        >>> from mlmath import log_bayes
+        >>> math.exp(log_bayes(math.log(0.5), math.log(0.5), math.log(0.5)))
+        0.5
+    """
+    if _is_array(log_prior) or _is_array(log_likelihood) or _is_array(log_evidence):
+        size = _broadcast_length(log_prior, log_likelihood, log_evidence)
+        _check_probability_array(log_prior, "Log prior", log=True)
+        _check_probability_array(log_likelihood, "Log likelihood", log=True)
+        _check_probability_array(log_evidence, "Log evidence", log=True)
+        
+        if -math.inf in _storage(log_evidence, size):
+            raise ValueError("Log evidence cannot be -inf (evidence probability cannot be zero)")
+        
+        # Use the active backend's kernel if it has one
+        kernel = get_kernel('log_bayes', size)
+        if kernel is not None:
+            return kernel(log_prior, log_likelihood, log_evidence)
+        
+        numerators = map(operator.add, _storage(log_likelihood, size), _storage(log_prior, size))
+        return Vector(map(operator.sub, numerators, _storage(log_evidence, size)))
+    
+    _check_probability_array(log_prior, "Log prior", log=True)
+    _check_probability_array(log_likelihood, "Log likelihood", log=True)
+    _check_probability_array(log_evidence, "Log evidence", log=True)
+    
+    if log_evidence == -math.inf:
+        raise ValueError("Log evidence cannot be -inf (evidence probability cannot be zero)")
+    
+    return log_likelihood + log_prior - log_evidence
+
+
+def log_joint(log_prob_a: Union[float, ProbabilityArray],
+              log_prob_b: Union[float, ProbabilityArray]) -> Union[float, Vector]:
+    """
+    Calculate a joint probability in log space.
+    
+    Formula: log P(A and B) = log P(A) + log P(B)  (or + log P(B|A) for
+    dependent events). Chaining many factors is a running sum; use
+    LogProbabilities.total() to combine a whole array at once.
+    
+    Args:
+        log_prob_a (Union[float, ProbabilityArray]): log P(A)
+        log_prob_b (Union[float, ProbabilityArray]): log P(B), or log P(B|A)
+    
+    Returns:
+        Union[float, Vector]: log P(A and B), or a Vector if either argument
+            is an array
+    
+    Raises:
+        TypeError: If inputs are not numeric
+        ValueError: If a log-probability is positive or NaN, or array
+            arguments differ in length
+    
+    Examples:
+        >>> import math
+        >>> from mlmath import log_joint
+        >>> round(math.exp(log_joint(math.log(0.3), math.log(0.4))), 12)
+        0.12
+    """
+    if _is_array(log_prob_a) or _is_array(log_prob_b):
+        size = _broadcast_length(log_prob_a, log_prob_b)
+        _check_probability_array(log_prob_a, "Log probability of A", log=True)
+        _check_probability_array(log_prob_b, "Log probability of B", log=True)
+        
+        # Use the active backend's kernel if it has one
+        kernel = get_kernel('log_joint', size)
+        if kernel is not None:
+            return kernel(log_prob_a, log_prob_b)
+        
+        return Vector(map(operator.add, _storage(log_prob_a, size), _storage(log_prob_b, size)))
+    
+    _check_probability_array(log_prob_a, "Log probability of A", log=True)
+    _check_probability_array(log_prob_b, "Log probability of B", log=True)
+    
+    return log_prob_a + log_prob_b
+
+
+def logsumexp(log_values: Union[List[Union[int, float]], Vector]) -> float:
+    """
+    Compute log(Σ exp(x)) without overflow or underflow.
+    
+    The largest value is factored out first, so every exponent is at most 0:
+    log Σ exp(x) = m + log Σ exp(x - m) with m = max(x).
+    
+    Args:
+        log_values (Union[List[Union[int, float]], Vector]): Values to combine
+    
+    Returns:
+        float: log of the sum of exponentials (-inf if every value is -inf)
+    
+    Raises:
+        TypeError: If input is not a list/Vector or contains non-numeric values
+        ValueError: If input is empty
+    
+    Examples:
+        >>> from mlmath import logsumexp
+        >>> logsumexp([-1000.0, -1000.0])
+        -999.3068528194401
+    """
+    if not _is_array(log_values):
+        raise TypeError("Input must be a list or Vector")
+    
+    if not log_values:
+        raise ValueError("List cannot be empty")
+    
+    data = _storage(log_values, len(log_values))
+    if isinstance(log_values, list) and get_validation():
+        if not all(map(isinstance, data, repeat((int, float)))):
+            raise TypeError("All elements must be numeric")
+    
+    # Use the active backend's kernel if it has one
+    kernel = get_kernel('logsumexp', len(log_values))
+    if kernel is not None:
+        return kernel(log_values)
+    
+    top = max(data)
+    if top == -math.inf or top == math.inf:
+        return top
+    return top + math.log(sum(map(math.exp, map(operator.sub, data, repeat(top)))))
+
+
+def log_marginal_probability(log_joint_probs: Union[ProbabilityArray, List[ProbabilityArray]]) -> Union[float, Vector]:
+    """
+    Calculate a marginal probability in log space with logsumexp.
+    
+    log P(A) = log Σ P(A and Bi), computed from the log joint probabilities
+    without leaving log space.
+    
+    Args:
+        log_joint_probs (Union[ProbabilityArray, List[ProbabilityArray]]): Log
+            joint probabilities, or a batch of such rows for one marginal per row
+    
+    Returns:
+        Union[float, Vector]: log P(A), or a Vector of log-marginals for a batch
+    
+    Raises:
+        TypeError: If input is not a list/Vector or contains non-numeric values
+        ValueError: If a value is positive or NaN, or the probabilities sum
+            to more than 1
+    
+    Examples:
+        >>> import math
+        >>> from mlmath import log_marginal_probability
+        >>> math.exp(log_marginal_probability([math.log(0.25), math.log(0.5)]))
+        0.75
+    """
+    if not isinstance(log_joint_probs, (list, Vector)):
+        raise TypeError("Log joint probabilities must be a list")
+    
+    if not log_joint_probs:
+        raise ValueError("List cannot be empty")
+    
+    # A batch of rows gives one marginal per row
+    if isinstance(log_joint_probs, list) and _is_array(log_joint_probs[0]):
+        return Vector(map(_log_marginal, log_joint_probs))
+    
+    return _log_marginal(log_joint_probs)
+
+
+def _log_marginal(log_joint_probs: ProbabilityArray) -> float:
+    """Validate one array of log joint probabilities and return their logsumexp."""
+    if not _is_array(log_joint_probs):
+        raise TypeError("Log joint probabilities must be a list")
+    
+    _check_probability_array(log_joint_probs, "All log-probabilities", log=True)
+    return _log_total(logsumexp(log_joint_probs))
+
+
+def _log_total(result: float) -> float:
+    """Check that a log of summed probabilities is at most log(1) = 0."""
+    # Rounding can push a total of exactly 1 just above log(1) = 0
+    if result > _LOG_SUM_TOLERANCE:
+        raise ValueError("Sum of probabilities cannot exceed 1")
+    
+    return min(result, 0.0)
+
+
+# Slack allowed above 0 when a log-marginal should be exactly log(1)
+_LOG_SUM_TOLERANCE = 1e-12
+
+
+def _logaddexp(x: float, y: float) -> float:
+    """log(exp(x) + exp(y)) computed stably."""
+    if x < y:
+        x, y = y, x
+    if y == -math.inf:
+        return x
+    return x + math.log1p(math.exp(y - x))
+
+
+def _safe_log(p: float) -> float:
+    """Natural log that maps a probability of 0 to -inf instead of raising."""
+    return math.log(p) if p > 0 else -math.inf
+
+
+def _is_array(value) -> bool:
+    """Check whether an argument is an array of probabilities rather than a scalar."""
+    return isinstance(value, (list, Vector))
+
+
+def _storage(value, size: int):
+    """Iterable over an argument's values: the raw array of a Vector, the list itself, or a repeated scalar."""
+    if isinstance(value, Vector):
+        return value.data
+    if isinstance(value, list):
+        return value
+    return repeat(value, size)
+
+
+def _broadcast_length(*args) -> int:
+    """
+    Return the common length of the array arguments (scalars broadcast).
+    
+    Raises:
+        ValueError: If array arguments differ in length or are empty
+    """
+    lengths = {len(a) for a in args if _is_array(a)}
+    if len(lengths) > 1:
+        raise ValueError(f"All probability arrays must have the same length. Got {sorted(lengths)}")
+    
+    size = lengths.pop()
+    if size == 0:
+        raise ValueError("Probability arrays cannot be empty")
+    return size
+
+
+def _check_probability_array(value, name: str, log: bool = False) -> None:
+    """
+    Check that a scalar or array argument holds probabilities in [0, 1]
+    (or log-probabilities in [-inf, 0] when ``log`` is True).
+    
+    Arrays are checked with C-level passes over the whole array (min, max
+    and sum) and only searched element by element to report a failure.
+    The type scan is skipped for Vectors and while validation is disabled.
+    
+    Args:
+        value: Scalar, list or Vector argument
+        name (str): Argument description for error messages, e.g. "Prior probability"
+        log (bool): Check log-probabilities instead of probabilities
+    
+    Raises:
+        TypeError: If a value is not numeric
+        ValueError: If a value is outside [0, 1]
+    """
+    low, high = (-math.inf, 0) if log else (0, 1)
+    expected = "at most 0" if log else "between 0 and 1"
+    
+    if not _is_array(value):
+        if not isinstance(value, (int, float)):
+            raise TypeError("All inputs must be numeric")
+        if not low <= value <= high:
+            raise ValueError(f"{name} must be {expected}")
+        return
+    
+    data = _storage(value, len(value))
+    if not data:
+        # Nothing to range-check; callers that need elements reject empty input
+        return
+    
+    if isinstance(value, list) and get_validation():
+        if not all(map(isinstance, data, repeat((int, float)))):
+            index = next(i for i, p in enumerate(data) if not isinstance(p, (int, float)))
+            raise TypeError(f"All probabilities must be numeric. Found non-numeric value at index {index}")
+    
+    # min/max can step over a NaN, but any NaN makes the sum NaN
+    total = sum(data)
+    if not (min(data) >= low and max(data) <= high and total == total):
+        index = next(i for i, p in enumerate(data) if not low <= p <= high)
+        raise ValueError(f"{name} must be {expected} (at index {index})")
+
@@ -0,0 +1,647 @@
+"""
+Sparse Operations Module
+========================
+
+This module provides sparse vector and matrix types for data that is mostly zeros,
+such as one-hot encoded features produced by pandas.get_dummies.
+
+Only the non-zero entries are stored, so memory and time scale with the number
+of non-zeros (nnz) instead of rows × cols.
+
+Classes:
+    - SparseVector: Vector storing (index, value) pairs for non-zero entries
+    - CSRMatrix: Compressed Sparse Row matrix
+
+Functions:
+    - sparse_dot(a, b): Dot product where either operand may be a SparseVector
+    - sparse_matrix_multiply(A, B): Product where either operand may be a CSRMatrix
+    - sparse_matrix_add(A, B): Element-wise sum where either operand may be a CSRMatrix
+    - sparse_matrix_subtract(A, B): Element-wise difference where either operand may be a CSRMatrix
+
+The mlmath functions dot_product, matrix_multiply, matrix_transpose, matrix_add
+and matrix_subtract recognise these types automatically, so they rarely need
+to be called directly. Sparse-sparse operations return sparse results; any
+operation that involves a dense operand returns a dense list result.
+
+Author: GitHub Copilot
+Date: July 27, 2025
+"""
+
+import operator
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple, Union
+
+from .config import get_validation
+
+# Type alias for dense matrix
+Matrix = List[List[Union[int, float]]]
+
+
+class SparseVector:
+    """
+    A vector that stores only its non-zero entries.
+    
+    Indices are kept sorted in an ``array('q')`` and values in a parallel
+    ``array('d')``.
+    
+    Args:
+        size (int): Length of the (dense) vector
+        indices (Sequence[int]): Positions of the non-zero entries
+        values (Sequence[Union[int, float]]): Values at those positions
+    
+    Raises:
+        TypeError: If size is not an integer or values are not numeric
+        ValueError: If indices and values differ in length, or an index is
+            out of range or repeated
+    
+    Examples:
+        >>> from mlmath import SparseVector, dot_product
+        >>> v = SparseVector.from_dense([0, 3, 0, 0, 5])
+        >>> v.nnz
+        2
+        >>> v.to_dense()
+        [0.0, 3.0, 0.0, 0.0, 5.0]
+        >>> dot_product(v, [1, 1, 1, 1, 1])
+        8.0
+    """
+    
+    __slots__ = ('size', 'indices', 'values')
+    
+    def __init__(self, size: int, indices: Sequence[int] = (), values: Sequence[Union[int, float]] = ()):
+        if not isinstance(size, int) or size < 0:
+            raise TypeError("Size must be a non-negative integer")
+        
+        if len(indices) != len(values):
+            raise ValueError("indices and values must have the same length")
+        
+        # Sort by index and reject duplicates / out-of-range positions
+        pairs = sorted(zip(indices, values))
+        previous = -1
+        for index, _ in pairs:
+            if not isinstance(index, int) or not 0 <= index < size:
+                raise ValueError(f"Index {index} is out of range for size {size}")
+            if index == previous:
+                raise ValueError(f"Duplicate index {index}")
+            previous = index
+        
+        try:
+            self.values = array('d', [value for _, value in pairs])
+        except TypeError:
+            raise TypeError("All values must be numeric") from None
+        self.indices = array('q', [index for index, _ in pairs])
+        self.size = size
+    
+    @classmethod
+    def from_dense(cls, dense: Sequence[Union[int, float]]) -> 'SparseVector':
+        """
+        Create a SparseVector from a dense list, keeping only non-zero entries.
+        
+        Args:
+            dense (Sequence[Union[int, float]]): Dense vector
+        
+        Returns:
+            SparseVector: Sparse representation of the vector
+        
+        Raises:
+            TypeError: If the vector contains non-numeric values
+        """
+        vector = cls.__new__(cls)
+        vector.size = len(dense)
+        vector.indices = array('q')
+        vector.values = array('d')
+        for i, x in enumerate(dense):
+            # Test the type first: None and '' are falsy but not zeros
+            if not isinstance(x, (int, float)):
+                raise TypeError(f"All elements must be numeric. Found non-numeric value at index {i}")
+            if x:
+                vector.indices.append(i)
+                vector.values.append(x)
+        return vector
+    
+    @property
+    def nnz(self) -> int:
+        """Number of stored non-zero entries."""
+        return len(self.values)
+    
+    def to_dense(self) -> List[float]:
+        """Return the vector as a dense list."""
+        dense = [0.0] * self.size
+        for index, value in zip(self.indices, self.values):
+            dense[index] = value
+        return dense
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __getitem__(self, index: int) -> float:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("SparseVector index out of range")
+        position = bisect_left(self.indices, index)
+        if position < len(self.indices) and self.indices[position] == index:
+            return self.values[position]
+        return 0.0
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, SparseVector):
+            return NotImplemented
+        return (self.size == other.size and self.indices == other.indices
+                and self.values == other.values)
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return (f"SparseVector(size={self.size}, indices={self.indices.tolist()}, "
+                f"values={self.values.tolist()})")
+
+
+class CSRMatrix:
+    """
+    A sparse matrix in Compressed Sparse Row (CSR) format.
+    
+    Row i's non-zero entries are ``data[indptr[i]:indptr[i + 1]]`` at columns
+    ``indices[indptr[i]:indptr[i + 1]]``, with column indices sorted within
+    each row. The structure is validated once, when the matrix is built, and
+    trusted by every operation afterwards.
+    
+    Args:
+        data (Sequence[Union[int, float]]): Non-zero values, row by row
+        indices (Sequence[int]): Column index of each value
+        indptr (Sequence[int]): Row start offsets into data (length rows + 1)
+        shape (Tuple[int, int]): (rows, cols)
+    
+    Raises:
+        TypeError: If values are not numeric
+        ValueError: If the arrays are inconsistent with each other or the shape
+    
+    Examples:
+        >>> from mlmath import CSRMatrix, matrix_multiply
+        >>> A = CSRMatrix.from_dense([[1, 0, 0], [0, 0, 2]])
+        >>> A.nnz
+        2
+        >>> matrix_multiply(A, [[1], [1], [1]])
+        [[1.0], [2.0]]
+        >>> A.transpose().to_dense()
+        [[1.0, 0.0], [0.0, 0.0], [0.0, 2.0]]
+    """
+    
+    __slots__ = ('shape', 'data', 'indices', 'indptr')
+    
+    def __init__(self, data: Sequence[Union[int, float]], indices: Sequence[int],
+                 indptr: Sequence[int], shape: Tuple[int, int]):
+        rows, cols = shape
+        if not isinstance(rows, int) or not isinstance(cols, int) or rows < 0 or cols < 0:
+            raise ValueError("Shape must be a pair of non-negative integers")
+        
+        if len(indptr) != rows + 1 or indptr[0] != 0 or indptr[-1] != len(data):
+            raise ValueError("indptr must have rows + 1 entries, start at 0 and end at nnz")
+        
+        if len(indices) != len(data):
+            raise ValueError("data and indices must have the same length")
+        
+        for i in range(rows):
+            start, end = indptr[i], indptr[i + 1]
+            if start > end:
+                raise ValueError("indptr must be non-decreasing")
+            previous = -1
+            for k in range(start, end):
+                col = indices[k]
+                if not 0 <= col < cols or col <= previous:
+                    raise ValueError(f"Column indices in row {i} must be sorted, unique and < {cols}")
+                previous = col
+        
+        try:
+            self.data = array('d', data)
+        except TypeError:
+            raise TypeError("All values must be numeric") from None
+        self.indices = array('q', indices)
+        self.indptr = array('q', indptr)
+        self.shape = (rows, cols)
+    
+    @classmethod
+    def _from_arrays(cls, data: array, indices: array, indptr: array, shape: Tuple[int, int]) -> 'CSRMatrix':
+        """Wrap already-valid CSR arrays without copying or checking them."""
+        matrix = cls.__new__(cls)
+        matrix.data = data
+        matrix.indices = indices
+        matrix.indptr = indptr
+        matrix.shape = shape
+        return matrix
+    
+    @classmethod
+    def from_dense(cls, dense: Matrix) -> 'CSRMatrix':
+        """
+        Create a CSRMatrix from a dense list of lists, keeping only non-zeros.
+        
+        This accepts the row-list format of one-hot encoded data, e.g.
+        ``pd.get_dummies(df).values.tolist()`` (booleans count as 0 and 1).
+        
+        Args:
+            dense (Matrix): Dense matrix (list of equal-length rows)
+        
+        Returns:
+            CSRMatrix: Sparse representation of the matrix
+        
+        Raises:
+            TypeError: If input is not a list of lists or contains non-numeric values
+            ValueError: If the matrix is empty or rows differ in length
+        """
+        _check_dense(dense, "Matrix")
+        
+        data, indices, indptr = array('d'), array('q'), array('q', [0])
+        for i, row in enumerate(dense):
+            for j, x in enumerate(row):
+                if not isinstance(x, (int, float)):
+                    raise TypeError(f"All elements must be numeric. Found non-numeric value at [{i}][{j}]")
+                if x:
+                    indices.append(j)
+                    data.append(x)
+            indptr.append(len(data))
+        return cls._from_arrays(data, indices, indptr, (len(dense), len(dense[0])))
+    
+    @classmethod
+    def from_coo(cls, rows: Sequence[int], cols: Sequence[int],
+                 values: Sequence[Union[int, float]], shape: Tuple[int, int]) -> 'CSRMatrix':
+        """
+        Create a CSRMatrix from coordinate (COO) triplets.
+        
+        Duplicate (row, col) entries are summed.
+        
+        Args:
+            rows (Sequence[int]): Row index of each entry
+            cols (Sequence[int]): Column index of each entry
+            values (Sequence[Union[int, float]]): Value of each entry
+            shape (Tuple[int, int]): (rows, cols)
+        
+        Returns:
+            CSRMatrix: Sparse matrix
+        
+        Raises:
+            TypeError: If values contains non-numeric values
+            ValueError: If the triplet lists differ in length or an index is out of range
+        
+        Examples:
+            >>> from mlmath import CSRMatrix
+            >>> CSRMatrix.from_coo([0, 1, 1], [2, 0, 0], [5, 1, 2], (2, 3)).to_dense()
+            [[0.0, 0.0, 5.0], [3.0, 0.0, 0.0]]
+        """
+        if not len(rows) == len(cols) == len(values):
+            raise ValueError("rows, cols and values must have the same length")
+        
+        n_rows, n_cols = shape
+        row_maps: List[Dict[int, float]] = [{} for _ in range(n_rows)]
+        for index, (i, j, value) in enumerate(zip(rows, cols, values)):
+            if not isinstance(value, (int, float)):
+                raise TypeError(f"All elements must be numeric. Found non-numeric value at index {index}")
+            if not 0 <= i < n_rows or not 0 <= j < n_cols:
+                raise ValueError(f"Entry ({i}, {j}) is out of range for shape {shape}")
+            row_maps[i][j] = row_maps[i].get(j, 0) + value
+        return _from_row_maps(row_maps, n_cols)
+    
+    @property
+    def nnz(self) -> int:
+        """Number of stored non-zero entries."""
+        return len(self.data)
+    
+    def to_dense(self) -> Matrix:
+        """Return the matrix as a dense list of lists."""
+        rows, cols = self.shape
+        dense = []
+        for i in range(rows):
+            row = [0.0] * cols
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                row[self.indices[k]] = self.data[k]
+            dense.append(row)
+        return dense
+    
+    def to_coo(self) -> Tuple[List[int], List[int], List[float]]:
+        """
+        Return the matrix as coordinate (COO) triplets.
+        
+        Returns:
+            Tuple[List[int], List[int], List[float]]: (rows, cols, values)
+        """
+        row_index = []
+        for i in range(self.shape[0]):
+            row_index.extend([i] * (self.indptr[i + 1] - self.indptr[i]))
+        return row_index, self.indices.tolist(), self.data.tolist()
+    
+    def getrow(self, i: int) -> SparseVector:
+        """
+        Return row i as a SparseVector.
+        
+        Args:
+            i (int): Row index
+        
+        Returns:
+            SparseVector: The row's non-zero entries
+        """
+        if not 0 <= i < self.shape[0]:
+            raise IndexError("Row index out of range")
+        start, end = self.indptr[i], self.indptr[i + 1]
+        row = SparseVector.__new__(SparseVector)
+        row.size = self.shape[1]
+        row.indices = self.indices[start:end]
+        row.values = self.data[start:end]
+        return row
+    
+    def transpose(self) -> 'CSRMatrix':
+        """
+        Return the transpose as a new CSRMatrix in O(nnz + rows + cols) time.
+        
+        Returns:
+            CSRMatrix: Transposed matrix
+        """
+        rows, cols = self.shape
+        
+        # Count entries per column to build the transposed row pointers
+        counts = [0] * (cols + 1)
+        for col in self.indices:
+            counts[col + 1] += 1
+        for j in range(cols):
+            counts[j + 1] += counts[j]
+        indptr = array('q', counts)
+        
+        # Scatter entries; walking rows in order keeps each new row sorted
+        position = counts[:-1]
+        data = array('d', bytes(8 * self.nnz))
+        indices = array('q', bytes(8 * self.nnz))
+        for i in range(rows):
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                col = self.indices[k]
+                target = position[col]
+                data[target] = self.data[k]
+                indices[target] = i
+                position[col] = target + 1
+        
+        return CSRMatrix._from_arrays(data, indices, indptr, (cols, rows))
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CSRMatrix):
+            return NotImplemented
+        return (self.shape == other.shape and self.indptr == other.indptr
+                and self.indices == other.indices and self.data == other.data)
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"CSRMatrix(shape={self.shape}, nnz={self.nnz})"
+
+
+def sparse_dot(a, b) -> float:
+    """
+    Calculate a dot product where either operand may be a SparseVector.
+    
+    Sparse-sparse products merge the two sorted index lists; sparse-dense
+    products only visit the sparse operand's non-zeros.
+    
+    Args:
+        a (Union[SparseVector, List, Vector]): First vector
+        b (Union[SparseVector, List, Vector]): Second vector
+    
+    Returns:
+        float: Dot product
+    
+    Raises:
+        ValueError: If the vectors have different lengths
+        TypeError: If a dense operand contains non-numeric values
+    """
+    if len(a) != len(b):
+        raise ValueError(f"Vectors must have the same length. Got {len(a)} and {len(b)}")
+    
+    if isinstance(a, SparseVector) and isinstance(b, SparseVector):
+        # Merge the two sorted index lists
+        total = 0.0
+        i = j = 0
+        a_indices, b_indices = a.indices, b.indices
+        while i < len(a_indices) and j < len(b_indices):
+            if a_indices[i] == b_indices[j]:
+                total += a.values[i] * b.values[j]
+                i += 1
+                j += 1
+            elif a_indices[i] < b_indices[j]:
+                i += 1
+            else:
+                j += 1
+        return total
+    
+    sparse, dense = (a, b) if isinstance(a, SparseVector) else (b, a)
+    if isinstance(dense, list) and get_validation():
+        for i, x in enumerate(dense):
+            if not isinstance(x, (int, float)):
+                raise TypeError(f"All elements must be numeric. Found non-numeric value at index {i}")
+    
+    # Only the sparse operand's non-zero positions contribute
+    return sum(map(operator.mul, sparse.values, map(dense.__getitem__, sparse.indices)), 0.0)
+
+
+def sparse_matrix_multiply(A, B):
+    """
+    Multiply two matrices where either operand may be a CSRMatrix.
+    
+    Args:
+        A (Union[CSRMatrix, Matrix]): First matrix (m × n)
+        B (Union[CSRMatrix, Matrix]): Second matrix (n × p)
+    
+    Returns:
+        Union[CSRMatrix, Matrix]: A CSRMatrix if both operands are sparse,
+            otherwise a dense list of lists
+    
+    Raises:
+        ValueError: If the matrices have incompatible dimensions
+        TypeError: If a dense operand is not a valid numeric list of lists
+    """
+    if not isinstance(A, CSRMatrix):
+        _check_dense(A, "First matrix")
+    if not isinstance(B, CSRMatrix):
+        _check_dense(B, "Second matrix")
+    
+    rows_A, cols_A = _shape(A)
+    rows_B, cols_B = _shape(B)
+    if cols_A != rows_B:
+        raise ValueError(f"Cannot multiply matrices: {rows_A}×{cols_A} and {rows_B}×{cols_B}. "
+                         f"Number of columns in first matrix ({cols_A}) must equal "
+                         f"number of rows in second matrix ({rows_B})")
+    
+    if isinstance(A, CSRMatrix) and isinstance(B, CSRMatrix):
+        return _multiply_sparse_sparse(A, B)
+    if isinstance(A, CSRMatrix):
+        return _multiply_sparse_dense(A, B)
+    return _multiply_dense_sparse(A, B)
+
+
+def sparse_matrix_add(A, B):
+    """
+    Add two matrices element-wise where either operand may be a CSRMatrix.
+    
+    Args:
+        A (Union[CSRMatrix, Matrix]): First matrix
+        B (Union[CSRMatrix, Matrix]): Second matrix
+    
+    Returns:
+        Union[CSRMatrix, Matrix]: A CSRMatrix if both operands are sparse,
+            otherwise a dense list of lists
+    
+    Raises:
+        ValueError: If the matrices have different dimensions
+    """
+    return _combine(A, B, operator.add, "addition")
+
+
+def sparse_matrix_subtract(A, B):
+    """
+    Subtract two matrices element-wise (A - B) where either operand may be a CSRMatrix.
+    
+    Args:
+        A (Union[CSRMatrix, Matrix]): First matrix (minuend)
+        B (Union[CSRMatrix, Matrix]): Second matrix (subtrahend)
+    
+    Returns:
+        Union[CSRMatrix, Matrix]: A CSRMatrix if both operands are sparse,
+            otherwise a dense list of lists
+    
+    Raises:
+        ValueError: If the matrices have different dimensions
+    """
+    return _combine(A, B, operator.sub, "subtraction")
+
+
+def _multiply_sparse_sparse(A: CSRMatrix, B: CSRMatrix) -> CSRMatrix:
+    """Gustavson's row-by-row sparse product: work is proportional to the flops, not m × p."""
+    row_maps = []
+    for i in range(A.shape[0]):
+        accumulator: Dict[int, float] = {}
+        for k in range(A.indptr[i], A.indptr[i + 1]):
+            a_ik = A.data[k]
+            row = A.indices[k]
+            for t in range(B.indptr[row], B.indptr[row + 1]):
+                col = B.indices[t]
+                accumulator[col] = accumulator.get(col, 0.0) + a_ik * B.data[t]
+        row_maps.append(accumulator)
+    return _from_row_maps(row_maps, B.shape[1])
+
+
+def _multiply_sparse_dense(A: CSRMatrix, B: Matrix) -> Matrix:
+    """Sparse × dense: each non-zero A[i][k] adds a scaled copy of B's row k."""
+    cols_B = len(B[0])
+    result = []
+    for i in range(A.shape[0]):
+        row = [0.0] * cols_B
+        for k in range(A.indptr[i], A.indptr[i + 1]):
+            a_ik = A.data[k]
+            row = [c + a_ik * b for c, b in zip(row, B[A.indices[k]])]
+        result.append(row)
+    return result
+
+
+def _multiply_dense_sparse(A: Matrix, B: CSRMatrix) -> Matrix:
+    """Dense × sparse: each non-zero A[i][k] scatters into the columns of B's row k."""
+    cols_B = B.shape[1]
+    data, indices, indptr = B.data, B.indices, B.indptr
+    result = []
+    for row_A in A:
+        row = [0.0] * cols_B
+        for k, a_ik in enumerate(row_A):
+            if a_ik:
+                for t in range(indptr[k], indptr[k + 1]):
+                    row[indices[t]] += a_ik * data[t]
+        result.append(row)
+    return result
+
+
+def _combine(A, B, op, operation: str):
+    """Shared implementation of sparse element-wise addition and subtraction."""
+    if not isinstance(A, CSRMatrix):
+        _check_dense(A, "First matrix")
+    if not isinstance(B, CSRMatrix):
+        _check_dense(B, "Second matrix")
+    
+    rows_A, cols_A = _shape(A)
+    rows_B, cols_B = _shape(B)
+    if rows_A != rows_B or cols_A != cols_B:
+        raise ValueError(f"Cannot perform {operation} on matrices with different dimensions: "
+                         f"{rows_A}×{cols_A} and {rows_B}×{cols_B}")
+    
+    if isinstance(A, CSRMatrix) and isinstance(B, CSRMatrix):
+        # Merge row by row; only rows' non-zeros are touched
+        row_maps = []
+        for i in range(rows_A):
+            merged = {A.indices[k]: A.data[k] for k in range(A.indptr[i], A.indptr[i + 1])}
+            for k in range(B.indptr[i], B.indptr[i + 1]):
+                col = B.indices[k]
+                merged[col] = op(merged.get(col, 0.0), B.data[k])
+            row_maps.append(merged)
+        return _from_row_maps(row_maps, cols_A)
+    
+    # At least one operand is dense: the result is dense
+    if isinstance(A, CSRMatrix):
+        result = [[op(0.0, x) for x in row] for row in B]
+        for i in range(rows_A):
+            for k in range(A.indptr[i], A.indptr[i + 1]):
+                col = A.indices[k]
+                result[i][col] = op(A.data[k], B[i][col])
+    else:
+        result = [list(row) for row in A]
+        for i in range(rows_A):
+            for k in range(B.indptr[i], B.indptr[i + 1]):
+                col = B.indices[k]
+                result[i][col] = op(result[i][col], B.data[k])
+    return result
+
+
+def _from_row_maps(row_maps: List[Dict[int, float]], cols: int) -> CSRMatrix:
+    """Build a CSRMatrix from one {col: value} dict per row, dropping exact zeros."""
+    data, indices, indptr = array('d'), array('q'), array('q', [0])
+    for row in row_maps:
+        for col in sorted(row):
+            value = row[col]
+            if value != 0:
+                indices.append(col)
+                data.append(value)
+        indptr.append(len(data))
+    return CSRMatrix._from_arrays(data, indices, indptr, (len(row_maps), cols))
+
+
+def _shape(A) -> Tuple[int, int]:
+    """Shape of a CSRMatrix or a validated dense matrix."""
+    if isinstance(A, CSRMatrix):
+        return A.shape
+    return len(A), len(A[0])
+
+
+def _check_dense(A, name: str) -> None:
+    """
+    Validate a dense list-of-lists operand used alongside a sparse one.
+    
+    Args:
+        A: Operand to check
+        name (str): Operand name for error messages
+    
+    Raises:
+        TypeError: If A is not a list of lists or contains non-numeric values
+        ValueError: If A is empty or its rows differ in length
+    """
+    if not isinstance(A, list):
+        raise TypeError(f"{name} must be a CSRMatrix or a list of lists")
+    
+    if not A:
+        raise ValueError(f"{name} cannot be empty")
+    if not isinstance(A[0], list):
+        raise TypeError(f"{name} must be a list of lists")
+    if not A[0]:
+        raise ValueError(f"{name} cannot be empty")
+    
+    if not get_validation():
+        return
+    
+    cols = len(A[0])
+    for i, row in enumerate(A):
+        if not isinstance(row, list):
+            raise TypeError(f"{name} must be a list of lists")
+        if len(row) != cols:
+            raise ValueError(f"All rows in {name.lower()} must have the same length")
+        for j, val in enumerate(row):
+            if not isinstance(val, (int, float)):
+                raise TypeError(f"All elements must be numeric. Found non-numeric value at [{i}][{j}]")
@@ -4,38 +4,237 @@ Vector Operations Module
 
 This module provides essential vector operations for machine learning and linear algebra.
 
+Classes:
+    - Vector: Contiguous, array-backed vector of doubles
+
 Functions:
     - dot_product(a, b): Calculate dot product of two vectors
     - vector_add(a, b): Add two vectors element-wise
     - vector_subtract(a, b): Subtract two vectors element-wise
+    - vector_iadd(a, b), vector_isub(a, b): In-place a += b, a -= b
+    - axpy(alpha, x, y): In-place y += alpha * x
     - vector_magnitude(a): Calculate the magnitude (length) of a vector
     - vector_normalize(a): Normalize a vector to unit length
+    - batch_dot(A, B): Row-wise dot products of two batches of vectors
+    - dot_product_many(q, M): Dot product of one vector against many
+    - batch_magnitude(M): Magnitudes of a batch of vectors
+    - batch_normalize(M): Normalize a batch of vectors to unit length
+
+All functions accept plain lists or Vector instances. When any operand is a
+Vector the result is a Vector as well, computed directly on the underlying
+array storage without converting through lists.
+
+vector_add and vector_subtract take an optional ``out`` list or Vector that
+receives the result instead of a new allocation; the in-place variants and
+axpy write into their first vector operand. Hot loops (gradient updates,
+centroid accumulation) can reuse one preallocated buffer per step.
+
+After validation each function hands off to the active backend's kernel when
+one is available (see mlmath.set_backend); otherwise the pure Python code
+below is used.
+
+Element-by-element type checks are only run for list operands and only while
+validation is enabled (see mlmath.set_validation); a Vector is proven numeric
+when it is constructed and is trusted afterwards.
 
 Author: GitHub Copilot
 Date: July 27, 2025
 """
 
 import math
-from typing import List, Union
+import operator
+from array import array
+from itertools import repeat
+from typing import Iterable, List, Union
+
+from .backend import get_kernel
+from .config import get_validation
+from .sparse import SparseVector, sparse_dot
 
 
-def dot_product(a: List[Union[int, float]], b: List[Union[int, float]]) -> Union[int, float]:
+class Vector:
+    """
+    A dense vector of floats stored in a contiguous ``array('d')`` buffer.
+    
+    Unlike a Python list, the elements are stored as raw C doubles rather than
+    individually boxed float objects, which keeps large vectors (hundreds or
+    thousands of dimensions) compact in memory. Because the storage can only
+    ever hold doubles, a Vector does not need per-element type checks when it
+    is passed to mlmath functions.
+    
+    Vector supports the buffer protocol through ``memoryview(v.data)``, so it
+    can be shared with other array libraries without copying.
+    
+    Args:
+        values (Iterable[Union[int, float]]): Initial values (default: empty)
+    
+    Raises:
+        TypeError: If any value is not numeric
+    
+    Examples:
+        >>> from mlmath import Vector, dot_product
+        >>> v = Vector([1, 2, 3])
+        >>> v
+        Vector([1.0, 2.0, 3.0])
+        >>> dot_product(v, Vector([4, 5, 6]))
+        32.0
+        >>> v.tolist()
+        [1.0, 2.0, 3.0]
+    """
+    
+    __slots__ = ('_data',)
+    
+    def __init__(self, values: Iterable[Union[int, float]] = ()):
+        if isinstance(values, Vector):
+            values = values._data
+        try:
+            self._data = array('d', values)
+        except TypeError:
+            raise TypeError("All elements must be numeric") from None
+    
+    @classmethod
+    def _from_array(cls, data: array) -> 'Vector':
+        """Wrap an existing ``array('d')`` without copying it."""
+        vector = cls.__new__(cls)
+        vector._data = data
+        return vector
+    
+    @classmethod
+    def zeros(cls, n: int) -> 'Vector':
+        """
+        Create a Vector of ``n`` zeros.
+        
+        Args:
+            n (int): Number of elements
+        
+        Returns:
+            Vector: Zero vector of length n
+        
+        Raises:
+            TypeError: If n is not an integer
+            ValueError: If n is negative
+        """
+        if not isinstance(n, int):
+            raise TypeError("Size must be an integer")
+        if n < 0:
+            raise ValueError("Size cannot be negative")
+        return cls._from_array(array('d', bytes(8 * n)))
+    
+    @classmethod
+    def frombuffer(cls, buffer) -> 'Vector':
+        """
+        Create a Vector from any object exporting a buffer of native doubles.
+        
+        Args:
+            buffer: bytes, bytearray, memoryview or any buffer-protocol object
+        
+        Returns:
+            Vector: Vector holding a copy of the buffer contents
+        
+        Raises:
+            ValueError: If the buffer size is not a multiple of 8 bytes
+        """
+        data = array('d')
+        data.frombytes(memoryview(buffer).cast('B'))
+        return cls._from_array(data)
+    
+    @property
+    def data(self) -> array:
+        """The underlying ``array('d')`` storage (shared, not copied)."""
+        return self._data
+    
+    def tolist(self) -> List[float]:
+        """Return the elements as a plain Python list."""
+        return self._data.tolist()
+    
+    def copy(self) -> 'Vector':
+        """Return an independent copy of this Vector."""
+        return Vector._from_array(array('d', self._data))
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __iter__(self):
+        return iter(self._data)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Vector._from_array(self._data[index])
+        return self._data[index]
+    
+    def __setitem__(self, index, value):
+        self._data[index] = value
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Vector):
+            return self._data == other._data
+        if isinstance(other, (list, tuple, array)):
+            return len(self._data) == len(other) and all(map(operator.eq, self._data, other))
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"Vector({self._data.tolist()})"
+
+
+def _as_storage(a: Union[List[Union[int, float]], Vector]):
+    """Return the object to iterate over: the raw array for a Vector, else the list itself."""
+    return a._data if isinstance(a, Vector) else a
+
+
+def _check_vector_type(a, message: str) -> None:
+    """Raise TypeError unless ``a`` is a list or a Vector."""
+    if not isinstance(a, (list, Vector)):
+        raise TypeError(message)
+
+
+def _check_numeric(a) -> None:
+    """Scan a list operand for non-numeric elements (skipped for Vectors or when validation is off)."""
+    if isinstance(a, Vector) or not get_validation():
+        return
+    
+    for i, x in enumerate(a):
+        if not isinstance(x, (int, float)):
+            raise TypeError(f"All elements must be numeric. Found non-numeric value at index {i}")
+
+
+def _check_numeric_pair(a, b) -> None:
+    """Scan two equal-length operands for non-numeric elements, reporting the first bad index."""
+    if (isinstance(a, Vector) and isinstance(b, Vector)) or not get_validation():
+        return
+    
+    for i, (x, y) in enumerate(zip(a, b)):
+        if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
+            raise TypeError(f"All elements must be numeric. Found non-numeric values at index {i}")
+
+
+def _magnitude(data) -> float:
+    """Euclidean norm kernel over already-validated storage."""
+    return math.sqrt(sum(map(operator.mul, data, data)))
+
+
+def dot_product(a: Union[List[Union[int, float]], Vector],
+                b: Union[List[Union[int, float]], Vector]) -> Union[int, float]:
     """
     Calculate the dot product of two vectors.
     
     The dot product is the sum of the products of corresponding elements:
     dot_product([a1, a2, a3], [b1, b2, b3]) = a1*b1 + a2*b2 + a3*b3
     
+    Either operand may also be a SparseVector, in which case only its
+    non-zero entries are visited.
+    
     Args:
-        a (List[Union[int, float]]): First vector
-        b (List[Union[int, float]]): Second vector
+        a (Union[List[Union[int, float]], Vector, SparseVector]): First vector
+        b (Union[List[Union[int, float]], Vector, SparseVector]): Second vector
     
     Returns:
         Union[int, float]: Dot product of the two vectors
     
     Raises:
         ValueError: If vectors have different lengths
-        TypeError: If inputs are not lists or contain non-numeric values
+        TypeError: If inputs are not lists/Vectors or contain non-numeric values
     
     Examples:
         >>> from mlmath import dot_product
@@ -48,9 +247,16 @@ def dot_product(a: List[Union[int, float]], b: List[Union[int, float]]) -> Union
         >>> dot_product([1, 0, 0], [0, 1, 0])
         0
     """
+    # Sparse operands only visit their non-zero entries
+    if isinstance(a, SparseVector) or isinstance(b, SparseVector):
+        for x in (a, b):
+            if not isinstance(x, SparseVector):
+                _check_vector_type(x, "Both inputs must be lists, Vectors or SparseVectors")
+        return sparse_dot(a, b)
+    
     # Type checking
-    if not isinstance(a, list) or not isinstance(b, list):
-        raise TypeError("Both inputs must be lists")
+    _check_vector_type(a, "Both inputs must be lists or Vectors")
+    _check_vector_type(b, "Both inputs must be lists or Vectors")
     
     # Length checking
     if len(a) != len(b):
@@ -60,29 +266,39 @@ def dot_product(a: List[Union[int, float]], b: List[Union[int, float]]) -> Union
     if len(a) == 0:
         return 0
     
-    # Check that all elements are numeric
-    for i, (x, y) in enumerate(zip(a, b)):
-        if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
-            raise TypeError(f"All elements must be numeric. Found non-numeric values at index {i}")
+    # Check that all elements are numeric (Vector storage is always numeric)
+    _check_numeric_pair(a, b)
+    
+    # Use the active backend's kernel if it has one
+    kernel = get_kernel('dot_product', len(a))
+    if kernel is not None:
+        return kernel(a, b)
     
     # Calculate dot product
-    return sum(x * y for x, y in zip(a, b))
+    return sum(map(operator.mul, _as_storage(a), _as_storage(b)))
 
 
-def vector_add(a: List[Union[int, float]], b: List[Union[int, float]]) -> List[Union[int, float]]:
+def vector_add(a: Union[List[Union[int, float]], Vector],
+               b: Union[List[Union[int, float]], Vector],
+               out: Union[List[Union[int, float]], Vector, None] = None) -> Union[List[Union[int, float]], Vector]:
     """
     Add two vectors element-wise.
     
     Args:
-        a (List[Union[int, float]]): First vector
-        b (List[Union[int, float]]): Second vector
+        a (Union[List[Union[int, float]], Vector]): First vector
+        b (Union[List[Union[int, float]], Vector]): Second vector
+        out (Union[List[Union[int, float]], Vector, None]): Optional list or
+            Vector of the same length to write the result into; it may be a
+            or b itself (default: None, allocate a new result)
     
     Returns:
-        List[Union[int, float]]: Sum of the two vectors
+        Union[List[Union[int, float]], Vector]: Sum of the two vectors
+            (out if given, else a Vector if either input is a Vector,
+            otherwise a list)
     
     Raises:
-        ValueError: If vectors have different lengths
-        TypeError: If inputs are not lists or contain non-numeric values
+        ValueError: If vectors (or out) have different lengths
+        TypeError: If inputs are not lists/Vectors or contain non-numeric values
     
     Examples:
         >>> from mlmath import vector_add
@@ -91,38 +307,37 @@ def vector_add(a: List[Union[int, float]], b: List[Union[int, float]]) -> List[U
         
         >>> vector_add([1.5, 2.5], [0.5, 1.5])
         [2.0, 4.0]
+        
+        >>> total = [0, 0]
+        >>> vector_add([1, 2], [3, 4], out=total)
+        [4, 6]
+        >>> total
+        [4, 6]
     """
-    # Type checking
-    if not isinstance(a, list) or not isinstance(b, list):
-        raise TypeError("Both inputs must be lists")
-    
-    # Length checking
-    if len(a) != len(b):
-        raise ValueError(f"Vectors must have the same length. Got {len(a)} and {len(b)}")
-    
-    # Check that all elements are numeric
-    for i, (x, y) in enumerate(zip(a, b)):
-        if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
-            raise TypeError(f"All elements must be numeric. Found non-numeric values at index {i}")
-    
-    # Calculate element-wise addition
-    return [x + y for x, y in zip(a, b)]
+    return _elementwise(a, b, operator.add, 'vector_add', out)
 
 
-def vector_subtract(a: List[Union[int, float]], b: List[Union[int, float]]) -> List[Union[int, float]]:
+def vector_subtract(a: Union[List[Union[int, float]], Vector],
+                    b: Union[List[Union[int, float]], Vector],
+                    out: Union[List[Union[int, float]], Vector, None] = None) -> Union[List[Union[int, float]], Vector]:
     """
     Subtract two vectors element-wise (a - b).
     
     Args:
-        a (List[Union[int, float]]): First vector (minuend)
-        b (List[Union[int, float]]): Second vector (subtrahend)
+        a (Union[List[Union[int, float]], Vector]): First vector (minuend)
+        b (Union[List[Union[int, float]], Vector]): Second vector (subtrahend)
+        out (Union[List[Union[int, float]], Vector, None]): Optional list or
+            Vector of the same length to write the result into; it may be a
+            or b itself (default: None, allocate a new result)
     
     Returns:
-        List[Union[int, float]]: Difference of the two vectors
+        Union[List[Union[int, float]], Vector]: Difference of the two vectors
+            (out if given, else a Vector if either input is a Vector,
+            otherwise a list)
     
     Raises:
-        ValueError: If vectors have different lengths
-        TypeError: If inputs are not lists or contain non-numeric values
+        ValueError: If vectors (or out) have different lengths
+        TypeError: If inputs are not lists/Vectors or contain non-numeric values
     
     Examples:
         >>> from mlmath import vector_subtract
@@ -132,37 +347,191 @@ def vector_subtract(a: List[Union[int, float]], b: List[Union[int, float]]) -> L
         >>> vector_subtract([3.0, 4.0], [1.5, 2.5])
         [1.5, 1.5]
     """
+    return _elementwise(a, b, operator.sub, 'vector_subtract', out)
+
+
+def _elementwise(a, b, op, operation: str, out=None) -> Union[List[Union[int, float]], Vector]:
+    """Shared validation and kernel for element-wise binary vector operations."""
     # Type checking
-    if not isinstance(a, list) or not isinstance(b, list):
-        raise TypeError("Both inputs must be lists")
+    _check_vector_type(a, "Both inputs must be lists or Vectors")
+    _check_vector_type(b, "Both inputs must be lists or Vectors")
     
     # Length checking
     if len(a) != len(b):
         raise ValueError(f"Vectors must have the same length. Got {len(a)} and {len(b)}")
     
-    # Check that all elements are numeric
-    for i, (x, y) in enumerate(zip(a, b)):
-        if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
-            raise TypeError(f"All elements must be numeric. Found non-numeric values at index {i}")
+    if out is not None:
+        _check_out(out, len(a))
+    
+    a_is_vector = isinstance(a, Vector)
+    b_is_vector = isinstance(b, Vector)
+    
+    # Check that all elements are numeric (Vector storage is always numeric)
+    _check_numeric_pair(a, b)
+    
+    # Use the active backend's kernel if it has one
+    if out is not None:
+        kernel = get_kernel(operation + '_out', len(a))
+        if kernel is not None:
+            return kernel(a, b, out)
+        return _write(out, map(op, _as_storage(a), _as_storage(b)))
+    
+    kernel = get_kernel(operation, len(a))
+    if kernel is not None:
+        return kernel(a, b)
+    
+    # Calculate element-wise result
+    values = map(op, _as_storage(a), _as_storage(b))
+    if a_is_vector or b_is_vector:
+        return Vector._from_array(array('d', values))
+    return list(values)
+
+
+def _check_out(out, length: int) -> None:
+    """Raise unless ``out`` is a list or Vector that can hold ``length`` results."""
+    _check_vector_type(out, "out must be a list or Vector")
+    
+    if len(out) != length:
+        raise ValueError(f"out must have the same length as the inputs. Got {len(out)} and {length}")
+
+
+def _write(out, values: Iterable[float]) -> Union[List[Union[int, float]], Vector]:
+    """
+    Overwrite the contents of ``out`` with ``values`` and return ``out``.
+    
+    Each value is stored as soon as it is produced, without a temporary
+    copy. ``out`` may still be one of the operands that produced them: the
+    value for index i only reads index i of the inputs.
+    """
+    buffer = out._data if isinstance(out, Vector) else out
+    for i, value in enumerate(values):
+        buffer[i] = value
+    return out
+
+
+def vector_iadd(a: Union[List[Union[int, float]], Vector],
+                b: Union[List[Union[int, float]], Vector]) -> Union[List[Union[int, float]], Vector]:
+    """
+    Add b to a in place (a += b).
+    
+    Equivalent to vector_add(a, b, out=a).
+    
+    Args:
+        a (Union[List[Union[int, float]], Vector]): Vector to update
+        b (Union[List[Union[int, float]], Vector]): Vector to add
+    
+    Returns:
+        Union[List[Union[int, float]], Vector]: a, after the update
+    
+    Raises:
+        ValueError: If vectors have different lengths
+        TypeError: If inputs are not lists/Vectors or contain non-numeric values
+    
+    Examples:
+        >>> from mlmath import vector_iadd
+        >>> total = [1, 2]
+        >>> vector_iadd(total, [3, 4])
+        [4, 6]
+        >>> total
+        [4, 6]
+    """
+    return _elementwise(a, b, operator.add, 'vector_add', a)
+
+
+def vector_isub(a: Union[List[Union[int, float]], Vector],
+                b: Union[List[Union[int, float]], Vector]) -> Union[List[Union[int, float]], Vector]:
+    """
+    Subtract b from a in place (a -= b).
+    
+    Equivalent to vector_subtract(a, b, out=a).
+    
+    Args:
+        a (Union[List[Union[int, float]], Vector]): Vector to update
+        b (Union[List[Union[int, float]], Vector]): Vector to subtract
+    
+    Returns:
+        Union[List[Union[int, float]], Vector]: a, after the update
+    
+    Raises:
+        ValueError: If vectors have different lengths
+        TypeError: If inputs are not lists/Vectors or contain non-numeric values
+    
+    Examples:
+        >>> from mlmath import vector_isub
+        >>> weights = [1.0, 1.0]
+        >>> vector_isub(weights, [0.25, 0.5])
+        [0.75, 0.5]
+    """
+    return _elementwise(a, b, operator.sub, 'vector_subtract', a)
+
+
+def axpy(alpha: Union[int, float],
+         x: Union[List[Union[int, float]], Vector],
+         y: Union[List[Union[int, float]], Vector]) -> Union[List[Union[int, float]], Vector]:
+    """
+    Scale x by alpha and add it to y in place (y += alpha * x).
+    
+    The BLAS "axpy" update used by gradient steps (w += -learning_rate * grad)
+    and running sums, without allocating a scaled copy of x.
+    
+    Args:
+        alpha (Union[int, float]): Scale factor for x
+        x (Union[List[Union[int, float]], Vector]): Vector to scale and add
+        y (Union[List[Union[int, float]], Vector]): Vector to update
+    
+    Returns:
+        Union[List[Union[int, float]], Vector]: y, after the update
     
-    # Calculate element-wise subtraction
-    return [x - y for x, y in zip(a, b)]
+    Raises:
+        ValueError: If vectors have different lengths
+        TypeError: If alpha is not numeric, or x/y are not lists/Vectors or
+            contain non-numeric values
+    
+    Examples:
+        >>> from mlmath import axpy
+        >>> weights = [1.0, 2.0]
+        >>> axpy(-0.5, [2.0, 2.0], weights)
+        [0.0, 1.0]
+        >>> weights
+        [0.0, 1.0]
+    """
+    if not isinstance(alpha, (int, float)):
+        raise TypeError("alpha must be numeric")
+    
+    # Type checking
+    _check_vector_type(x, "Both inputs must be lists or Vectors")
+    _check_vector_type(y, "Both inputs must be lists or Vectors")
+    
+    # Length checking
+    if len(x) != len(y):
+        raise ValueError(f"Vectors must have the same length. Got {len(x)} and {len(y)}")
+    
+    # Check that all elements are numeric (Vector storage is always numeric)
+    _check_numeric_pair(x, y)
+    
+    # Use the active backend's kernel if it has one
+    kernel = get_kernel('axpy', len(x))
+    if kernel is not None:
+        return kernel(alpha, x, y)
+    
+    scaled = map(operator.mul, repeat(alpha), _as_storage(x))
+    return _write(y, map(operator.add, _as_storage(y), scaled))
 
 
-def vector_magnitude(a: List[Union[int, float]]) -> float:
+def vector_magnitude(a: Union[List[Union[int, float]], Vector]) -> float:
     """
     Calculate the magnitude (Euclidean norm) of a vector.
     
     The magnitude is calculated as: sqrt(a1² + a2² + ... + an²)
     
     Args:
-        a (List[Union[int, float]]): Input vector
+        a (Union[List[Union[int, float]], Vector]): Input vector
     
     Returns:
         float: Magnitude of the vector
     
     Raises:
-        TypeError: If input is not a list or contains non-numeric values
+        TypeError: If input is not a list/Vector or contains non-numeric values
         ValueError: If vector is empty
     
     Examples:
@@ -177,36 +546,39 @@ def vector_magnitude(a: List[Union[int, float]]) -> float:
         1.732
     """
     # Type checking
-    if not isinstance(a, list):
-        raise TypeError("Input must be a list")
+    _check_vector_type(a, "Input must be a list or Vector")
     
     # Check for empty vector
     if len(a) == 0:
         raise ValueError("Cannot calculate magnitude of empty vector")
     
-    # Check that all elements are numeric
-    for i, x in enumerate(a):
-        if not isinstance(x, (int, float)):
-            raise TypeError(f"All elements must be numeric. Found non-numeric value at index {i}")
+    # Check that all elements are numeric (Vector storage is always numeric)
+    _check_numeric(a)
+    
+    # Use the active backend's kernel if it has one
+    kernel = get_kernel('vector_magnitude', len(a))
+    if kernel is not None:
+        return kernel(a)
     
     # Calculate magnitude using Euclidean norm
-    return math.sqrt(sum(x * x for x in a))
+    return _magnitude(_as_storage(a))
 
 
-def vector_normalize(a: List[Union[int, float]]) -> List[float]:
+def vector_normalize(a: Union[List[Union[int, float]], Vector]) -> Union[List[float], Vector]:
     """
     Normalize a vector to unit length (magnitude = 1).
     
     The normalized vector is calculated by dividing each element by the vector's magnitude.
     
     Args:
-        a (List[Union[int, float]]): Input vector
+        a (Union[List[Union[int, float]], Vector]): Input vector
     
     Returns:
-        List[float]: Normalized vector with magnitude 1
+        Union[List[float], Vector]: Normalized vector with magnitude 1
+            (a Vector if the input is a Vector, otherwise a list)
     
     Raises:
-        TypeError: If input is not a list or contains non-numeric values
+        TypeError: If input is not a list/Vector or contains non-numeric values
         ValueError: If vector is empty or is a zero vector
     
     Examples:
@@ -222,24 +594,241 @@ def vector_normalize(a: List[Union[int, float]]) -> List[float]:
         [0.577, 0.577, 0.577]
     """
     # Type checking
-    if not isinstance(a, list):
-        raise TypeError("Input must be a list")
+    _check_vector_type(a, "Input must be a list or Vector")
     
     # Check for empty vector
     if len(a) == 0:
         raise ValueError("Cannot normalize empty vector")
     
-    # Check that all elements are numeric
-    for i, x in enumerate(a):
-        if not isinstance(x, (int, float)):
-            raise TypeError(f"All elements must be numeric. Found non-numeric value at index {i}")
+    # Check that all elements are numeric (Vector storage is always numeric)
+    _check_numeric(a)
     
-    # Calculate magnitude
-    magnitude = vector_magnitude(a)
+    # Calculate magnitude (input is already validated, so skip vector_magnitude's checks)
+    magnitude_kernel = get_kernel('vector_magnitude', len(a))
+    if magnitude_kernel is not None:
+        magnitude = magnitude_kernel(a)
+    else:
+        magnitude = _magnitude(_as_storage(a))
     
     # Check for zero vector
     if magnitude == 0:
         raise ValueError("Cannot normalize zero vector")
     
+    # Use the active backend's kernel if it has one
+    kernel = get_kernel('vector_normalize', len(a))
+    if kernel is not None:
+        return kernel(a)
+    
     # Normalize by dividing each element by magnitude
+    if isinstance(a, Vector):
+        return Vector._from_array(array('d', map(magnitude.__rtruediv__, a._data)))
     return [x / magnitude for x in a]
+
+
+def batch_dot(A: List[Union[List[Union[int, float]], Vector]],
+              B: List[Union[List[Union[int, float]], Vector]]) -> Vector:
+    """
+    Calculate row-wise dot products of two batches of vectors in one call.
+    
+    result[i] = dot_product(A[i], B[i])
+    
+    The whole batch is validated in a single pass and the products are
+    computed in one loop, avoiding the per-call overhead of calling
+    dot_product once per pair.
+    
+    Args:
+        A (List[Union[List, Vector]]): First batch of vectors (n rows of length d)
+        B (List[Union[List, Vector]]): Second batch of vectors (n rows of length d)
+    
+    Returns:
+        Vector: The n dot products
+    
+    Raises:
+        ValueError: If the batches have different sizes or rows differ in length
+        TypeError: If inputs are not lists of lists/Vectors or contain non-numeric values
+    
+    Examples:
+        >>> from mlmath import batch_dot
+        >>> batch_dot([[1, 2], [3, 4]], [[5, 6], [7, 8]])
+        Vector([17.0, 53.0])
+    """
+    # Validate both batches once
+    dim_A = _check_batch(A, "First batch")
+    dim_B = _check_batch(B, "Second batch")
+    
+    if len(A) != len(B):
+        raise ValueError(f"Batches must have the same number of vectors. Got {len(A)} and {len(B)}")
+    
+    if A and dim_A != dim_B:
+        raise ValueError(f"Vectors must have the same length. Got {dim_A} and {dim_B}")
+    
+    # Use the active backend's kernel if it has one
+    kernel = get_kernel('batch_dot', len(A) * dim_A)
+    if kernel is not None and A:
+        return kernel(A, B)
+    
+    # Calculate all dot products in one loop
+    mul = operator.mul
+    return Vector._from_array(array('d', [
+        sum(map(mul, _as_storage(a), _as_storage(b))) for a, b in zip(A, B)
+    ]))
+
+
+def dot_product_many(q: Union[List[Union[int, float]], Vector],
+                     M: List[Union[List[Union[int, float]], Vector]]) -> Vector:
+    """
+    Calculate the dot product of one query vector against many vectors.
+    
+    result[i] = dot_product(q, M[i])
+    
+    Args:
+        q (Union[List[Union[int, float]], Vector]): Query vector of length d
+        M (List[Union[List, Vector]]): Batch of vectors (n rows of length d)
+    
+    Returns:
+        Vector: The n dot products
+    
+    Raises:
+        ValueError: If any row of M has a different length than q
+        TypeError: If inputs are not lists/Vectors or contain non-numeric values
+    
+    Examples:
+        >>> from mlmath import dot_product_many
+        >>> dot_product_many([1, 1], [[1, 2], [3, 4], [5, 6]])
+        Vector([3.0, 7.0, 11.0])
+    """
+    # Validate the query and the batch once
+    _check_vector_type(q, "Query must be a list or Vector")
+    _check_numeric(q)
+    dim = _check_batch(M, "Batch")
+    
+    if M and dim != len(q):
+        raise ValueError(f"Vectors must have the same length. Got {len(q)} and {dim}")
+    
+    # Use the active backend's kernel if it has one
+    kernel = get_kernel('dot_product_many', len(M) * dim)
+    if kernel is not None and M:
+        return kernel(q, M)
+    
+    # Calculate all dot products in one loop
+    mul = operator.mul
+    query = _as_storage(q)
+    return Vector._from_array(array('d', [sum(map(mul, query, _as_storage(row))) for row in M]))
+
+
+def batch_magnitude(M: List[Union[List[Union[int, float]], Vector]]) -> Vector:
+    """
+    Calculate the magnitude (Euclidean norm) of every vector in a batch.
+    
+    Args:
+        M (List[Union[List, Vector]]): Batch of vectors (n rows of length d)
+    
+    Returns:
+        Vector: The n magnitudes
+    
+    Raises:
+        ValueError: If rows are empty or differ in length
+        TypeError: If input is not a list of lists/Vectors or contains non-numeric values
+    
+    Examples:
+        >>> from mlmath import batch_magnitude
+        >>> batch_magnitude([[3, 4], [6, 8]])
+        Vector([5.0, 10.0])
+    """
+    # Validate the batch once
+    dim = _check_batch(M, "Batch")
+    if dim == 0 and M:
+        raise ValueError("Cannot calculate magnitude of empty vector")
+    
+    # Use the active backend's kernel if it has one
+    kernel = get_kernel('batch_magnitude', len(M) * dim)
+    if kernel is not None and M:
+        return kernel(M)
+    
+    # Calculate all magnitudes in one loop
+    return Vector._from_array(array('d', [_magnitude(_as_storage(row)) for row in M]))
+
+
+def batch_normalize(M: List[Union[List[Union[int, float]], Vector]]) -> List[Union[List[float], Vector]]:
+    """
+    Normalize every vector in a batch to unit length.
+    
+    Args:
+        M (List[Union[List, Vector]]): Batch of vectors (n rows of length d)
+    
+    Returns:
+        List[Union[List[float], Vector]]: Normalized vectors; each row keeps
+            the type of the corresponding input row (list or Vector)
+    
+    Raises:
+        ValueError: If rows are empty, differ in length, or any row is a zero vector
+        TypeError: If input is not a list of lists/Vectors or contains non-numeric values
+    
+    Examples:
+        >>> from mlmath import batch_normalize
+        >>> batch_normalize([[3, 4], [0, 2]])
+        [[0.6, 0.8], [0.0, 1.0]]
+    """
+    # Validate the batch once
+    if _check_batch(M, "Batch") == 0 and M:
+        raise ValueError("Cannot normalize empty vector")
+    
+    # Normalize each row using the already-validated storage
+    result = []
+    for i, row in enumerate(M):
+        data = _as_storage(row)
+        magnitude = _magnitude(data)
+        if magnitude == 0:
+            raise ValueError(f"Cannot normalize zero vector at row {i}")
+        
+        scaled = map(magnitude.__rtruediv__, data)
+        if isinstance(row, Vector):
+            result.append(Vector._from_array(array('d', scaled)))
+        else:
+            result.append(list(scaled))
+    
+    return result
+
+
+def _check_batch(M, name: str) -> int:
+    """
+    Validate a batch of vectors in a single pass and return the common row length.
+    
+    Args:
+        M: Batch to check (a list of lists or Vectors)
+        name (str): Batch name for error messages
+    
+    Returns:
+        int: Length shared by every row (0 for an empty batch)
+    
+    Raises:
+        TypeError: If M is not a list of lists/Vectors or has non-numeric elements
+        ValueError: If rows differ in length
+    """
+    if not isinstance(M, list):
+        raise TypeError(f"{name} must be a list of vectors")
+    
+    if not M:
+        return 0
+    
+    dim = len(M[0])
+    if not get_validation():
+        return dim
+    
+    for i, row in enumerate(M):
+        if isinstance(row, Vector):
+            if len(row) != dim:
+                raise ValueError(f"All vectors in {name.lower()} must have the same length")
+            continue
+        
+        if not isinstance(row, list):
+            raise TypeError(f"{name} must be a list of lists or Vectors")
+        
+        if len(row) != dim:
+            raise ValueError(f"All vectors in {name.lower()} must have the same length")
+        
+        for j, x in enumerate(row):
+            if not isinstance(x, (int, float)):
+                raise TypeError(f"All elements must be numeric. Found non-numeric value at [{i}][{j}]")
+    
+    return dim
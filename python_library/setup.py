@@ -41,6 +41,10 @@ setup(
         # No external dependencies - pure Python implementation
     ],
     extras_require={
+        # Optional accelerated backend, picked up automatically when installed
+        "numpy": [
+            "numpy>=1.17",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
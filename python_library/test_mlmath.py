@@ -13,6 +13,8 @@ Date: July 27, 2025
 
 import sys
 import os
+import math
+import random
 
 # Add the parent directory to the path so we can import mlmath
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -62,6 +64,89 @@ def test_vector_operations():
     print("✓ All vector operations tests passed!\n")
 
 
+def test_vector_type():
+    """Test the array-backed Vector type."""
+    print("Testing Vector Type:")
+    print("-" * 20)
+    
+    a = mlmath.Vector([1, 2, 3])
+    b = mlmath.Vector([4, 5, 6])
+    assert len(a) == 3
+    assert a.tolist() == [1.0, 2.0, 3.0]
+    assert a == [1, 2, 3]
+    assert a.data.typecode == 'd'
+    
+    # Vector inputs produce Vector outputs without going through lists
+    assert mlmath.dot_product(a, b) == 32.0
+    result = mlmath.vector_add(a, b)
+    assert isinstance(result, mlmath.Vector) and result == [5.0, 7.0, 9.0]
+    result = mlmath.vector_subtract(b, a)
+    assert isinstance(result, mlmath.Vector) and result == [3.0, 3.0, 3.0]
+    assert mlmath.vector_magnitude(mlmath.Vector([3, 4])) == 5.0
+    result = mlmath.vector_normalize(mlmath.Vector([3, 4]))
+    assert isinstance(result, mlmath.Vector)
+    assert abs(result[0] - 0.6) < 0.001 and abs(result[1] - 0.8) < 0.001
+    
+    # Mixed list/Vector operands also return a Vector
+    assert isinstance(mlmath.vector_add(a, [1, 1, 1]), mlmath.Vector)
+    
+    # Buffer round trip and slicing
+    assert mlmath.Vector.frombuffer(bytes(a.data)) == a
+    assert mlmath.Vector.zeros(4) == [0.0, 0.0, 0.0, 0.0]
+    assert isinstance(a[1:], mlmath.Vector) and a[1:] == [2.0, 3.0]
+    
+    try:
+        mlmath.Vector([1, 'x'])
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+    print("✓ Vector type tests passed!\n")
+
+
+def test_batch_vector_operations():
+    """Test batched vector operations over 2-D inputs."""
+    print("Testing Batch Vector Operations:")
+    print("-" * 32)
+    
+    A = [[1, 2], [3, 4], [5, 6]]
+    B = [[5, 6], [7, 8], [1, 0]]
+    
+    # Batched results match the single-vector functions
+    expected = [mlmath.dot_product(a, b) for a, b in zip(A, B)]
+    assert mlmath.batch_dot(A, B) == expected
+    assert mlmath.dot_product_many([1, 1], A) == [3.0, 7.0, 11.0]
+    assert mlmath.batch_magnitude([[3, 4], [6, 8]]) == [5.0, 10.0]
+    assert mlmath.batch_normalize([[3, 4], [0, 2]]) == [[0.6, 0.8], [0.0, 1.0]]
+    
+    # Vector rows stay Vectors
+    rows = [mlmath.Vector(row) for row in A]
+    assert isinstance(mlmath.batch_normalize(rows)[0], mlmath.Vector)
+    assert mlmath.dot_product_many(mlmath.Vector([1, 0]), rows) == [1.0, 3.0, 5.0]
+    
+    # Empty batches give empty results
+    assert len(mlmath.batch_dot([], [])) == 0
+    
+    try:
+        mlmath.batch_dot([[1, 2]], [[1, 2], [3, 4]])
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    
+    try:
+        mlmath.batch_normalize([[1, 2], [0, 0]])
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    
+    try:
+        mlmath.batch_magnitude([[1, 2], [3, 'x']])
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+    
+    print("✓ Batch vector operations tests passed!\n")
+
+
 def test_matrix_operations():
     """Test all matrix operations."""
     print("Testing Matrix Operations:")
@@ -78,6 +163,32 @@ def test_matrix_operations():
     A = [[1, 2, 3]]
     B = [[4], [5], [6]]
     assert mlmath.matrix_multiply(A, B) == [[32]]
+    
+    # The blocked kernel matches the naive kernel exactly, including ragged tiles
+    rng = random.Random(1)
+    A = [[rng.uniform(-1, 1) for _ in range(7)] for _ in range(5)]
+    B = [[rng.uniform(-1, 1) for _ in range(9)] for _ in range(7)]
+    naive = mlmath.matrix_multiply(A, B, algorithm='naive')
+    for block_size in (1, 2, 4, 64):
+        assert mlmath.matrix_multiply(A, B, algorithm='blocked', block_size=block_size) == naive
+    
+    # Strassen agrees with the naive kernel on odd, rectangular shapes
+    for cutoff in (1, 2, 3):
+        result = mlmath.matrix_multiply(A, B, algorithm='strassen', strassen_cutoff=cutoff)
+        for row, expected_row in zip(result, naive):
+            assert all(abs(x - y) < 1e-12 for x, y in zip(row, expected_row))
+    
+    # Multiplying by the identity returns the original matrix exactly
+    A = [[rng.randint(-9, 9) for _ in range(11)] for _ in range(11)]
+    identity = mlmath.identity_matrix(11)
+    assert mlmath.matrix_multiply(A, identity, algorithm='strassen', strassen_cutoff=2) == A
+    assert mlmath.matrix_multiply(identity, A, algorithm='strassen', strassen_cutoff=2) == A
+    
+    try:
+        mlmath.matrix_multiply(A, B, algorithm='unknown')
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
     print("✓ matrix_multiply tests passed")
     
     # Test matrix_transpose
@@ -170,6 +281,217 @@ def test_probability_operations():
     print("✓ All probability operations tests passed!\n")
 
 
+def test_vectorised_probability():
+    """Test the array forms of bayes_theorem, joint_probability and marginal_probability."""
+    print("Testing Vectorised Probability:")
+    print("-" * 31)
+    
+    rng = random.Random(5)
+    n = 500  # large enough to reach accelerated kernels
+    prior = [rng.uniform(0, 1) for _ in range(n)]
+    likelihood = [rng.uniform(0, 1) for _ in range(n)]
+    evidence = [min(1.0, p * l + 0.1) for p, l in zip(prior, likelihood)]
+    
+    original = mlmath.get_backend()
+    try:
+        for name in ('python', 'numpy'):
+            if name not in mlmath.available_backends():
+                continue
+            mlmath.set_backend(name)
+            
+            posterior = mlmath.bayes_theorem(prior, likelihood, evidence)
+            assert isinstance(posterior, mlmath.Vector) and len(posterior) == n
+            for value, p, l, e in zip(posterior, prior, likelihood, evidence):
+                assert abs(value - mlmath.bayes_theorem(p, l, e)) < 1e-12
+            
+            # Scalars broadcast against arrays, and Vectors are accepted
+            shared = mlmath.bayes_theorem(0.4, mlmath.Vector(likelihood), evidence)
+            assert abs(shared[0] - mlmath.bayes_theorem(0.4, likelihood[0], evidence[0])) < 1e-12
+            
+            joint = mlmath.joint_probability(prior, 0.5)
+            assert isinstance(joint, mlmath.Vector)
+            assert all(abs(j - p * 0.5) < 1e-12 for j, p in zip(joint, prior))
+            print(f"✓ Vectorised bayes_theorem and joint_probability passed on '{name}'")
+    finally:
+        mlmath.set_backend(original)
+    
+    assert mlmath.marginal_probability(mlmath.Vector([0.25, 0.5])) == 0.75
+    assert mlmath.marginal_probability([[0.5, 0.25], [0.125, 0.125]]) == [0.75, 0.25]
+    print("✓ Batched marginal_probability tests passed")
+    
+    for args in (([0.1, 1.2], 0.5, 0.5), ([0.1, float('nan')], 0.5, 0.5),
+                 ([0.1, 0.2], 0.5, [0.5, 0.0]), ([0.1], [0.2, 0.3], 0.5)):
+        try:
+            mlmath.bayes_theorem(*args)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    
+    try:
+        mlmath.joint_probability([0.1, 'x'], 0.5)
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+    
+    try:
+        mlmath.marginal_probability([[0.5, 0.25], [0.75, 0.5]])
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    
+    print("✓ Vectorised probability tests passed!\n")
+
+
+def test_log_probability():
+    """Test the log-space probability functions and containers."""
+    print("Testing Log-Space Probability:")
+    print("-" * 30)
+    
+    # 300 factors of 0.01 underflow in linear space but not in log space
+    probabilities = [0.01] * 300
+    product = 1.0
+    for p in probabilities:
+        product = mlmath.joint_probability(product, p)
+    assert product == 0.0
+    
+    logs = mlmath.LogProbabilities.from_probabilities(probabilities)
+    assert abs(logs.total().log - 300 * math.log(0.01)) < 1e-9
+    print("✓ LogProbabilities avoids underflow")
+    
+    original = mlmath.get_backend()
+    try:
+        for name in ('python', 'numpy'):
+            if name not in mlmath.available_backends():
+                continue
+            mlmath.set_backend(name)
+            
+            # Scalar and array forms agree with the linear-space functions
+            posterior = mlmath.log_bayes(math.log(0.01), math.log(0.9), math.log(0.05))
+            assert abs(math.exp(posterior) - mlmath.bayes_theorem(0.01, 0.9, 0.05)) < 1e-12
+            
+            posteriors = mlmath.log_bayes(logs, math.log(0.5), logs)
+            assert isinstance(posteriors, mlmath.Vector) and len(posteriors) == 300
+            assert all(abs(value - math.log(0.5)) < 1e-12 for value in posteriors)
+            
+            assert abs(mlmath.log_joint(math.log(0.3), math.log(0.4)) - math.log(0.12)) < 1e-12
+            assert all(abs(value - 2 * math.log(0.01)) < 1e-12 for value in mlmath.log_joint(logs, logs))
+            
+            # logsumexp stays finite where exp() would underflow
+            assert abs(mlmath.logsumexp(logs) - math.log(3.0)) < 1e-12
+            assert abs(mlmath.logsumexp([-1000.0, -1000.0]) - (-1000.0 + math.log(2))) < 1e-9
+            assert mlmath.logsumexp([-math.inf, -math.inf]) == -math.inf
+            print(f"✓ log_bayes, log_joint and logsumexp tests passed on '{name}'")
+    finally:
+        mlmath.set_backend(original)
+    
+    marginal = mlmath.log_marginal_probability([math.log(0.2), math.log(0.3), math.log(0.1)])
+    assert abs(math.exp(marginal) - mlmath.marginal_probability([0.2, 0.3, 0.1])) < 1e-12
+    assert mlmath.log_marginal_probability([[math.log(0.5), math.log(0.5)]])[0] == 0.0
+    print("✓ log_marginal_probability tests passed")
+    
+    half = mlmath.LogProbability.from_probability(0.5)
+    quarter = mlmath.LogProbability.from_probability(0.25)
+    assert abs((half * half).probability - 0.25) < 1e-12
+    assert abs((quarter / half).probability - 0.5) < 1e-12
+    assert abs((quarter + quarter).probability - 0.5) < 1e-12
+    assert quarter < half
+    normalized = mlmath.LogProbabilities.from_probabilities([0.2, 0.6]).normalize()
+    assert all(abs(x - y) < 1e-12 for x, y in zip(normalized.to_probabilities(), [0.25, 0.75]))
+    assert len(mlmath.LogProbabilities()) == 0
+    assert len(mlmath.LogProbabilities.from_probabilities([])) == 0
+    assert mlmath.LogProbabilities().total().log == 0.0
+    print("✓ LogProbability container tests passed")
+    
+    for call in (lambda: mlmath.log_bayes([0.1], 0.0, 0.0),
+                 lambda: mlmath.log_bayes(-1.0, -1.0, -math.inf),
+                 lambda: mlmath.log_marginal_probability([math.log(0.7), math.log(0.7)]),
+                 lambda: mlmath.LogProbability(0.5),
+                 lambda: mlmath.LogProbabilities.from_probabilities([0.7, 0.8]).logsumexp(),
+                 lambda: mlmath.LogProbability.from_probability(0.7) + mlmath.LogProbability.from_probability(0.8)):
+        try:
+            call()
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    
+    print("✓ Log-space probability tests passed!\n")
+
+
+def test_naive_bayes():
+    """Test the multinomial and Bernoulli naive Bayes classifiers."""
+    print("Testing Naive Bayes:")
+    print("-" * 20)
+    
+    messages = [['free', 'money', 'free'], ['meeting', 'tomorrow'], ['free', 'offer', 'now'],
+                ['project', 'meeting', 'notes'], ['win', 'money', 'now'], ['lunch', 'tomorrow']]
+    labels = ['spam', 'ham', 'spam', 'ham', 'spam', 'ham']
+    
+    model = mlmath.MultinomialNB().fit(messages, labels)
+    assert model.classes_ == ['spam', 'ham']
+    assert model.feature_count_[0]['free'] == 3
+    
+    # Laplace-smoothed log-likelihood computed by hand
+    vocabulary_size = len(model.vocabulary_)
+    spam_words = sum(len(m) for m, label in zip(messages, labels) if label == 'spam')
+    expected = math.log(0.5) + 2 * math.log((3 + 1) / (spam_words + vocabulary_size))
+    assert abs(model.joint_log_likelihood({'free': 2})[0] - expected) < 1e-12
+    
+    assert model.predict_one(['free', 'money']) == 'spam'
+    assert model.predict([['meeting', 'notes'], {'win': 1, 'free': 1}]) == ['ham', 'spam']
+    assert model.score(messages, labels) == 1.0
+    
+    # Unknown words are ignored and posteriors sum to one
+    probabilities = model.predict_proba([['free', 'unknown-word']])[0]
+    assert abs(sum(probabilities) - 1) < 1e-12 and probabilities[0] > 0.5
+    print("✓ MultinomialNB tests passed")
+    
+    # partial_fit in batches learns exactly what fit learns in one go
+    incremental = mlmath.MultinomialNB()
+    incremental.partial_fit(messages[:2], labels[:2]).partial_fit(messages[2:], labels[2:])
+    assert incremental.feature_count_ == model.feature_count_
+    assert incremental.joint_log_likelihood(['free', 'now']) == model.joint_log_likelihood(['free', 'now'])
+    print("✓ partial_fit tests passed")
+    
+    # A CSRMatrix of counts gives the same model as token lists
+    vocabulary = sorted(model.vocabulary_)
+    rows = [[message.count(word) for word in vocabulary] for message in messages]
+    sparse_model = mlmath.MultinomialNB().fit(mlmath.CSRMatrix.from_dense(rows), labels)
+    query = mlmath.SparseVector.from_dense([1 if word == 'free' else 0 for word in vocabulary])
+    assert abs(sparse_model.joint_log_likelihood(query)[0] - model.joint_log_likelihood(['free'])[0]) < 1e-12
+    print("✓ Sparse input tests passed")
+    
+    bernoulli = mlmath.BernoulliNB().fit(messages, labels)
+    assert bernoulli.feature_count_[0]['free'] == 2  # documents containing 'free', not occurrences
+    assert bernoulli.predict_one(['free']) == 'spam'
+    assert bernoulli.predict_one(['meeting', 'tomorrow']) == 'ham'
+    
+    # Absent vocabulary words contribute log(1 - p) terms
+    n_spam = 3
+    expected = math.log(0.5)
+    for word in bernoulli.vocabulary_:
+        p = (bernoulli.feature_count_[0].get(word, 0) + 1) / (n_spam + 2)
+        expected += math.log(p) if word == 'free' else math.log(1 - p)
+    assert abs(bernoulli.joint_log_likelihood(['free'])[0] - expected) < 1e-12
+    print("✓ BernoulliNB tests passed")
+    
+    # Long messages do not underflow
+    long_message = ['free'] * 5000 + ['meeting'] * 10
+    assert model.predict_one(long_message) == 'spam'
+    assert math.isfinite(model.predict_log_proba([long_message])[0][1])
+    
+    for call, error in ((lambda: mlmath.MultinomialNB(alpha=0), ValueError),
+                        (lambda: mlmath.MultinomialNB().predict_one(['free']), ValueError),
+                        (lambda: model.predict_one('free money'), TypeError),
+                        (lambda: mlmath.MultinomialNB().fit(messages, labels[:2]), ValueError)):
+        try:
+            call()
+            assert False, f"Should have raised {error.__name__}"
+        except error:
+            pass
+    
+    print("✓ Naive Bayes tests passed!\n")
+
+
 def test_error_handling():
     """Test error handling and edge cases."""
     print("Testing Error Handling:")
@@ -217,6 +539,419 @@ def test_error_handling():
     print("✓ All error handling tests passed!\n")
 
 
+def test_validation_mode():
+    """Test turning per-element validation off and back on."""
+    print("Testing Validation Mode:")
+    print("-" * 24)
+    
+    assert mlmath.get_validation() is True
+    
+    # With validation enabled, bad elements are rejected
+    try:
+        mlmath.matrix_multiply([[1, 'x']], [[1], [2]])
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+    
+    # With validation disabled, trusted inputs give the same results
+    with mlmath.validation(False):
+        assert mlmath.get_validation() is False
+        assert mlmath.dot_product([1, 2, 3], [4, 5, 6]) == 32
+        assert mlmath.vector_normalize([3, 4]) == [0.6, 0.8]
+        assert mlmath.matrix_multiply([[1, 2], [3, 4]], [[5, 6], [7, 8]]) == [[19, 22], [43, 50]]
+        assert mlmath.matrix_transpose([[1, 2, 3], [4, 5, 6]]) == [[1, 4], [2, 5], [3, 6]]
+        assert mlmath.matrix_add([[1, 2]], [[3, 4]]) == [[4, 6]]
+        
+        # Cheap dimension checks still apply
+        try:
+            mlmath.dot_product([1, 2], [1, 2, 3])
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    
+    # The previous setting is restored after the block
+    assert mlmath.get_validation() is True
+    
+    mlmath.set_validation(False)
+    assert mlmath.get_validation() is False
+    mlmath.set_validation(True)
+    
+    try:
+        mlmath.set_validation("no")
+        assert False, "Should have raised TypeError"
+    except TypeError:
+        pass
+    
+    print("✓ Validation mode tests passed!\n")
+
+
+def test_backends():
+    """Test that every registered backend matches the pure Python results."""
+    print("Testing Backends:")
+    print("-" * 17)
+    
+    rng = random.Random(0)
+    
+    # Inputs large enough to be dispatched to accelerated kernels
+    n = 24
+    A = [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+    B = [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+    a = [rng.uniform(-1, 1) for _ in range(n * n)]
+    b = [rng.uniform(-1, 1) for _ in range(n * n)]
+    
+    def compute():
+        return {
+            'dot': mlmath.dot_product(a, b),
+            'dot_vector': mlmath.dot_product(mlmath.Vector(a), mlmath.Vector(b)),
+            'add': mlmath.vector_add(mlmath.Vector(a), b),
+            'magnitude': mlmath.vector_magnitude(a),
+            'normalize': mlmath.vector_normalize(mlmath.Vector(a)),
+            'batch_dot': mlmath.batch_dot(A, B),
+            'many': mlmath.dot_product_many(A[0], B),
+            'multiply': mlmath.matrix_multiply(A, B),
+            'subtract': mlmath.matrix_subtract(A, B),
+        }
+    
+    def flatten(value):
+        if isinstance(value, float):
+            return [value]
+        values = []
+        for item in value:
+            values.extend(flatten(item))
+        return values
+    
+    original = mlmath.get_backend()
+    try:
+        mlmath.set_backend('python')
+        expected = compute()
+        
+        for name in ('python', 'numpy'):
+            if name not in mlmath.available_backends():
+                continue
+            mlmath.set_backend(name)
+            result = compute()
+            for key in expected:
+                assert type(result[key]) is type(expected[key]), f"{name}: {key} changed type"
+                for x, y in zip(flatten(result[key]), flatten(expected[key])):
+                    assert abs(x - y) < 1e-9, f"{name}: {key} differs from pure Python"
+            print(f"✓ Backend '{name}' matches pure Python")
+    finally:
+        mlmath.set_backend(original)
+    
+    # Large integers must not wrap around in a fixed-width integer type
+    big = [2 ** 40] * 300
+    M = [[2 ** 31] * 40 for _ in range(40)]
+    try:
+        mlmath.set_backend('python')
+        expected = [mlmath.dot_product(big, big), mlmath.matrix_multiply(M, M)[0][0],
+                    mlmath.matrix_add(M, M)[0][0]]
+        for name in ('python', 'numpy'):
+            if name not in mlmath.available_backends():
+                continue
+            mlmath.set_backend(name)
+            result = [mlmath.dot_product(big, big), mlmath.matrix_multiply(M, M)[0][0],
+                      mlmath.matrix_add(M, M)[0][0]]
+            for x, y in zip(result, expected):
+                assert abs(x - y) <= 1e-12 * abs(y), f"{name}: large integers give {x} instead of {y}"
+        print("✓ Backends agree on large integer inputs")
+    finally:
+        mlmath.set_backend(original)
+    
+    try:
+        mlmath.set_backend('missing')
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    
+    # A custom backend only replaces the operations it provides
+    mlmath.register_backend('test-constant', {'dot_product': lambda x, y: -1})
+    try:
+        mlmath.set_backend('test-constant')
+        assert mlmath.dot_product([1, 2], [3, 4]) == -1
+        assert mlmath.vector_add([1, 2], [3, 4]) == [4, 6]
+    finally:
+        mlmath.set_backend(original)
+    
+    assert mlmath.get_info()['backend'] == original
+    print("✓ Backend tests passed!\n")
+
+
+def test_linear_solvers():
+    """Test LU, Cholesky and QR decompositions and the solve front-end."""
+    print("Testing Linear Solvers:")
+    print("-" * 23)
+    
+    def close(x, y, tolerance=1e-8):
+        if isinstance(x, (int, float)):
+            return abs(x - y) < tolerance
+        return len(x) == len(y) and all(close(a, b, tolerance) for a, b in zip(x, y))
+    
+    rng = random.Random(11)
+    n = 8  # n³ reaches accelerated kernels, so every backend is exercised
+    A = [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+    b = [rng.uniform(-1, 1) for _ in range(n)]
+    B = [[rng.uniform(-1, 1) for _ in range(3)] for _ in range(n)]
+    
+    # lu_factor/lu_solve, reusing one factorisation for several right-hand sides
+    factors = mlmath.lu_factor(A)
+    x = mlmath.lu_solve(factors, b)
+    assert close(mlmath.matrix_multiply(A, [[value] for value in x]), [[value] for value in b])
+    assert close(mlmath.matrix_multiply(A, mlmath.lu_solve(factors, B)), B)
+    assert mlmath.lu_factor([[1, 2], [3, 4]])[1] == [1, 1]
+    print("✓ lu_factor and lu_solve tests passed")
+    
+    # A symmetric positive definite matrix built from a tall design matrix
+    X = [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n + 5)]
+    XtX = mlmath.matrix_multiply(mlmath.matrix_transpose(X, lazy=True), X)
+    
+    original = mlmath.get_backend()
+    try:
+        for name in ('python', 'numpy'):
+            if name not in mlmath.available_backends():
+                continue
+            mlmath.set_backend(name)
+            
+            assert close(mlmath.solve(A, b), x)
+            assert close(mlmath.solve(A, mlmath.Vector(b)), x)
+            assert isinstance(mlmath.solve(A, mlmath.Vector(b)), mlmath.Vector)
+            assert close(mlmath.solve(A, B), mlmath.lu_solve(factors, B))
+            
+            L = mlmath.cholesky(XtX)
+            assert all(L[i][j] == 0 for i in range(n) for j in range(i + 1, n))
+            assert close(mlmath.matrix_multiply(L, mlmath.matrix_transpose(L, lazy=True)), XtX)
+            assert close(mlmath.solve(XtX, b, method='cholesky'), mlmath.solve(XtX, b))
+            
+            Q, R = mlmath.qr(X)
+            assert close(mlmath.matrix_multiply(Q, R), X)
+            assert close(mlmath.matrix_multiply(mlmath.matrix_transpose(Q, lazy=True), Q), mlmath.identity_matrix(n))
+            
+            # Least squares by QR agrees with the normal equations
+            y = [rng.uniform(-1, 1) for _ in range(n + 5)]
+            Xty = [row[0] for row in mlmath.matrix_multiply(mlmath.matrix_transpose(X, lazy=True), [[v] for v in y])]
+            assert close(mlmath.solve(X, y, method='qr'), mlmath.solve(XtX, Xty, method='cholesky'), 1e-6)
+            print(f"✓ solve, cholesky and qr tests passed on '{name}'")
+    finally:
+        mlmath.set_backend(original)
+    
+    # Singular and indefinite matrices are rejected
+    for matrix, method in (([[1, 2], [2, 4]], 'lu'), ([[1, 2], [2, 1]], 'cholesky'),
+                           ([[1, 1], [1, 1], [1, 1]], 'qr')):
+        try:
+            mlmath.solve(matrix, [1] * len(matrix), method=method)
+            assert False, f"Should have raised ValueError for method '{method}'"
+        except ValueError:
+            pass
+    
+    try:
+        mlmath.solve([[1, 2, 3], [4, 5, 6]], [1, 2])
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    
+    print("✓ Linear solver tests passed!\n")
+
+
+def test_in_place_operations():
+    """Test out= parameters, in-place variants and axpy on every backend."""
+    print("Testing In-Place Operations:")
+    print("-" * 28)
+    
+    rng = random.Random(3)
+    n = 300  # large enough to reach accelerated kernels
+    a = [rng.uniform(-1, 1) for _ in range(n)]
+    b = [rng.uniform(-1, 1) for _ in range(n)]
+    expected_sum = mlmath.vector_add(a, b)
+    
+    original = mlmath.get_backend()
+    try:
+        for name in ('python', 'numpy'):
+            if name not in mlmath.available_backends():
+                continue
+            mlmath.set_backend(name)
+            
+            out = mlmath.Vector.zeros(n)
+            buffer = out.data
+            assert mlmath.vector_add(mlmath.Vector(a), b, out=out) is out
+            assert all(abs(x - y) < 1e-12 for x, y in zip(out, expected_sum))
+            assert out.data is buffer, "out= should write into the existing buffer"
+            
+            out = [0] * n
+            assert mlmath.vector_subtract(a, b, out=out) is out
+            assert out == mlmath.vector_subtract(a, b)
+            
+            # out may alias an operand
+            c = mlmath.Vector(a)
+            assert mlmath.vector_iadd(c, b) is c
+            mlmath.vector_isub(c, b)
+            assert all(abs(x - y) < 1e-12 for x, y in zip(c, a))
+            
+            y = list(b)
+            assert mlmath.axpy(2.0, a, y) is y
+            assert all(abs(y_i - (b_i + 2.0 * a_i)) < 1e-12 for y_i, a_i, b_i in zip(y, a, b))
+            print(f"✓ Vector out= and in-place tests passed on '{name}'")
+    finally:
+        mlmath.set_backend(original)
+    
+    A = [[1, 2], [3, 4]]
+    first_row = A[0]
+    assert mlmath.matrix_iadd(A, [[1, 1], [1, 1]]) is A
+    assert A == [[2, 3], [4, 5]] and A[0] is first_row
+    mlmath.matrix_isub(A, [[1, 1], [1, 1]])
+    assert A == [[1, 2], [3, 4]]
+    
+    out = [[0, 0], [0, 0]]
+    assert mlmath.matrix_subtract(A, [[1, 1], [1, 1]], out=out) is out
+    assert out == [[0, 1], [2, 3]]
+    print("✓ Matrix out= and in-place tests passed")
+    
+    try:
+        mlmath.vector_add([1, 2], [3, 4], out=[0])
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    
+    try:
+        mlmath.matrix_add(A, A, out=[[0, 0]])
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    
+    print("✓ In-place operations tests passed!\n")
+
+
+def test_sparse_operations():
+    """Test the sparse vector and CSR matrix types against the dense functions."""
+    print("Testing Sparse Operations:")
+    print("-" * 26)
+    
+    A = [[1, 0, 0, 2], [0, 0, 3, 0], [0, 0, 0, 0]]
+    B = [[0, 1], [2, 0], [0, 0], [1, 1]]
+    S = mlmath.CSRMatrix.from_dense(A)
+    T = mlmath.CSRMatrix.from_dense(B)
+    
+    # Round trips
+    assert S.shape == (3, 4) and S.nnz == 3
+    assert S.to_dense() == A
+    assert mlmath.CSRMatrix.from_coo([0, 0, 1], [0, 0, 1], [1, 2, 5], (2, 2)).to_dense() == [[3, 0], [0, 5]]
+    assert mlmath.CSRMatrix.from_coo(*S.to_coo(), S.shape) == S
+    
+    # One-hot bool columns (e.g. from pandas.get_dummies) are accepted
+    assert mlmath.CSRMatrix.from_dense([[True, False], [False, True]]).nnz == 2
+    print("✓ CSR construction tests passed")
+    
+    # Multiplication: sparse × sparse stays sparse, mixed operands give dense lists
+    expected = mlmath.matrix_multiply(A, B)
+    assert mlmath.matrix_multiply(S, T).to_dense() == expected
+    assert mlmath.matrix_multiply(S, B) == expected
+    assert mlmath.matrix_multiply(A, T) == expected
+    assert mlmath.matrix_transpose(S).to_dense() == mlmath.matrix_transpose(A)
+    print("✓ Sparse matrix_multiply and matrix_transpose tests passed")
+    
+    assert mlmath.matrix_add(S, S).to_dense() == mlmath.matrix_add(A, A)
+    assert mlmath.matrix_add(S, A) == mlmath.matrix_add(A, A)
+    assert mlmath.matrix_subtract(S, S).nnz == 0
+    print("✓ Sparse matrix_add and matrix_subtract tests passed")
+    
+    v = mlmath.SparseVector.from_dense([0, 1, 0, 2])
+    assert len(v) == 4 and v.nnz == 2 and v[3] == 2 and v[0] == 0
+    assert S.getrow(0) == mlmath.SparseVector(4, [0, 3], [1, 2])
+    assert mlmath.dot_product(v, [1, 2, 3, 4]) == 10
+    assert mlmath.dot_product(mlmath.Vector([1, 2, 3, 4]), v) == 10
+    assert mlmath.dot_product(v, v) == 5
+    print("✓ SparseVector tests passed")
+    
+    try:
+        mlmath.matrix_multiply(S, S)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    
+    # Falsy non-numerics such as None are rejected, not dropped as zeros
+    for call in (lambda: mlmath.SparseVector.from_dense([1, None, 2]),
+                 lambda: mlmath.CSRMatrix.from_dense([[1, None], [0, 2]]),
+                 lambda: mlmath.CSRMatrix.from_coo([0, 1], [0, 1], [1, None], (2, 2)),
+                 lambda: mlmath.CSRMatrix.from_dense([5, [1]])):
+        try:
+            call()
+            assert False, "Should have raised TypeError"
+        except TypeError:
+            pass
+    
+    with mlmath.validation(False):
+        try:
+            mlmath.CSRMatrix.from_dense([[1, ''], [0, 2]])
+            assert False, "Should have raised TypeError"
+        except TypeError:
+            pass
+    
+    for call in (lambda: mlmath.CSRMatrix.from_dense([]),
+                 lambda: mlmath.CSRMatrix.from_dense([[]])):
+        try:
+            call()
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    print("✓ Sparse input validation tests passed")
+    
+    print("✓ Sparse operations tests passed!\n")
+
+
+def test_transposed_view():
+    """Test lazy transpose views and the fused transposed multiply kernels."""
+    print("Testing Transposed Views:")
+    print("-" * 25)
+    
+    A = [[1, 2, 3], [4, 5, 6]]
+    view = mlmath.matrix_transpose(A, lazy=True)
+    assert isinstance(view, mlmath.TransposedView)
+    assert view.shape == (3, 2) and len(view) == 3
+    assert view[2] == [3, 6] and view[-1] == [3, 6]
+    assert view == mlmath.matrix_transpose(A)
+    assert list(view) == mlmath.matrix_transpose(A)
+    assert mlmath.matrix_transpose(view, lazy=True) is A
+    assert mlmath.matrix_transpose(view) == A
+    
+    # Views share storage with the matrix they wrap
+    A[0][0] = 10
+    assert view[0] == [10, 4]
+    A[0][0] = 1
+    print("✓ TransposedView indexing tests passed")
+    
+    rng = random.Random(7)
+    # More rows than one panel of the fused A^T·B kernel
+    X = [[rng.uniform(-1, 1) for _ in range(5)] for _ in range(300)]
+    Y = [[rng.uniform(-1, 1) for _ in range(5)] for _ in range(4)]
+    
+    def close(C, D):
+        return all(abs(x - y) < 1e-9 for row_C, row_D in zip(C, D) for x, y in zip(row_C, row_D))
+    
+    X_t = mlmath.matrix_transpose(X)
+    Y_t = mlmath.matrix_transpose(Y)
+    gram = mlmath.matrix_multiply(X_t, X, algorithm='naive')
+    for algorithm in ('auto', 'naive', 'blocked', 'strassen'):
+        result = mlmath.matrix_multiply(mlmath.matrix_transpose(X, lazy=True), X, algorithm=algorithm)
+        assert close(result, gram), f"A^T·B differs with algorithm '{algorithm}'"
+    
+    assert close(mlmath.matrix_multiply(X, mlmath.matrix_transpose(Y, lazy=True)),
+                 mlmath.matrix_multiply(X, Y_t, algorithm='naive'))
+    assert close(mlmath.matrix_multiply(mlmath.matrix_transpose(Y_t, lazy=True), mlmath.matrix_transpose(X, lazy=True)),
+                 mlmath.matrix_multiply(Y, X_t, algorithm='naive'))
+    
+    # Small integer inputs give exact results
+    assert mlmath.matrix_multiply(view, A) == [[17, 22, 27], [22, 29, 36], [27, 36, 45]]
+    print("✓ Fused transposed matrix_multiply tests passed")
+    
+    assert mlmath.matrix_add(view, view) == [[2, 8], [4, 10], [6, 12]]
+    
+    try:
+        mlmath.matrix_multiply(view, view)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+    
+    print("✓ Transposed view tests passed!\n")
+
+
 def test_library_info():
     """Test library metadata functions."""
     print("Testing Library Info:")
@@ -230,7 +965,8 @@ def test_library_info():
     assert isinstance(info, dict)
     assert 'name' in info
     assert 'version' in info
-    print(f"✓ Library info: {info['name']} v{info['version']}")
+    assert info['backend'] in info['available_backends']
+    print(f"✓ Library info: {info['name']} v{info['version']} ({info['backend']} backend)")
     
     print("✓ Library info tests passed!\n")
 
@@ -285,9 +1021,20 @@ def main():
     
     try:
         test_vector_operations()
+        test_vector_type()
+        test_batch_vector_operations()
         test_matrix_operations()
         test_probability_operations()
+        test_vectorised_probability()
+        test_log_probability()
+        test_naive_bayes()
         test_error_handling()
+        test_validation_mode()
+        test_backends()
+        test_in_place_operations()
+        test_linear_solvers()
+        test_sparse_operations()
+        test_transposed_view()
         test_library_info()
         run_comprehensive_example()
         
@@ -0,0 +1,289 @@
+"""
+Persistent Dice Histogram Accumulator
+=====================================
+
+Accumulate the 2-12 sum histogram of many separate runs and keep it on disk.
+
+DiceHistogram collects sums incrementally: single rolls, chunks of sums,
+or whole simulate_dice_rolls results. Two histograms merge by adding their
+counts, so results from several processes or machines combine without
+re-simulating. Histograms save to small JSON files, written to a temporary
+name and renamed into place so that an interruption never leaves a
+half-written file.
+
+run_checkpointed() uses this to run very long jobs in chunks, saving after
+every chunk. Started again with the same checkpoint file, it resumes after
+the last saved chunk. Chunk i is always rolled from the same seed, so a
+resumed job ends with exactly the counts of an uninterrupted one.
+
+Usage:
+    from dice_accumulator import DiceHistogram, run_checkpointed
+    
+    histogram = run_checkpointed(1_000_000_000, "rolls.json", seed=42)
+    combined = DiceHistogram.load("machine1.json") + DiceHistogram.load("machine2.json")
+    combined.counts()   # same dict as simulate_dice_rolls
+
+Author: GitHub Copilot
+Date: July 26, 2025
+"""
+
+import json
+import os
+import random
+
+from dice_simulation import ENGINES, simulate_dice_rolls, summarize_sum_counts
+
+
+FORMAT = 'dice-histogram'
+VERSION = 1
+DEFAULT_CHUNK_SIZE = 10_000_000
+
+SUMS = range(2, 13)
+
+
+class DiceHistogram:
+    """
+    Mergeable, savable histogram of two-dice sums.
+    
+    Attributes:
+        sum_counts (dict): Number of rolls for each sum, {2: count, ..., 12: count}
+        job (dict): Settings of the run_checkpointed() job that produced the
+            histogram, or None
+    
+    Examples:
+        >>> histogram = DiceHistogram()
+        >>> histogram.update([7, 7, 2, 12])
+        >>> histogram.add(11)
+        >>> histogram.total_simulations, histogram.counts()['sum_greater_10']
+        (5, 2)
+    """
+    
+    def __init__(self, sum_counts=None):
+        """
+        Create a histogram, empty or from existing counts.
+        
+        Args:
+            sum_counts (dict): Counts per sum to start from (default: None)
+        
+        Raises:
+            ValueError: If a sum is outside 2-12 or a count is negative
+        """
+        self.sum_counts = dict.fromkeys(SUMS, 0)
+        self.job = None
+        if sum_counts:
+            self.add_counts({'sum_counts': sum_counts})
+    
+    @property
+    def total_simulations(self):
+        """Number of rolls counted."""
+        return sum(self.sum_counts.values())
+    
+    def add(self, total):
+        """
+        Count one roll.
+        
+        Args:
+            total (int): Sum of the two dice
+        
+        Raises:
+            ValueError: If total is not between 2 and 12
+        """
+        if total not in self.sum_counts:
+            raise ValueError(f"Sum of two dice must be between 2 and 12, got {total}")
+        self.sum_counts[total] += 1
+    
+    def update(self, sums):
+        """
+        Count a chunk of rolls.
+        
+        Args:
+            sums (iterable): Sum of the two dice for each roll
+        
+        Raises:
+            ValueError: If a sum is not between 2 and 12; rolls before it
+                are still counted
+        """
+        for total in sums:
+            self.add(total)
+    
+    def add_counts(self, counts):
+        """
+        Add the histogram of a finished simulation.
+        
+        Args:
+            counts (dict): Result of simulate_dice_rolls (only 'sum_counts'
+                is used)
+        
+        Raises:
+            ValueError: If a sum is outside 2-12 or a count is negative
+        """
+        sum_counts = counts['sum_counts']
+        for total, count in sum_counts.items():
+            if int(total) not in self.sum_counts:
+                raise ValueError(f"Sum of two dice must be between 2 and 12, got {total}")
+            if count < 0:
+                raise ValueError("Counts must not be negative")
+        for total, count in sum_counts.items():
+            self.sum_counts[int(total)] += int(count)
+    
+    def merge(self, other):
+        """
+        Add the rolls of another histogram to this one.
+        
+        Args:
+            other (DiceHistogram): Histogram to add
+        
+        Returns:
+            DiceHistogram: self, for chaining
+        """
+        self.add_counts({'sum_counts': other.sum_counts})
+        return self
+    
+    def __add__(self, other):
+        if not isinstance(other, DiceHistogram):
+            return NotImplemented
+        return DiceHistogram(self.sum_counts).merge(other)
+    
+    def __eq__(self, other):
+        if not isinstance(other, DiceHistogram):
+            return NotImplemented
+        return self.sum_counts == other.sum_counts
+    
+    def __repr__(self):
+        return f"DiceHistogram(total_simulations={self.total_simulations})"
+    
+    def counts(self):
+        """
+        Counts in the format of simulate_dice_rolls.
+        
+        Returns:
+            dict: sum_7, sum_2, sum_greater_10, total_simulations and
+                sum_counts, ready for calculate_probabilities
+        """
+        return summarize_sum_counts(dict(self.sum_counts), self.total_simulations)
+    
+    def save(self, path):
+        """
+        Write the histogram to a JSON file, replacing it atomically.
+        
+        Args:
+            path (str): Output file
+        """
+        data = {
+            'format': FORMAT,
+            'version': VERSION,
+            'sum_counts': {str(total): count for total, count in self.sum_counts.items()},
+            'job': self.job
+        }
+        temporary = f"{path}.tmp{os.getpid()}"
+        with open(temporary, 'w', encoding='utf-8') as handle:
+            json.dump(data, handle, indent=2)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, path)
+    
+    @classmethod
+    def load(cls, path):
+        """
+        Read a histogram written by save().
+        
+        Args:
+            path (str): File to read
+        
+        Returns:
+            DiceHistogram: The saved histogram, including its job settings
+        
+        Raises:
+            ValueError: If the file is not a saved dice histogram
+        """
+        with open(path, encoding='utf-8') as handle:
+            try:
+                data = json.load(handle)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"{path} is not a dice histogram: {error}") from None
+        if not isinstance(data, dict) or data.get('format') != FORMAT:
+            raise ValueError(f"{path} is not a dice histogram")
+        if data.get('version') != VERSION:
+            raise ValueError(f"{path} has unsupported version {data.get('version')}")
+        
+        histogram = cls(data['sum_counts'])
+        histogram.job = data.get('job')
+        return histogram
+
+
+def _chunk_seed(seed, chunk):
+    """Seed for one chunk of a seeded job; distinct for every (seed, chunk)."""
+    return (seed << 64) | chunk
+
+
+def run_checkpointed(num_simulations, checkpoint, chunk_size=DEFAULT_CHUNK_SIZE, seed=None,
+                     engine='numpy', workers=1):
+    """
+    Roll num_simulations times in chunks, saving the histogram after each chunk.
+    
+    If the checkpoint file already exists, the job resumes from it: the
+    chunks already counted are skipped and the rest are rolled with the
+    seeds they would have had. Without a seed, a random one is chosen and
+    saved with the first checkpoint.
+    
+    Args:
+        num_simulations (int): Total number of rolls for the job
+        checkpoint (str): Checkpoint file, created or resumed
+        chunk_size (int): Rolls between checkpoints (default: 10,000,000)
+        seed (int): Non-negative seed for the job (default: None)
+        engine (str): 'python' or 'numpy' (default: 'numpy')
+        workers (int): Processes per chunk, 'numpy' engine only (default: 1)
+    
+    Returns:
+        DiceHistogram: Histogram of all num_simulations rolls
+    
+    Raises:
+        ValueError: If the arguments are invalid, or the checkpoint belongs
+            to a job with a different seed, chunk size, engine or length
+    
+    Examples:
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), 'rolls.json')
+        >>> run_checkpointed(25000, path, chunk_size=10000, seed=1).total_simulations
+        25000
+        >>> DiceHistogram.load(path) == run_checkpointed(25000, path, chunk_size=10000, seed=1)
+        True
+    """
+    if num_simulations < 0:
+        raise ValueError("num_simulations must not be negative")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Choose from {ENGINES}")
+    if seed is not None and (not isinstance(seed, int) or seed < 0):
+        raise ValueError("seed must be a non-negative integer")
+    
+    if os.path.exists(checkpoint):
+        histogram = DiceHistogram.load(checkpoint)
+        job = histogram.job or {}
+        if seed is None:
+            seed = job.get('seed')
+        expected = {'num_simulations': num_simulations, 'chunk_size': chunk_size,
+                    'seed': seed, 'engine': engine}
+        if job != expected:
+            raise ValueError(f"{checkpoint} belongs to a different job: {job}")
+    else:
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        histogram = DiceHistogram()
+        histogram.job = {'num_simulations': num_simulations, 'chunk_size': chunk_size,
+                         'seed': seed, 'engine': engine}
+    
+    done = histogram.total_simulations
+    if done % chunk_size and done != num_simulations:
+        raise ValueError(f"{checkpoint} does not end on a chunk boundary")
+    
+    for chunk in range(-(-done // chunk_size), -(-num_simulations // chunk_size)):
+        size = min(chunk_size, num_simulations - chunk * chunk_size)
+        histogram.add_counts(simulate_dice_rolls(size, engine=engine, seed=_chunk_seed(seed, chunk),
+                                                 workers=workers))
+        histogram.save(checkpoint)
+    
+    if not os.path.exists(checkpoint):
+        histogram.save(checkpoint)
+    return histogram
@@ -0,0 +1,188 @@
+"""
+Exact Dice Distribution Engine
+==============================
+
+Exact distribution of the sum of N dice with S sides, computed instead of
+simulated.
+
+The distribution of one die is S equal probabilities; the distribution of
+the sum of N dice is that distribution convolved with itself N times. Small
+configurations are convolved directly in exact integer arithmetic, counting
+the S**N equally likely outcomes behind every sum (the 6/36 of P(Sum = 7)).
+Large ones use the FFT: the sum's distribution is the inverse transform of
+the die's transform raised to the N-th power, which takes a single pass over
+the N * S possible sums.
+
+Results are cached, so repeated queries for the same (N, S) configuration
+cost a dictionary lookup. NumPy is only needed (and imported) for the FFT.
+
+Functions:
+    - outcome_counts(num_dice, sides): Exact number of outcomes for each sum
+    - sum_distribution(num_dice, sides): Probability of each sum
+    - exact_probabilities(num_dice, sides): p_sum_7, p_sum_2 and
+      p_sum_greater_10, as returned by dice_simulation.calculate_probabilities
+
+Author: GitHub Copilot
+Date: July 26, 2025
+"""
+
+from functools import lru_cache
+
+
+METHODS = ('auto', 'direct', 'fft')
+
+# 'auto' convolves directly while num_dice * (number of sums) stays below this
+DIRECT_LIMIT = 20_000
+
+_CACHE_SIZE = 4096
+
+
+def _check_config(num_dice, sides):
+    """Validate a (num_dice, sides) configuration."""
+    if not isinstance(num_dice, int) or num_dice < 1:
+        raise ValueError("num_dice must be a positive integer")
+    if not isinstance(sides, int) or sides < 1:
+        raise ValueError("sides must be a positive integer")
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _outcome_counts(num_dice, sides):
+    """Exact counts, indexed by sum minus num_dice."""
+    counts = [1]
+    for _ in range(num_dice):
+        # Convolve with one die: each new count is a sliding sum of S old ones
+        new_counts = []
+        window = 0
+        for total in range(len(counts) + sides - 1):
+            if total < len(counts):
+                window += counts[total]
+            if total >= sides:
+                window -= counts[total - sides]
+            new_counts.append(window)
+        counts = new_counts
+    return tuple(counts)
+
+
+def outcome_counts(num_dice=2, sides=6):
+    """
+    Count the outcomes of rolling num_dice dice that give each sum.
+    
+    Args:
+        num_dice (int): Number of dice (default: 2)
+        sides (int): Sides per die, numbered 1 to sides (default: 6)
+    
+    Returns:
+        dict: {sum: number of the sides ** num_dice equally likely outcomes},
+            for every sum from num_dice to num_dice * sides
+    
+    Raises:
+        ValueError: If num_dice or sides is not a positive integer
+    
+    Examples:
+        >>> outcome_counts()[7]
+        6
+        >>> outcome_counts(3, 6)[10], 6 ** 3
+        (27, 216)
+    """
+    _check_config(num_dice, sides)
+    return dict(enumerate(_outcome_counts(num_dice, sides), start=num_dice))
+
+
+def _fft_distribution(num_dice, sides):
+    """Probabilities indexed by sum minus num_dice, via one FFT."""
+    import numpy as np
+    
+    size = num_dice * (sides - 1) + 1
+    die = np.full(sides, 1 / sides)
+    probabilities = np.fft.irfft(np.fft.rfft(die, size) ** num_dice, size)
+    # Rounding leaves noise of about 1e-16 where the true value is (near) zero
+    np.clip(probabilities, 0.0, None, out=probabilities)
+    return tuple(probabilities.tolist())
+
+
+def _is_small(num_dice, sides):
+    """Whether 'auto' convolves (num_dice, sides) directly."""
+    return num_dice * num_dice * (sides - 1) < DIRECT_LIMIT
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _sum_distribution(num_dice, sides, method):
+    """Probabilities indexed by sum minus num_dice."""
+    if method == 'auto':
+        method = 'direct' if _is_small(num_dice, sides) else 'fft'
+    if method == 'fft':
+        return _fft_distribution(num_dice, sides)
+    total = sides ** num_dice
+    return tuple(count / total for count in _outcome_counts(num_dice, sides))
+
+
+def sum_distribution(num_dice=2, sides=6, method='auto'):
+    """
+    Probability of every sum of num_dice dice with the given number of sides.
+    
+    Args:
+        num_dice (int): Number of dice (default: 2)
+        sides (int): Sides per die, numbered 1 to sides (default: 6)
+        method (str): 'direct' for exact integer convolution, 'fft' for the
+            FFT (absolute error around 1e-16), or 'auto' to pick direct for
+            small configurations and the FFT for large ones (default: 'auto')
+    
+    Returns:
+        tuple: Probabilities indexed by sum, from 0 to num_dice * sides
+            (entries below num_dice are 0.0)
+    
+    Raises:
+        ValueError: If num_dice or sides is not a positive integer, or
+            method is unknown
+    
+    Examples:
+        >>> distribution = sum_distribution()
+        >>> len(distribution), distribution[7] == 6 / 36
+        (13, True)
+        >>> round(sum_distribution(100, 6)[350], 6)
+        0.023323
+    """
+    _check_config(num_dice, sides)
+    if method not in METHODS:
+        raise ValueError(f"Unknown method '{method}'. Choose from {METHODS}")
+    return (0.0,) * num_dice + _sum_distribution(num_dice, sides, method)
+
+
+def exact_probabilities(num_dice=2, sides=6):
+    """
+    Exact probabilities of the tracked events for num_dice dice.
+    
+    For small configurations every probability is the correctly rounded
+    ratio of outcome counts, e.g. exactly 3/36 for P(Sum > 10) with two d6.
+    
+    Args:
+        num_dice (int): Number of dice (default: 2)
+        sides (int): Sides per die (default: 6)
+    
+    Returns:
+        dict: p_sum_7, p_sum_2 and p_sum_greater_10, the keys returned by
+            dice_simulation.calculate_probabilities
+    
+    Raises:
+        ValueError: If num_dice or sides is not a positive integer
+    
+    Examples:
+        >>> exact_probabilities() == {'p_sum_7': 6/36, 'p_sum_2': 1/36, 'p_sum_greater_10': 3/36}
+        True
+    """
+    _check_config(num_dice, sides)
+    if _is_small(num_dice, sides):
+        counts = outcome_counts(num_dice, sides)
+        total = sides ** num_dice
+        return {
+            'p_sum_7': counts.get(7, 0) / total,
+            'p_sum_2': counts.get(2, 0) / total,
+            'p_sum_greater_10': sum(count for value, count in counts.items() if value > 10) / total
+        }
+    
+    distribution = sum_distribution(num_dice, sides)
+    return {
+        'p_sum_7': distribution[7] if len(distribution) > 7 else 0.0,
+        'p_sum_2': distribution[2] if len(distribution) > 2 else 0.0,
+        'p_sum_greater_10': min(1.0, sum(distribution[11:]))
+    }
@@ -10,52 +10,98 @@ Objectives:
 - Estimate P(Sum = 2): Probability that the sum equals 2  
 - Estimate P(Sum > 10): Probability that the sum is greater than 10 (i.e., 11 or 12)
 
+Every statistic is read from the full 2-12 sum histogram of a single pass.
+Pass engine='numpy' to simulate_dice_rolls to use the vectorised engine in
+dice_engine.py for very large runs. Theoretical values come from the exact
+engine in dice_exact.py. simulate_until_precise keeps rolling in batches
+until confidence intervals for every tracked probability are narrow enough.
+
 Author: GitHub Copilot
 Date: July 26, 2025
 """
 
+import argparse
+import math
 import random
+from statistics import NormalDist
+
+from dice_exact import exact_probabilities, outcome_counts
+
+
+ENGINES = ('python', 'numpy')
+INTERVAL_METHODS = ('wilson', 'normal')
+
+# Probability key (as in calculate_probabilities) -> count key
+TRACKED_EVENTS = {
+    'p_sum_7': 'sum_7',
+    'p_sum_2': 'sum_2',
+    'p_sum_greater_10': 'sum_greater_10'
+}
 
 
-def simulate_dice_rolls(num_simulations=10000):
+def summarize_sum_counts(sum_counts, num_simulations):
+    """
+    Build the tracked outcome counts from a histogram of sums.
+    
+    Args:
+        sum_counts (dict): Number of rolls for each sum, {2: count, ..., 12: count}
+        num_simulations (int): Total number of rolls
+    
+    Returns:
+        dict: sum_7, sum_2, sum_greater_10, total_simulations and sum_counts
+    """
+    return {
+        'sum_7': sum_counts[7],
+        'sum_2': sum_counts[2],
+        'sum_greater_10': sum_counts[11] + sum_counts[12],  # Sum is 11 or 12
+        'total_simulations': num_simulations,
+        'sum_counts': sum_counts
+    }
+
+
+def simulate_dice_rolls(num_simulations=10000, engine='python', seed=None, workers=1):
     """
     Simulate rolling two dice multiple times and count specific outcomes.
     
     Args:
         num_simulations (int): Number of times to roll the dice (default: 10000)
+        engine (str): 'python' for the random module loop, or 'numpy' for the
+            vectorised engine in dice_engine.py (default: 'python')
+        seed: Seed for reproducible results; None uses the global random
+            state ('python') or fresh entropy ('numpy') (default: None)
+        workers (int): Processes to split the rolls across; with the 'numpy'
+            engine a given seed gives identical results for any number of
+            workers (default: 1)
     
     Returns:
-        dict: Dictionary containing counts for each tracked outcome
+        dict: Dictionary containing counts for each tracked outcome, plus the
+            full histogram of sums under 'sum_counts'
+    
+    Raises:
+        ValueError: If engine is not 'python' or 'numpy', or workers > 1 is
+            requested for the 'python' engine
     """
-    # Initialize counters
-    count_sum_7 = 0
-    count_sum_2 = 0
-    count_sum_greater_10 = 0
+    if engine == 'numpy':
+        from dice_engine import simulate
+        return simulate(num_simulations, seed=seed, workers=workers)
+    
+    if engine != 'python':
+        raise ValueError(f"Unknown engine '{engine}'. Choose from {ENGINES}")
+    
+    if workers != 1:
+        raise ValueError("workers requires engine='numpy'")
+    
+    randint = random.randint if seed is None else random.Random(seed).randint
+    
+    # Counters for every possible sum; index = sum
+    counts = [0] * 13
     
     # Simulate rolling dice num_simulations times
     for _ in range(num_simulations):
         # Roll two dice (generate random integers between 1 and 6)
-        dice1 = random.randint(1, 6)
-        dice2 = random.randint(1, 6)
-        
-        # Calculate the sum
-        dice_sum = dice1 + dice2
-        
-        # Count specific outcomes
-        if dice_sum == 7:
-            count_sum_7 += 1
-        elif dice_sum == 2:
-            count_sum_2 += 1
-        
-        if dice_sum > 10:  # Sum is 11 or 12
-            count_sum_greater_10 += 1
+        counts[randint(1, 6) + randint(1, 6)] += 1
     
-    return {
-        'sum_7': count_sum_7,
-        'sum_2': count_sum_2,
-        'sum_greater_10': count_sum_greater_10,
-        'total_simulations': num_simulations
-    }
+    return summarize_sum_counts(dict(zip(range(2, 13), counts[2:])), num_simulations)
 
 
 def calculate_probabilities(counts):
@@ -77,6 +123,123 @@ def calculate_probabilities(counts):
     }
 
 
+def confidence_interval(successes, trials, confidence=0.95, method='wilson'):
+    """
+    Confidence interval for a probability estimated as successes / trials.
+    
+    Args:
+        successes (int): Number of rolls on which the event happened
+        trials (int): Number of rolls
+        confidence (float): Confidence level between 0 and 1 (default: 0.95)
+        method (str): 'wilson' for the Wilson score interval, which stays
+            reliable for rare events, or 'normal' for the textbook
+            p ± z * sqrt(p(1 - p) / n) (default: 'wilson')
+    
+    Returns:
+        tuple: (lower, upper), clipped to [0, 1]; (0.0, 1.0) if trials is 0
+    
+    Raises:
+        ValueError: If confidence is not between 0 and 1 or method is unknown
+    
+    Examples:
+        >>> low, high = confidence_interval(1667, 10000)
+        >>> round(low, 4), round(high, 4)
+        (0.1595, 0.1741)
+    """
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    if method not in INTERVAL_METHODS:
+        raise ValueError(f"Unknown method '{method}'. Choose from {INTERVAL_METHODS}")
+    if trials == 0:
+        return (0.0, 1.0)
+    
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    p = successes / trials
+    if method == 'normal':
+        center = p
+        half_width = z * math.sqrt(p * (1 - p) / trials)
+    else:
+        scale = 1 + z * z / trials
+        center = (p + z * z / (2 * trials)) / scale
+        half_width = z / scale * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials))
+    return (max(0.0, center - half_width), min(1.0, center + half_width))
+
+
+def simulate_until_precise(tolerance=0.001, confidence=0.95, method='wilson', batch_size=10000,
+                           max_simulations=100_000_000, engine='python', seed=None, workers=1):
+    """
+    Roll in batches until every tracked probability is known precisely enough.
+    
+    After each batch a confidence interval is computed for P(Sum = 7),
+    P(Sum = 2) and P(Sum > 10). Rolling stops as soon as every interval is
+    at most tolerance wide, or when max_simulations is reached. The next
+    batch is sized from the current estimates to reach the tolerance, but at
+    most doubles the rolls made so far, so little is rolled beyond what is
+    needed.
+    
+    Args:
+        tolerance (float): Largest acceptable interval width (default: 0.001)
+        confidence (float): Confidence level of the intervals (default: 0.95)
+        method (str): 'wilson' or 'normal' intervals (default: 'wilson')
+        batch_size (int): Rolls in the first and smallest batch (default: 10000)
+        max_simulations (int): Upper limit on the number of rolls
+            (default: 100,000,000)
+        engine (str): 'python' or 'numpy' (default: 'python')
+        seed: Integer seed for a reproducible run (default: None)
+        workers (int): Processes per batch, 'numpy' engine only (default: 1)
+    
+    Returns:
+        dict: The simulate_dice_rolls counts for all the rolls made, plus
+            'confidence_intervals' ({probability key: (lower, upper)}) and
+            'converged' (False if max_simulations stopped the run first)
+    
+    Raises:
+        ValueError: If tolerance, batch_size or max_simulations is not
+            positive, or engine, method or confidence is invalid
+    
+    Examples:
+        >>> counts = simulate_until_precise(tolerance=0.01, seed=1)
+        >>> counts['converged'], counts['total_simulations']
+        (True, 30000)
+    """
+    if tolerance <= 0:
+        raise ValueError("tolerance must be positive")
+    if batch_size < 1 or max_simulations < 1:
+        raise ValueError("batch_size and max_simulations must be positive")
+    confidence_interval(0, 1, confidence, method)
+    
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    # Each batch gets its own seed, drawn from one stream for the whole run
+    seeds = None if seed is None else random.Random(seed)
+    sum_counts = dict.fromkeys(range(2, 13), 0)
+    total = 0
+    next_batch = min(batch_size, max_simulations)
+    
+    while True:
+        batch_seed = None if seeds is None else seeds.getrandbits(64)
+        batch = simulate_dice_rolls(next_batch, engine=engine, seed=batch_seed, workers=workers)
+        for sum_val, count in batch['sum_counts'].items():
+            sum_counts[sum_val] += count
+        total += next_batch
+        
+        counts = summarize_sum_counts(sum_counts, total)
+        intervals = {key: confidence_interval(counts[count_key], total, confidence, method)
+                     for key, count_key in TRACKED_EVENTS.items()}
+        converged = all(high - low <= tolerance for low, high in intervals.values())
+        if converged or total >= max_simulations:
+            break
+        
+        # Rolls needed for the widest interval, from p(1 - p) z^2 / (tolerance / 2)^2
+        variance = max(counts[count_key] / total * (1 - counts[count_key] / total)
+                       for count_key in TRACKED_EVENTS.values())
+        needed = math.ceil(variance * (2 * z / tolerance) ** 2) - total
+        next_batch = min(max(needed, batch_size), total, max_simulations - total)
+    
+    counts['confidence_intervals'] = intervals
+    counts['converged'] = converged
+    return counts
+
+
 def print_results(probabilities):
     """
     Print the estimated probabilities in the required format.
@@ -91,77 +254,124 @@ def print_results(probabilities):
     print(f"P(Sum > 10): {probabilities['p_sum_greater_10']:.4f}")
 
 
+def print_confidence_intervals(counts):
+    """
+    Print the confidence intervals of an adaptive run.
+    
+    Args:
+        counts (dict): Result of simulate_until_precise
+    """
+    labels = {'p_sum_7': "P(Sum = 7)", 'p_sum_2': "P(Sum = 2)", 'p_sum_greater_10': "P(Sum > 10)"}
+    status = "converged" if counts['converged'] else "stopped at the roll limit"
+    
+    print(f"\nConfidence Intervals ({counts['total_simulations']:,} rolls, {status}):")
+    print("=" * 40)
+    for key, (low, high) in counts['confidence_intervals'].items():
+        print(f"{labels[key]}: [{low:.4f}, {high:.4f}]")
+
+
 def print_theoretical_probabilities():
     """
     Print the theoretical probabilities for comparison.
     """
+    ways = outcome_counts(2, 6)
+    probabilities = exact_probabilities(2, 6)
+    
     print("\nTheoretical Probabilities (for comparison):")
     print("=" * 40)
-    print("P(Sum = 7): 0.1667 (6/36)")
-    print("P(Sum = 2): 0.0278 (1/36)")
-    print("P(Sum > 10): 0.0833 (3/36)")
+    print(f"P(Sum = 7): {probabilities['p_sum_7']:.4f} ({ways[7]}/36)")
+    print(f"P(Sum = 2): {probabilities['p_sum_2']:.4f} ({ways[2]}/36)")
+    print(f"P(Sum > 10): {probabilities['p_sum_greater_10']:.4f} ({ways[11] + ways[12]}/36)")
 
 
-def detailed_analysis(num_simulations=10000):
+def detailed_analysis(num_simulations=10000, counts=None):
     """
     Perform a detailed analysis showing all possible sums and their frequencies.
     
     Args:
         num_simulations (int): Number of simulations to run
+        counts (dict): Result of simulate_dice_rolls to analyse instead of
+            running a new simulation (default: None)
     """
-    # Initialize counters for all possible sums (2 through 12)
-    sum_counts = {i: 0 for i in range(2, 13)}
-    
-    # Simulate rolling dice
-    for _ in range(num_simulations):
-        dice1 = random.randint(1, 6)
-        dice2 = random.randint(1, 6)
-        dice_sum = dice1 + dice2
-        sum_counts[dice_sum] += 1
+    if counts is None:
+        counts = simulate_dice_rolls(num_simulations)
+    num_simulations = counts['total_simulations']
+    sum_counts = counts['sum_counts']
     
     print(f"\nDetailed Analysis ({num_simulations:,} simulations):")
     print("=" * 50)
     print("Sum | Count    | Probability | Theoretical")
     print("-" * 50)
     
-    theoretical_probs = {
-        2: 1/36, 3: 2/36, 4: 3/36, 5: 4/36, 6: 5/36, 7: 6/36,
-        8: 5/36, 9: 4/36, 10: 3/36, 11: 2/36, 12: 1/36
-    }
+    ways = outcome_counts(2, 6)
     
     for sum_val in range(2, 13):
         count = sum_counts[sum_val]
         estimated_prob = count / num_simulations
-        theoretical_prob = theoretical_probs[sum_val]
+        theoretical_prob = ways[sum_val] / 36
         print(f"{sum_val:2d}  | {count:8d} | {estimated_prob:11.4f} | {theoretical_prob:11.4f}")
 
 
-def main():
+def main(argv=None):
     """
     Main function to run the dice rolling simulation.
     """
-    print("Simulating Rolling Two Dice 10,000 Times")
-    print("=" * 50)
-    
-    # Set random seed for reproducible results (optional)
-    # random.seed(42)  # Uncomment for reproducible results
+    parser = argparse.ArgumentParser(description="Simulate rolling two dice.")
+    parser.add_argument('--rolls', type=int, default=10000, help="number of rolls (default: 10,000)")
+    parser.add_argument('--engine', choices=ENGINES,
+                        help="simulation engine (default: python, or numpy when --workers > 1)")
+    parser.add_argument('--seed', type=int, help="seed for reproducible results, e.g. 42")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="processes for the numpy engine; results do not depend on it (default: 1)")
+    parser.add_argument('--tolerance', type=float,
+                        help="roll until every confidence interval is at most this wide, e.g. 0.001")
+    parser.add_argument('--confidence', type=float, default=0.95,
+                        help="confidence level for --tolerance (default: 0.95)")
+    parser.add_argument('--checkpoint', metavar='PATH',
+                        help="save progress to PATH after every chunk of rolls, resuming from it if it exists")
+    args = parser.parse_args(argv)
     
-    # Run the simulation
-    num_simulations = 10000
-    print(f"Running {num_simulations:,} simulations...")
-    print()
+    engine = args.engine or ('numpy' if args.workers > 1 else 'python')
+    if engine == 'python' and args.workers > 1:
+        parser.error("--workers requires --engine numpy")
+    if args.checkpoint and args.tolerance is not None:
+        parser.error("--checkpoint cannot be combined with --tolerance")
     
-    counts = simulate_dice_rolls(num_simulations)
+    if args.tolerance is not None:
+        print(f"Simulating Rolling Two Dice to ±{args.tolerance / 2:g}")
+        print("=" * 50)
+        print(f"Rolling until every {args.confidence:.0%} interval is at most {args.tolerance:g} wide...")
+        print()
+        counts = simulate_until_precise(args.tolerance, args.confidence, engine=engine,
+                                        seed=args.seed, workers=args.workers)
+    else:
+        num_simulations = args.rolls
+        print(f"Simulating Rolling Two Dice {num_simulations:,} Times")
+        print("=" * 50)
+        
+        # Run the simulation
+        print(f"Running {num_simulations:,} simulations...")
+        print()
+        
+        if args.checkpoint:
+            from dice_accumulator import run_checkpointed
+            histogram = run_checkpointed(num_simulations, args.checkpoint, seed=args.seed,
+                                         engine=engine, workers=args.workers)
+            counts = histogram.counts()
+        else:
+            counts = simulate_dice_rolls(num_simulations, engine=engine, seed=args.seed, workers=args.workers)
     probabilities = calculate_probabilities(counts)
     
     # Print main results
     print_results(probabilities)
+    if args.tolerance is not None:
+        print_confidence_intervals(counts)
     
     # Print theoretical probabilities for comparison
     print_theoretical_probabilities()
     
-    # Show detailed analysis
-    detailed_analysis(num_simulations)
+    # Show detailed analysis of the same rolls
+    detailed_analysis(counts=counts)
     
     # Additional information
     print(f"\nSimulation Details:")
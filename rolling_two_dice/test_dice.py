@@ -4,7 +4,15 @@ Tests the simulation functions and validates results.
 """
 
 from dice_simulation import simulate_dice_rolls, calculate_probabilities
+from dice_simulation import confidence_interval, simulate_until_precise
+from dice_engine import sum_histogram
+from dice_exact import exact_probabilities, outcome_counts, sum_distribution
+from dice_accumulator import DiceHistogram, run_checkpointed
+import dice_accumulator
+import itertools
+import os
 import random
+import tempfile
 
 
 def test_simulation_basic():
@@ -86,6 +94,230 @@ def test_reproducibility():
     print()
 
 
+def test_numpy_engine():
+    """Test the vectorised engine and the single-pass histogram."""
+    print("Testing NumPy Engine:")
+    print("-" * 30)
+    
+    # Every statistic comes from the same histogram
+    for engine in ('python', 'numpy'):
+        counts = simulate_dice_rolls(20000, engine=engine, seed=7)
+        sum_counts = counts['sum_counts']
+        assert sorted(sum_counts) == list(range(2, 13)), f"{engine}: histogram keys should be 2-12"
+        assert sum(sum_counts.values()) == 20000, f"{engine}: histogram should cover every roll"
+        assert counts['sum_7'] == sum_counts[7], f"{engine}: sum_7 mismatch"
+        assert counts['sum_2'] == sum_counts[2], f"{engine}: sum_2 mismatch"
+        assert counts['sum_greater_10'] == sum_counts[11] + sum_counts[12], f"{engine}: sum_greater_10 mismatch"
+        
+        # The same seed gives the same rolls
+        assert simulate_dice_rolls(20000, engine=engine, seed=7) == counts, f"{engine}: seed not reproducible"
+        print(f"{engine}: single-pass histogram, reproducible with a seed ✓")
+    
+    # The Python engine still honours random.seed when no seed is passed
+    random.seed(3)
+    first = simulate_dice_rolls(500)
+    random.seed(3)
+    assert simulate_dice_rolls(500) == first, "random.seed should still control the Python engine"
+    
+    # A large run lands close to the theoretical distribution
+    num_rolls = 2_000_000
+    histogram = sum_histogram(num_rolls, seed=11, block_size=300_000)
+    assert histogram[:2].tolist() == [0, 0] and int(histogram.sum()) == num_rolls, "histogram shape mismatch"
+    for total in range(2, 13):
+        expected = (6 - abs(total - 7)) / 36
+        # Within 5 standard errors
+        tolerance = 5 * (expected * (1 - expected) / num_rolls) ** 0.5
+        assert abs(histogram[total] / num_rolls - expected) < tolerance, f"P(Sum = {total}) off"
+    print(f"{num_rolls:,} rolls within 5 standard errors of theory ✓")
+    
+    try:
+        simulate_dice_rolls(10, engine='fortran')
+        assert False, "unknown engine accepted"
+    except ValueError:
+        print("Unknown engine rejected ✓")
+    
+    print("✓ NumPy engine test passed!")
+    print()
+
+
+def test_parallel_engine():
+    """Test that results for a seed do not depend on the number of workers."""
+    print("Testing Parallel Engine:")
+    print("-" * 30)
+    
+    # Small blocks so the rolls spread over many independent streams
+    reference = sum_histogram(1_000_003, seed=42, block_size=50_000)
+    for workers in (2, 3):
+        histogram = sum_histogram(1_000_003, seed=42, workers=workers, block_size=50_000)
+        assert histogram.tolist() == reference.tolist(), f"{workers} workers changed the result"
+        print(f"{workers} workers: bit-identical to 1 worker ✓")
+    
+    counts = simulate_dice_rolls(200_000, engine='numpy', seed=5, workers=2)
+    assert counts == simulate_dice_rolls(200_000, engine='numpy', seed=5), "workers changed simulate_dice_rolls"
+    assert sum_histogram(1_000_003, seed=43, block_size=50_000).tolist() != reference.tolist(), \
+        "different seeds should give different rolls"
+    
+    try:
+        simulate_dice_rolls(1000, workers=2)
+        assert False, "workers accepted for the python engine"
+    except ValueError:
+        print("workers > 1 requires the numpy engine ✓")
+    
+    print("✓ Parallel engine test passed!")
+    print()
+
+
+def test_exact_engine():
+    """Test the exact N-dice distribution against brute-force enumeration."""
+    print("Testing Exact Engine:")
+    print("-" * 30)
+    
+    # Counts match enumerating every outcome
+    for num_dice, sides in [(1, 6), (2, 6), (3, 4), (4, 3), (2, 1)]:
+        brute_force = {}
+        for roll in itertools.product(range(1, sides + 1), repeat=num_dice):
+            brute_force[sum(roll)] = brute_force.get(sum(roll), 0) + 1
+        assert outcome_counts(num_dice, sides) == brute_force, f"{num_dice}d{sides} counts wrong"
+    print("Outcome counts match enumeration ✓")
+    
+    # Two d6 give the textbook values, under the simulation's keys
+    probabilities = exact_probabilities()
+    assert probabilities == {'p_sum_7': 6/36, 'p_sum_2': 1/36, 'p_sum_greater_10': 3/36}, "2d6 values wrong"
+    simulated = calculate_probabilities(simulate_dice_rolls(1000, seed=1))
+    assert probabilities.keys() == simulated.keys(), "keys should match calculate_probabilities"
+    print("2d6: 6/36, 1/36 and 3/36 ✓")
+    
+    # The FFT agrees with exact convolution and covers every sum
+    for num_dice, sides in [(1, 6), (10, 20), (60, 6), (7, 2)]:
+        direct = sum_distribution(num_dice, sides, method='direct')
+        fft = sum_distribution(num_dice, sides, method='fft')
+        assert len(direct) == len(fft) == num_dice * sides + 1, "distribution length wrong"
+        assert max(abs(a - b) for a, b in zip(direct, fft)) < 1e-12, f"{num_dice}d{sides}: FFT disagrees"
+        assert min(fft) >= 0 and abs(sum(fft) - 1) < 1e-9, f"{num_dice}d{sides}: not a distribution"
+    print("FFT matches exact convolution ✓")
+    
+    # Large configurations: symmetric around the mean
+    distribution = sum_distribution(2000, 6)
+    assert max(range(len(distribution)), key=distribution.__getitem__) == 7000, "2000d6 mode should be 7000"
+    assert abs(distribution[7001] - distribution[6999]) < 1e-12, "2000d6 should be symmetric"
+    print("2000d6 via FFT ✓")
+    
+    for bad in [(0, 6), (2, 0), (2.0, 6)]:
+        try:
+            sum_distribution(*bad)
+            assert False, f"{bad} accepted"
+        except ValueError:
+            pass
+    print("Invalid configurations rejected ✓")
+    
+    print("✓ Exact engine test passed!")
+    print()
+
+
+def test_adaptive_simulation():
+    """Test early stopping on confidence interval width."""
+    print("Testing Adaptive Simulation:")
+    print("-" * 30)
+    
+    # Wilson intervals stay inside [0, 1] and are not degenerate at 0 successes
+    low, high = confidence_interval(0, 100)
+    assert low == 0.0 and 0 < high < 0.05, "Wilson interval wrong at 0 successes"
+    assert confidence_interval(0, 100, method='normal') == (0.0, 0.0), "normal interval should collapse at 0"
+    low, high = confidence_interval(50, 100, confidence=0.99)
+    assert low < 0.5 < high and high - low > confidence_interval(50, 100)[1] - confidence_interval(50, 100)[0]
+    print("Wilson and normal intervals ✓")
+    
+    exact = {'p_sum_7': 6/36, 'p_sum_2': 1/36, 'p_sum_greater_10': 3/36}
+    for engine in ('python', 'numpy'):
+        counts = simulate_until_precise(tolerance=0.005, seed=8, engine=engine)
+        assert counts['converged'], f"{engine}: did not converge"
+        # About z^2 p(1 - p) (2 / tolerance)^2 = 85,000 rolls are needed for P(Sum = 7)
+        assert 80_000 <= counts['total_simulations'] <= 200_000, f"{engine}: unexpected number of rolls"
+        assert sum(counts['sum_counts'].values()) == counts['total_simulations'], "batches not combined"
+        probabilities = calculate_probabilities(counts)
+        for key, (low, high) in counts['confidence_intervals'].items():
+            assert high - low <= 0.005, f"{engine}: {key} interval too wide"
+            assert low <= probabilities[key] <= high, f"{engine}: {key} estimate outside its interval"
+            assert low - 0.005 < exact[key] < high + 0.005, f"{engine}: {key} far from theory"
+        assert simulate_until_precise(tolerance=0.005, seed=8, engine=engine) == counts, "seed not reproducible"
+        print(f"{engine}: stopped after {counts['total_simulations']:,} rolls ✓")
+    
+    counts = simulate_until_precise(tolerance=0.0001, max_simulations=30_000, seed=2)
+    assert not counts['converged'] and counts['total_simulations'] == 30_000, "roll limit not respected"
+    print("Roll limit respected ✓")
+    
+    print("✓ Adaptive simulation test passed!")
+    print()
+
+
+def test_histogram_accumulator():
+    """Test merging, saving and resuming dice histograms."""
+    print("Testing Histogram Accumulator:")
+    print("-" * 30)
+    
+    # Chunks fed one at a time equal the whole run
+    first = DiceHistogram()
+    first.update([2, 7, 7, 12])
+    first.add_counts(simulate_dice_rolls(1000, seed=1))
+    second = DiceHistogram(simulate_dice_rolls(500, seed=2)['sum_counts'])
+    combined = first + second
+    assert combined.total_simulations == 1504, "merged total wrong"
+    assert combined.counts()['sum_7'] == first.sum_counts[7] + second.sum_counts[7], "merged counts wrong"
+    assert first.total_simulations == 1004, "__add__ should not modify its operands"
+    assert calculate_probabilities(combined.counts())['p_sum_7'] == combined.sum_counts[7] / 1504
+    print("Chunks and histograms merge ✓")
+    
+    for bad in (1, 13):
+        try:
+            first.add(bad)
+            assert False, f"sum {bad} accepted"
+        except ValueError:
+            pass
+    print("Impossible sums rejected ✓")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'histogram.json')
+        combined.save(path)
+        assert DiceHistogram.load(path) == combined, "save/load round trip failed"
+        print("Save and load round trip ✓")
+        
+        # An interrupted job resumes to exactly the counts of an uninterrupted one
+        uninterrupted = run_checkpointed(55_000, os.path.join(directory, 'full.json'), chunk_size=10_000, seed=9)
+        checkpoint = os.path.join(directory, 'job.json')
+        real_simulate = dice_accumulator.simulate_dice_rolls
+        calls = []
+        
+        def interrupted_simulate(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 3:
+                raise KeyboardInterrupt
+            return real_simulate(*args, **kwargs)
+        
+        dice_accumulator.simulate_dice_rolls = interrupted_simulate
+        try:
+            run_checkpointed(55_000, checkpoint, chunk_size=10_000, seed=9)
+            assert False, "job was not interrupted"
+        except KeyboardInterrupt:
+            pass
+        finally:
+            dice_accumulator.simulate_dice_rolls = real_simulate
+        assert DiceHistogram.load(checkpoint).total_simulations == 20_000, "checkpoint should hold 2 chunks"
+        
+        resumed = run_checkpointed(55_000, checkpoint, chunk_size=10_000, seed=9)
+        assert resumed == uninterrupted and resumed.total_simulations == 55_000, "resume changed the result"
+        assert run_checkpointed(55_000, checkpoint, chunk_size=10_000, seed=9) == resumed, "finished job re-rolled"
+        print("Interrupted job resumes to identical counts ✓")
+        
+        try:
+            run_checkpointed(55_000, checkpoint, chunk_size=10_000, seed=10)
+            assert False, "checkpoint of another job accepted"
+        except ValueError:
+            print("Checkpoint of a different job rejected ✓")
+    
+    print("✓ Histogram accumulator test passed!")
+    print()
+
+
 def run_multiple_trials():
     """Run multiple trials to show variability in results."""
     print("Multiple Trial Analysis:")
@@ -126,6 +358,11 @@ def main():
         test_simulation_basic()
         test_edge_cases()
         test_reproducibility()
+        test_numpy_engine()
+        test_parallel_engine()
+        test_exact_engine()
+        test_adaptive_simulation()
+        test_histogram_accumulator()
         run_multiple_trials()
         
         print("🎉 ALL TESTS PASSED! 🎉")